@@ -32,6 +32,13 @@ class Effect:
         if self.unlockable:
             self.locked = False
 
+    ############################################
+    # Attributes Changed Within Forked Engines #
+    ############################################
+    selectable_objects_cache = EngineField('_selectable_objects_cache')
+    locked = EngineField('_locked')
+    expired = EngineField('_expired')
+
 
 class ContinuousEffect(Effect):
     def __init__(self, selection, timestamp, duration, **kwargs):
@@ -158,8 +165,8 @@ class ContinuousEffectGenerator:
         self.dependent_predicates = [phi_factory(self) for phi_factory in phi_factories]
         self.player_predicates = [player_phi_factory(self) for player_phi_factory in player_phi_factories]
         self.components = list(components)
-        self.object_id = id(self)
-        self.true_id = uuid.uuid4().hex
+        self.object_id = EFFECT_IDS.allocate()
+        self.true_id = self.object_id
 
     def generate_effect_predicate(self):
         '''\
@@ -349,6 +356,8 @@ class StaticAbility(ContinuousEffectGenerator):
 
 
 class MarkerEffectComponent:
+    __slots__ = ('layer', '_deltas', 'reference_marker', 'is_cda', 'relative_component_ordinal', 'valid', 'object_id', 'is_marker_effect_component', '_read_set')
+
     def __init__(self, layer, external_deltas, reference_marker=None):
         self.layer = layer
         self.deltas = list(external_deltas)
@@ -358,8 +367,9 @@ class MarkerEffectComponent:
         self.is_cda = False
         self.relative_component_ordinal = 0
         self.valid = True
-        self.object_id = id(self)
+        self.object_id = EFFECT_IDS.allocate()
         self.is_marker_effect_component = True
+        self.read_set = None
 
     @property
     def timestamp(self):
@@ -369,12 +379,23 @@ class MarkerEffectComponent:
         '''\
             Match signature of EffectComponent.enact method, although the lock argument isn't used here.
         '''
+        if READ_TRACER.recording_components:
+            with READ_TRACER.trace() as reads:
+                self.apply_deltas()
+            self.read_set = frozenset(reads)
+        else:
+            self.apply_deltas()
+
+    def apply_deltas(self):
         object_to_affect = self.reference_marker.host_object
         for delta in self.deltas:
             new_value = delta.compute(ref_obj=object_to_affect)
             for reference_attribute in delta.reference_attributes:
                 setattr(object_to_affect, reference_attribute, new_value)
 
+    deltas = EngineField('_deltas')
+    read_set = EngineField('_read_set')
+
 # Alias #
 MFXC = MarkerEffectComponent
 
@@ -404,6 +425,8 @@ class EffectComponent:
         the intended modification.
 
     '''
+    __slots__ = ('layer', 'external_deltas', 'delta_factories', '_deltas', 'is_cda', '_reference_effect', 'object_id', 'is_marker_effect_component', '_read_set')
+
     def __init__(self, layer, external_deltas, delta_factories=[], is_cda=False, reference_effect=None):
         self.layer = layer
         self.external_deltas = external_deltas
@@ -411,8 +434,10 @@ class EffectComponent:
         self.deltas = []
         self.is_cda = is_cda
         self.reference_effect = reference_effect
-        self.object_id = id(self)
+        self.object_id = EFFECT_IDS.allocate()
         self.is_marker_effect_component = False
+        # NOTE # The (object_id, attribute) pairs read by the last traced enactment; see ReadTracer.
+        self.read_set = None
 
     def clone(self):
         result = EffectComponent(layer=self.layer,
@@ -464,6 +489,22 @@ class EffectComponent:
     def generator_static(self):
         return isinstance(self.reference_effect, ContinuousEffectViaStaticAbility)
 
+    def interchangeability_key(self):
+        '''\
+            Return a key which is equal for components of copies of the same static ability
+            which apply in the same (sub)layer, in the same position relative to the other components
+            of their effects, to the same set of objects; or, None for components which
+            aren't interchangeable with any other---CDAs, and components of effects which
+            weren't generated by a static ability, or whose ability no longer exists.
+            See: ApparentStateHandler.component_classes
+        '''
+        if (self.is_cda or not(self.generator_static) or not(self.valid)):
+            return None
+        return (type(self.reference_effect.reference_ability),
+                self.layer,
+                self.relative_component_ordinal,
+                frozenset(affected_object.object_id for affected_object in self.set_of_affected_objects))
+
     @property
     def valid(self):
         '''\
@@ -490,10 +531,21 @@ class EffectComponent:
             effect. The type-changing effect is applied to all noncreature artifacts in layer 4
             and the power-and-toughness-setting effect is applied to those same permanents in
             layer 7b, even though those permanents aren't noncreature artifacts by then.
+
+            Within READ_TRACER.record_components(), the reads made while enacting are recorded
+            in self.read_set.
         '''
         if lock:
             self.reference_effect.locked = True
 
+        if READ_TRACER.recording_components:
+            with READ_TRACER.trace() as reads:
+                self.apply_deltas()
+            self.read_set = frozenset(reads)
+        else:
+            self.apply_deltas()
+
+    def apply_deltas(self):
         if self.reference_effect.reference_ability.antecedents_verified:
             for affected_object in self.set_of_affected_objects:
                 for delta in self.deltas:
@@ -501,6 +553,13 @@ class EffectComponent:
                     for reference_attribute in delta.reference_attributes:
                         setattr(affected_object, reference_attribute, new_value)
 
+    ############################################
+    # Attributes Changed Within Forked Engines #
+    ############################################
+    deltas = EngineField('_deltas')
+    reference_effect = EngineField('_reference_effect')
+    read_set = EngineField('_read_set')
+
 
 # Alias #
 FXC = EffectComponent
@@ -511,6 +570,8 @@ class CopyEffectComponent(EffectComponent):
     '''\
         Subclass of EffectComponent which supports copy effects.
     '''
+    __slots__ = ('modifications', 'ignore', '_deltas_fixed')
+
     def __init__(self, modifications=[], ignore=[], reference_effect=None):
         self.modifications = list(modifications)
         self.ignore = list(ignore)
@@ -572,14 +633,14 @@ class CopyEffectComponent(EffectComponent):
             copiable values that effect grants are determined only at the time that effect first
             starts to apply.
 
-            These rules both imply that the extracted values should be deep copied so that changes
-            in the source cannot affect the copier object's appearance; and, that deltas only need
-            to be generated once before fixing them.
+            These rules both imply that changes in the source must not affect the copier object's
+            appearance; and, that deltas only need to be generated once before fixing them.
+            Characteristic values are immutable, so a shallow copy of the copiable values suffices.
         '''
         if not(self.deltas_fixed):
             if (self.copy_source_object is not None):
                 copy_deltas = []
-                source_object_copiable_values = deepcopy(self.copy_source_object.copiable_values)
+                source_object_copiable_values = dict(self.copy_source_object.copiable_values)
                 for attribute in source_object_copiable_values:
                     if not(attribute in self.ignore):
                         if not(attribute == 'abilities'):
@@ -607,6 +668,8 @@ class CopyEffectComponent(EffectComponent):
                 self.deltas = []
             self.deltas_fixed = True
 
+    deltas_fixed = EngineField('_deltas_fixed')
+
 
 
 class FaceDownEffectComponent(EffectComponent):
@@ -614,6 +677,8 @@ class FaceDownEffectComponent(EffectComponent):
         Special case of EffectComponent for generating the characteristic modifications
         implied by the physical status of being face down.
     '''
+    __slots__ = ('_deltas_fixed',)
+
     default_facedown_attributes = [
         ('impl_name', ''),
         ('mana_cost', ''),
@@ -655,6 +720,8 @@ class FaceDownEffectComponent(EffectComponent):
             self.deltas = facedown_deltas + self.external_deltas
             self.deltas_fixed = True
 
+    deltas_fixed = EngineField('_deltas_fixed')
+
 
 class KeywordAbility:
     '''\
@@ -5,6 +5,8 @@ class SimpleAttributeReport(Computable):
     '''\
         Supply getattr(ref_obj, ref_attr) in response to compute() method call.
     '''
+    __slots__ = ('_ref_obj', 'ref_attr')
+
     def __init__(self, ref_obj, ref_attr):
         self._ref_obj = ref_obj
         self.ref_attr = ref_attr
@@ -18,7 +20,11 @@ class SimpleAttributeReport(Computable):
         self._ref_obj = value
 
     def compute(self):
-        return getattr(self.ref_obj, self.ref_attr)
+        ref_obj = self.ref_obj
+        # NOTE # READ_TRACER.active, without going through the stand-in.
+        if (CURRENT_ENGINE.get().traced_reads is not None):
+            READ_TRACER.note(ref_obj, self.ref_attr)
+        return getattr(ref_obj, self.ref_attr)
 
 SAR = SimpleAttributeReport
 
@@ -28,6 +34,8 @@ class LockedAttributeReport(SimpleAttributeReport):
         Supply getattr(ref_obj, ref_attr) in response to compute() method call,
         but remember the first result, and refer back to that for all future calls.
     '''
+    __slots__ = ('locked_value',)
+
     def __init__(self, **kwargs):
         self.locked_value = None
         super().__init__(**kwargs)
@@ -45,6 +53,8 @@ class SimpleMethodReport(Computable):
         See: SimpleAttributeReport, but permits calling a method with keyword arguments
              passed as a dictionary.
     '''
+    __slots__ = ('_ref_obj', 'ref_method', 'method_kwargs')
+
     def __init__(self, ref_obj, ref_method, method_kwargs=None):
         self._ref_obj = ref_obj
         self.ref_method = ref_method
@@ -71,6 +81,8 @@ class LockedMethodReport(Computable):
         See: LockedAttributeReport, but permits calling a method with keyword arguments
              passed as a dictionary.
     '''
+    __slots__ = ('locked_value', 'ref_obj', 'ref_method', 'method_kwargs')
+
     def __init__(self, **kwargs):
         self.locked_value = None
         super().__init__(**kwargs)
@@ -90,26 +102,48 @@ class ObjectCounter(Computable):
     '''\
         Tally the number of objects meeting a Selection criteria.
     '''
+    __slots__ = ('selection', 'ref_obj')
+
     def __init__(self, selection):
         self.selection = selection
+        self.ref_obj = None
 
     def compute(self):
         '''\
-            Selection_ instances override __len__(self); they compute
-            the set of objects they describe to before returning their size.
+            Selection_ instances override __len__(self); where possible the count is
+            maintained incrementally rather than computed from the set of objects they describe.
+            See: Selection_.count()
         '''
         return len(self.selection)
 
 
+class ObjectTotal(Computable):
+    '''\
+        Sum the values of an attribute (e.g., power) of the objects meeting a Selection criteria.
+    '''
+    __slots__ = ('selection', 'attribute', 'ref_obj')
+
+    def __init__(self, selection, attribute):
+        self.selection = selection
+        self.attribute = attribute
+        self.ref_obj = None
+
+    def compute(self):
+        return self.selection.total(self.attribute)
+
+
 class ComputeWrapper(Computable):
     '''\
         Wrap arbitrary (possibly hard-coded special case) functions
         with this class to allow them to slot into places where
         a compute() method (returning a dependent value) is expected.
     '''
+    __slots__ = ('func', 'kwargdict', 'ref_obj')
+
     def __init__(self, func, kwargdict=None):
         self.func = func
         self.kwargdict = kwargdict
+        self.ref_obj = None
 
     def compute(self):
         if (self.kwargdict is None):
@@ -123,6 +157,8 @@ class ConcatReduction(Computable):
         Support attribute value assignments which are concatenations of pre-existing lists
         with specified sequences.
     '''
+    __slots__ = ('ref_attr', 'seq_to_concat', 'ref_obj')
+
     def __init__(self, ref_attr, seq_to_concat, ref_obj=None):
         self.ref_attr = ref_attr
         self.seq_to_concat = seq_to_concat
@@ -139,6 +175,8 @@ class RulesTextAndCopiableEffectAbilityRemover(Computable):
         rules text and copiable effects affecting that object, but not abilities
         granted to that object from other effects.
     '''
+    __slots__ = ('ref_obj',)
+
     def __init__(self, ref_obj=None):
         self.ref_obj = ref_obj
 
@@ -157,6 +195,8 @@ class IdempotentManaAbilityGrant(Computable):
         Assumes that mana ability instances do not require __init__ arguments.
         Will not add a duplicate instance of a mana ability.
     '''
+    __slots__ = ('mana_ability_types_to_grant', 'ref_obj')
+
     def __init__(self, mana_ability_types_to_grant):
         self.mana_ability_types_to_grant = mana_ability_types_to_grant
         self.ref_obj = None
@@ -181,6 +221,8 @@ class KeywordAbilityGrant(Computable):
         in a manner which is sensitive to prohibitions against that object gaining
         certain keyword abilities. 
     '''
+    __slots__ = ('kwa_types_to_add', 'ref_obj')
+
     def __init__(self, kwa_types_to_add):
         self.kwa_types_to_add = kwa_types_to_add
         self.ref_obj = None
@@ -204,6 +246,8 @@ class ProhibitKeywordAbility(Computable):
     '''\
         Represent prohibitions against objects gaining certain keyword abilities.
     '''
+    __slots__ = ('prohibition_to_add', 'ref_obj')
+
     def __init__(self, prohibition_to_add):
         self.prohibition_to_add = prohibition_to_add
         self.ref_obj = None
@@ -219,6 +263,8 @@ class KeywordAbilityLoss(Computable):
         Remove all instances of keyword abilities possessed by a given object
         that match each of the specified types.
     '''
+    __slots__ = ('kwa_types_to_lose', 'ref_obj')
+
     def __init__(self, kwa_types_to_lose):
         self.kwa_types_to_lose = kwa_types_to_lose
         self.ref_obj = None
@@ -244,6 +290,8 @@ class StaticAbilityGrant(Computable):
         static ability, as an effect generator, is synced to the object hosting it,
         while annotating the origin of the static ability.
     '''
+    __slots__ = ('static_ability_type_to_add', 'ref_obj')
+
     def __init__(self, static_ability_type_to_add):
         self.static_ability_type_to_add = static_ability_type_to_add
         self.ref_obj = None
@@ -259,16 +307,33 @@ class UnionReduction(ConcatReduction):
     '''\
         Support attribute value assignments which involve adding >= 1 elements to an
         underlying set.
+        # NOTE #
+        When ref_attr is one of TYPESET_CHARX, seq_to_concat is encoded as a TypeSet
+        once, so that compute() is a single bitwise operation.
     '''
+    __slots__ = ()
+
+    def __init__(self, ref_attr, seq_to_concat, ref_obj=None):
+        super().__init__(ref_attr=ref_attr,
+                         seq_to_concat=TypeSet.for_attribute(ref_attr, seq_to_concat),
+                         ref_obj=ref_obj)
+
     def compute(self):
-        return reduce(set.union, [getattr(self.ref_obj, self.ref_attr), self.seq_to_concat])
+        return getattr(self.ref_obj, self.ref_attr) | self.seq_to_concat
 
 
 class SetFiltration(ConcatReduction):
     '''\
         Support attribute value assignments which involve removing >= 1 elements from an
-        underlying set.
+        underlying set. See also: UnionReduction.
     '''
+    __slots__ = ()
+
+    def __init__(self, ref_attr, seq_to_concat, ref_obj=None):
+        super().__init__(ref_attr=ref_attr,
+                         seq_to_concat=TypeSet.for_attribute(ref_attr, seq_to_concat),
+                         ref_obj=ref_obj)
+
     def compute(self):
         src_set = getattr(self.ref_obj, self.ref_attr)
         return src_set - self.seq_to_concat
@@ -281,6 +346,8 @@ class Lambda(Computable):
             Computable; or,
             a fixed a priori value.
     '''
+    __slots__ = ('operator', 'l_operand', 'r_operand', 'computed_l_operand', 'computed_r_operand', 'ref_obj')
+
     def __init__(self, operator, l_operand, r_operand):
         self.operator = operator
         self.l_operand = l_operand
@@ -306,6 +373,8 @@ class Lambda(Computable):
 
 
 class ConstantLambda(Lambda):
+    __slots__ = ('constant_value',)
+
     def __init__(self, constant_value):
         # NOTE #
         # Ensure <Iterable> constant_values are copied before assignment.
@@ -320,6 +389,8 @@ class Delta(Computable):
         Encode the intention to assign the result of an arbitrary function to >=1 attributes
         of an eventual target object.
     '''
+    __slots__ = ('reference_attributes', 'arbitrary_function')
+
     def __init__(self, reference_attributes, arbitrary_function):
         self.reference_attributes = list(reference_attributes)
         self.arbitrary_function = arbitrary_function
@@ -335,8 +406,15 @@ class K(Delta):
         Encode the intention to assign a pre-specified constant value to >=1 attributes
         of an eventual target object.
     '''
+    __slots__ = ('_constant_value',)
+
     def __init__(self, reference_attributes, constant_value):
         self.reference_attributes = reference_attributes
+        # NOTE #
+        # Encode constant sets of type line words up front rather than on every assignment.
+        if (reference_attributes and TYPESET_CHARX.issuperset(reference_attributes)):
+            if isinstance(constant_value, (set, frozenset)):
+                constant_value = TypeSet(constant_value)
         self._constant_value = copy_sensitive(constant_value)
 
     @dynamic
@@ -359,6 +437,8 @@ class AbilitiesK(K):
         the host_object of the abilities is the source object that is being copied by the copier
         object.
     '''
+    __slots__ = ()
+
     def compute(self, ref_obj):
         abilities = []
         for ability in self.constant_value:
@@ -380,6 +460,8 @@ class ReflexiveDelta(Delta):
         Example:
             Target player gains 5 life.
     '''
+    __slots__ = ()
+
     def compute(self, ref_obj):
         # NOTE #
         # Unlike Delta instances, propagate ref_obj so that self.arbitrary_function
@@ -391,30 +473,40 @@ rD = ReflexiveDelta
 
 
 class LoseRulesTextAndCopiableEffectAbilities(ReflexiveDelta):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(reference_attributes=['abilities'],
                          arbitrary_function=RulesTextAndCopiableEffectRemover())
 
 
 class AddKeywordAbilities(ReflexiveDelta):
+    __slots__ = ()
+
     def __init__(self, kwa_types_to_add):
         super().__init__(reference_attributes=['abilities'],
                          arbitrary_function=KeywordAbilityGrant(kwa_types_to_add=kwa_types_to_add))
 
 
 class BanKeywordAbility(ReflexiveDelta):
+    __slots__ = ()
+
     def __init__(self, prohibition_to_add):
         super().__init__(reference_attributes=['abilities'],
                          arbitrary_function=ProhibitKeywordAbility(prohibition_to_add=prohibition_to_add))
 
 
 class LoseKeywordAbilities(ReflexiveDelta):
+    __slots__ = ()
+
     def __init__(self, kwa_types_to_lose):
         super().__init__(reference_attributes=['abilities'],
                          arbitrary_function=KeywordAbilityLoss(kwa_types_to_lose=kwa_types_to_lose))
 
 
 class AddStaticAbility(ReflexiveDelta):
+    __slots__ = ()
+
     def __init__(self, static_ability_type_to_add):
         super().__init__(reference_attributes=['abilities'],
                          arbitrary_function=StaticAbilityGrant(static_ability_type_to_add=static_ability_type_to_add))
@@ -428,12 +520,16 @@ class AddStaticAbility(ReflexiveDelta):
 # current value of a reference attribute of that target object at the time of computation.
 ##################################################################################################
 class BecomePermanentObjectType(ReflexiveDelta):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(reference_attributes=['object_types'],
                          arbitrary_function=UnionReduction(ref_attr='object_types',
                                                            seq_to_concat=set(['permanent'])))
 
 class BecomePermanentSpellObjectType(ReflexiveDelta):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(reference_attributes=['object_types'],
                          arbitrary_function=UnionReduction(ref_attr='object_types',
@@ -441,6 +537,8 @@ class BecomePermanentSpellObjectType(ReflexiveDelta):
 
 
 class LosePermanentObjectType(ReflexiveDelta):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(reference_attributes=['object_types'],
                          arbitrary_function=SetFiltration(ref_attr='object_types',
@@ -448,6 +546,8 @@ class LosePermanentObjectType(ReflexiveDelta):
 
 
 class LosePermanentSpellObjectType(ReflexiveDelta):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(reference_attributes=['object_types'],
                          arbitrary_function=SetFiltration(ref_attr='object_types',
@@ -455,6 +555,8 @@ class LosePermanentSpellObjectType(ReflexiveDelta):
 
 
 class BecomeCopyOfPermanentSpellType(ReflexiveDelta):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(reference_attributes=['object_types'],
                          arbitrary_function=UnionReduction(ref_attr='object_types',
@@ -462,6 +564,8 @@ class BecomeCopyOfPermanentSpellType(ReflexiveDelta):
 
 
 class LosePermanentSpellObjectType(ReflexiveDelta):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(reference_attributes=['object_types'],
                          arbitrary_function=SetFiltration(ref_attr='object_types',
@@ -469,6 +573,8 @@ class LosePermanentSpellObjectType(ReflexiveDelta):
 
 
 class BecomeTokenObjectType(ReflexiveDelta):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(reference_attributes=['object_types'],
                          arbitrary_function=UnionReduction(ref_attr='object_types',
@@ -479,6 +585,8 @@ class RequestTimestamp(Computable):
     '''\
         Support Deltas that can assign timestamp values in real-time.
     '''
+    __slots__ = ('ref_obj',)
+
     def __init__(self):
         self.ref_obj = None
 
@@ -492,22 +600,28 @@ class RequestUUID(Computable):
     '''\
         Support Deltas that can assign a unique id in real-time.
     '''
+    __slots__ = ('ref_obj',)
+
     def __init__(self):
         self.ref_obj = None
 
     def compute(self):
-        return uuid.uuid4().hex
+        return TEMP_IDS.allocate()
 
 REQUEST_UUID = RequestUUID()
 
 
 
 class UpdateTimestamp(Delta):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(reference_attributes=['timestamp'], arbitrary_function=REQUEST_TIMESTAMP)
 
 
 class IdentifierUpdate(Delta):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(reference_attributes=['identified_uuid'], arbitrary_function=REQUEST_UUID)
 
@@ -552,6 +666,8 @@ class ReflexiveAdditionDelta(ReflexiveDelta):
             amount is always a non-negative integer representing the magnitude of the change; and,
             addition is the default change---substraction is accomplished by passing False to gain.
     '''
+    __slots__ = ()
+
     def __init__(self, ref_attr, amount, gain=True):
         if not(gain):
             amount = -1 * amount
@@ -568,6 +684,8 @@ class LifetotalDelta(ReflexiveAdditionDelta):
         reference object's lifetotal attribute at the time immediately prior to
         modifying that reference object's lifetotal attribute.
     '''
+    __slots__ = ()
+
     def __init__(self, amount, gain=True):
         super().__init__(ref_attr="lifetotal",
                          amount=amount,
@@ -581,6 +699,8 @@ class PowerDelta(ReflexiveAdditionDelta):
         defining it or setting it to a specific value. See also: ReflexiveAdditionDelta
         for an explanation of the arbitrary function.
     '''
+    __slots__ = ()
+
     def __init__(self, amount, gain=True):
         super().__init__(ref_attr="power",
                          amount=amount,
@@ -593,6 +713,8 @@ class ToughnessDelta(ReflexiveAdditionDelta):
         defining it or setting it to a specific value. See also: ReflexiveAdditionDelta
         for an explanation of the arbitrary function.
     '''
+    __slots__ = ()
+
     def __init__(self, amount, gain=True):
         super().__init__(ref_attr="toughness",
                          amount=amount,
@@ -606,6 +728,8 @@ class MarkerTotalDelta(ReflexiveAdditionDelta):
         markers of that type already possessed by that reference object at the time
         immediately prior to making the change.
     '''
+    __slots__ = ()
+
     def __init__(self, amount, gain=True, marker_type='defaultmarkertype'):
         marker_ref_attr = 'marker_{}'.format(marker_type)
         super().__init__(ref_attr=marker_ref_attr,
@@ -658,7 +782,7 @@ class ReferenceLibrary:
         self.current_turn = SAR(ref_obj=GAME, ref_attr='current_turn')
         #####
 
-LINKS = ReferenceLibrary()
+LINKS = engine_service('LINKS', ReferenceLibrary)
 
 
 ###################################################
@@ -714,30 +838,40 @@ ConcatR = ConcatReduction
 # Card Types, Subtypes, Supertypes #
 ####################################
 class AddCardTypes(ReflexiveDelta):
+    __slots__ = ()
+
     def __init__(self, set_of_card_types_to_add):
         super().__init__(reference_attributes=['card_types'],
                          arbitrary_function=UnionR(ref_attr='card_types',
                                                    seq_to_concat=set_of_card_types_to_add))
 
 class AddAllCreatureTypes(ReflexiveDelta):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(reference_attributes=['subtypes'],
                          arbitrary_function=UnionR(ref_attr='subtypes',
-                                                   seq_to_concat=set(CREATURE_TYPES)))
+                                                   seq_to_concat=ALL_CREATURE_TYPES))
 
 class LoseAllCreatureTypes(ReflexiveDelta):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(reference_attributes=['subtypes'],
                          arbitrary_function=SetFiltration(ref_attr='subtypes',
-                                                          seq_to_concat=set(CREATURE_TYPES)))
+                                                          seq_to_concat=ALL_CREATURE_TYPES))
 
 class AddSubtypes(ReflexiveDelta):
+    __slots__ = ()
+
     def __init__(self, set_of_subtypes_to_add):
         super().__init__(reference_attributes=['subtypes'],
                          arbitrary_function=UnionR(ref_attr='subtypes',
                                                    seq_to_concat=set_of_subtypes_to_add))
 
 class AddSupertypes(ReflexiveDelta):
+    __slots__ = ()
+
     def __init__(self, set_of_supertypes_to_add):
         super().__init__(reference_attributes=['supertypes'],
                          arbitrary_function=UnionR(ref_attr='supertypes',
@@ -745,45 +879,65 @@ class AddSupertypes(ReflexiveDelta):
 
 
 class AddPlaneswalkerCardType(AddCardTypes):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(set_of_card_types_to_add=set(['planeswalker']))
 
 class AddArtifactCardType(AddCardTypes):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(set_of_card_types_to_add=set(['artifact']))
 
 class AddCreatureCardType(AddCardTypes):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(set_of_card_types_to_add=set(['creature']))
 
 class AddEnchantmentCardType(AddCardTypes):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(set_of_card_types_to_add=set(['enchantment']))
 
 
 class LoseAllLandTypes(ReflexiveDelta):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(reference_attributes=['subtypes'],
                          arbitrary_function=SetFiltration(ref_attr="subtypes",
-                                                          seq_to_concat=LAND_TYPES))
+                                                          seq_to_concat=ALL_LAND_TYPES))
 
 class AddLandTypePlains(AddSubtypes):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(set_of_subtypes_to_add=set(['plains']))
 
 class AddLandTypeIsland(AddSubtypes):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(set_of_subtypes_to_add=set(['island']))
 
 class AddLandTypeSwamp(AddSubtypes):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(set_of_subtypes_to_add=set(['swamp']))
 
 class AddLandTypeMountain(AddSubtypes):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(set_of_subtypes_to_add=set(['mountain']))
 
 class AddLandTypeForest(AddSubtypes):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(set_of_subtypes_to_add=set(['forest']))
 
@@ -794,6 +948,8 @@ class SetFixedController(K):
         For use by Sublayer 2 Effect Components which set the controller of
         game objects to a fixed value.
     '''
+    __slots__ = ()
+
     def __init__(self, constant_value):
         super().__init__(reference_attributes=['controller'],
                          constant_value=constant_value)
@@ -805,6 +961,8 @@ class SetFixedPT(K):
         to the same fixed apriori value; or, Sublayer 7b Effect Components which
         set base power and base toughness to the same fixed apriori value.
     '''
+    __slots__ = ()
+
     def __init__(self, constant_value):
         super().__init__(reference_attributes=['power', 'toughness'],
                          constant_value=constant_value)
@@ -814,6 +972,8 @@ class SetFixedPower(K):
         For use by Sublayer 7a Effect Components which define power to a fixed apriori value; or,
         Sublayer 7b Effect Components which set base power to a fixed apriori value.
     '''
+    __slots__ = ()
+
     def __init__(self, constant_value):
         super().__init__(reference_attributes=['power'], constant_value=constant_value)
 
@@ -823,6 +983,8 @@ class SetFixedToughness(K):
         For use by Sublayer 7a Effect Components which define toughness to a fixed apriori value; or,
         Sublayer 7b Effect Components which set base toughness to a fixed apriori value.
     '''
+    __slots__ = ()
+
     def __init__(self, constant_value):
         super().__init__(reference_attributes=['toughness'], constant_value=constant_value)
 
@@ -843,6 +1005,8 @@ class AssignSwitchedPowerDelta(ReflexiveDelta):
             ref_obj.switched_power = getattr(ref_obj, 'toughness')
 
     '''
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(reference_attributes=['switched_power'],
                          arbitrary_function=SAR(None, 'toughness'))
@@ -853,6 +1017,8 @@ class AssignSwitchedToughnessDelta(ReflexiveDelta):
         Given a reference_object, accomplish the following:
             ref_obj.switched_toughness = getattr(reference_object, 'power')
     '''
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(reference_attributes=['switched_toughness'],
                          arbitrary_function=SAR(None, 'power'))
@@ -866,6 +1032,8 @@ class SwitchPower(ReflexiveDelta):
         Given a reference_object, accomplish the following:
             ref_obj.power = ref_obj.switched_power
     '''
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(reference_attributes=['power'],
                          arbitrary_function=SAR(None, 'switched_power'))
@@ -880,6 +1048,8 @@ class SwitchToughness(ReflexiveDelta):
         Given a reference_object, accomplish the following:
             ref_obj.toughness = ref_obj.switched_toughness
     '''
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(reference_attributes=['toughness'],
                          arbitrary_function=SAR(None, 'switched_toughness'))
@@ -906,6 +1076,8 @@ class LoseAllAbilities(K):
         This is a fixed apriori constant value; therefore, this is a subclass
         of K (aka a constant delta).
     '''
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(reference_attributes=['abilities'],
                          constant_value=list([]))
@@ -918,6 +1090,8 @@ class LoseNonGrantedAbilities(ReflexiveDelta):
         rules-text, including intrinsic mana abilities, and abilities granted by copiable effects,
         but NOT abilities granted by non-copiable effects.
     '''
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(reference_attributes=['abilities'],
                          arbitrary_function=RulesTextAndCopiableEffectAbilityRemover())
@@ -927,11 +1101,13 @@ class LoseNonGrantedAbilities(ReflexiveDelta):
 ####### Losing All Card Types ##########
 class LoseAllCardTypes(K):
     '''\
-        type(Modifiable.card_types) == set
+        type(Modifiable.card_types) == TypeSet
         Losing all card_types is equivalent to assigning an empty set to the attribute
         value of the card_types attribute. This is a fixed apriori constant value; therefore,
         this is a subclass of K (aka a constant delta).
     '''
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(reference_attributes=['card_types'],
                          constant_value=set([]))
@@ -941,7 +1117,7 @@ class LoseAllCardTypes(K):
 ####### Losing All Creature Types ######
 class LoseAllSubtypes(K):
     '''\
-        type(Modifiable.subtypes) == set
+        type(Modifiable.subtypes) == TypeSet
         Losing all subtypes is equivalent to assigning an empty set to the attribute value of
         the subtypes attribute. This is a fixed apriori constant value; therefore, this is a
         subclass of K (aka a constant delta).
@@ -949,6 +1125,8 @@ class LoseAllSubtypes(K):
         This might need to be extended to allow differentiating between the subsets of subtypes
         which belong to one card_type and not to another.
     '''
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(reference_attributes=['subtypes'],
                          constant_value=set([]))
@@ -956,8 +1134,10 @@ class LoseAllSubtypes(K):
 ####### Losing All Colors #######
 class LoseAllColors(K):
     '''\
-        type(Modifiable.color) == set
+        type(Modifiable.color) == TypeSet
         See above.
     '''
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(reference_attributes=['color'], constant_value=set([]))
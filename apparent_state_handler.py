@@ -5,10 +5,27 @@ def copy_sensitive(value):
     '''\
         Wrapper to ensure that references match distinct objects in memory during
         copying of attribute values so that comparisons work correctly.
+        # NOTE #
+        Characteristic values are immutable and hash-consed (see HashConsTable), so sets
+        and lists are frozen rather than deep-copied; only dicts are still copied.
     '''
-    if (type(value) in [set, list, dict]):
+    if (type(value) is dict):
         return deepcopy(value)
-    return value
+    return HASH_CONS.freeze(value)
+
+
+# NOTE # Stands in for a missing object or attribute in ApparentStateHandler.bump_changed.
+EMPTY_STATE = {}
+# NOTE # Number of entries kept in ApparentStateHandler.changes before it starts a new epoch.
+CHANGE_LOG_LIMIT = 4096
+
+
+def copy_state(attr_val_dict):
+    '''\
+        Copy a mapping from object_id to {attribute: value}. The values are immutable,
+        so copying the two levels of dictionaries suffices.
+    '''
+    return defaultdict(dict, {object_id: dict(values) for object_id, values in attr_val_dict.items()})
 
 
 def compute_difference(op0, op1):
@@ -22,6 +39,8 @@ def compute_difference(op0, op1):
 
     if op0_type==int:
         return op0 - op1
+    elif op0_type==TypeSet:
+        return (op0 - op1, op0 ^ op1)
     elif op0_type==set:
         return (op0.difference(op1), op0.symmetric_difference(op1))
     else:
@@ -81,16 +100,38 @@ class ApparentStateHandler:
         to attribute values over time, while maintaining a dissociation with the base_state attribute
         values.
     '''
+    # NOTE #
+    # An object with a may_interact(component_a, component_b) method which returns False only
+    # for pairs of components which can never depend on one another, or None; see footprints.py.
+    # It's derived from the code, so it's shared by every Engine.
+    interaction_matrix = None
+
     def __init__(self):
         self.attr_val_dict = defaultdict(dict)
         self.ref_attr_val_dict = defaultdict(dict)
+        # NOTE #
+        # overlaid_ids maps each attribute to the set of object_ids with a value for that
+        # attribute in attr_val_dict; see overlaid().
+        self.overlaid_ids = defaultdict(set)
+        self.overlaid_ids_stale = False
+        # NOTE #
+        # versions maps each attribute to a counter which is bumped whenever the apparent value of
+        # that attribute of some object may have changed; see Selection_.selectable_objects.
+        self.versions = defaultdict(int)
+        # NOTE #
+        # changes logs an (object_id, attribute) pair for every bump of versions which concerns
+        # a known object; see SelectionAggregate in filters.py. It's cleared once it grows past
+        # CHANGE_LOG_LIMIT, or when a change can't be attributed to an object, and changes_epoch
+        # is incremented so that readers know they've missed entries.
+        self.changes = list([])
+        self.changes_epoch = 0
         self.snapshot = None
 
         # A dictionary with:
         #   keys        the object_id of effect components applied to the state; and,
         #   values      a 3-list, L, where:
-        #               L[0] is a deepcopy of the reference attribute value dictionary
-        #               L[1] is a deepcopy of the attribute value dictionary (representing the state after
+        #               L[0] is a copy of the reference attribute value dictionary
+        #               L[1] is a copy of the attribute value dictionary (representing the state after
         #                    applying the corresponding effect component).
         #               L[2] is the delta dict quantifying the difference between L[1] and L[0],
         #               in other words, the impact on the state of applying the associated effect component.
@@ -101,8 +142,8 @@ class ApparentStateHandler:
         #               T[0] is the object_id of one effect component
         #               T[1] is the object_id of a distinct effect component
         #   values      a 4-list, L, where:
-        #               L[0] is a deepcopy of the reference attribute value dictionary
-        #               L[1] is a deepcopy of the attribute value dictionary
+        #               L[0] is a copy of the reference attribute value dictionary
+        #               L[1] is a copy of the attribute value dictionary
         #               L[2] is the delta dict quantifying the difference between L[1] and L[0],
         #               L[3] is a boolean flag that is True when enacting the effect component at T[0]
         #                    changed the state such that the generator of the effect component at T[1]
@@ -114,15 +155,83 @@ class ApparentStateHandler:
         #               effect component after applying the first effect component.
         self.second_order_component_data = defaultdict(list)
 
+
+    def bind_engine(self, engine):
+        engine.overlay = self.attr_val_dict
+
+    def fork(self):
+        '''\
+            Return an ApparentStateHandler for a forked Engine (see Engine.fork) which starts out
+            with the solution of this one, so that the apparent values which aren't derived again
+            within the forked Engine are those of the current state.
+        '''
+        handler = ApparentStateHandler()
+        handler.attr_val_dict.update(copy_state(self.attr_val_dict))
+        handler.ref_attr_val_dict.update(copy_state(self.ref_attr_val_dict))
+        handler.overlaid_ids_stale = True
+        handler.versions.update(self.versions)
+        handler.snapshot = self.snapshot
+        return handler
+
+    def bump(self, attribute):
+        self.versions[attribute] += 1
+        self.new_change_epoch()
+
+    def new_change_epoch(self):
+        self.changes.clear()
+        self.changes_epoch += 1
+
+    def record_change(self, object_id, attribute):
+        self.versions[attribute] += 1
+        changes = self.changes
+        changes.append((object_id, attribute))
+        if (len(changes) > CHANGE_LOG_LIMIT):
+            self.new_change_epoch()
+
+    def bump_changed(self, old_state, new_state):
+        '''\
+            Bump the version of (and log a change to) every attribute with a value which differs
+            between old_state and new_state for at least one object. Values are compared by identity, which is exact for
+            hash-consed values and errs on the side of bumping otherwise.
+        '''
+        record_change = self.record_change
+        for object_id in (old_state.keys() | new_state.keys()):
+            old_values = old_state.get(object_id, EMPTY_STATE)
+            new_values = new_state.get(object_id, EMPTY_STATE)
+            if (old_values is new_values):
+                continue
+            for attribute in (old_values.keys() | new_values.keys()):
+                if not(old_values.get(attribute, EMPTY_STATE) is new_values.get(attribute, EMPTY_STATE)):
+                    record_change(object_id, attribute)
+
     def calibrate(self):
+        self.bump_changed(self.attr_val_dict, EMPTY_STATE)
         self.attr_val_dict.clear()
+        self.overlaid_ids.clear()
+        self.overlaid_ids_stale = False
         self.ref_attr_val_dict.clear()
         self.snapshot = None
         self.first_order_component_data.clear()
         self.second_order_component_data.clear()
 
     def refresh_attr_val_dict(self):
+        self.bump_changed(self.attr_val_dict, EMPTY_STATE)
         self.attr_val_dict.clear()
+        self.overlaid_ids.clear()
+        self.overlaid_ids_stale = False
+
+    def overlaid(self, attribute):
+        '''\
+            Return the set of object_ids of objects whose value of attribute has been modified,
+            i.e., whose apparent value may differ from their base value.
+        '''
+        if self.overlaid_ids_stale:
+            self.overlaid_ids.clear()
+            for object_id, modified_values in self.attr_val_dict.items():
+                for modified_attribute in modified_values:
+                    self.overlaid_ids[modified_attribute].add(object_id)
+            self.overlaid_ids_stale = False
+        return self.overlaid_ids[attribute]
 
     def refresh_ref_attr_val_dict(self):
         self.ref_attr_val_dict.clear()
@@ -155,22 +264,30 @@ class ApparentStateHandler:
         self.ref_attr_val_check(obj, attribute)
         # Update the apparent value of that attribute of that object
         self.attr_val_dict[obj.object_id][attribute] = new_value
+        self.record_change(obj.object_id, attribute)
+        if not(self.overlaid_ids_stale):
+            self.overlaid_ids[attribute].add(obj.object_id)
 
     def store_state(self):
-        self.snapshot = deepcopy(self.attr_val_dict)
+        self.snapshot = copy_state(self.attr_val_dict)
 
     def load_state(self, state_to_load):
         if (state_to_load is not None):
-            self.attr_val_dict = deepcopy(state_to_load)
+            # NOTE #
+            # Update in place; Characteristic descriptors hold a reference to attr_val_dict.
+            self.bump_changed(self.attr_val_dict, state_to_load)
+            self.attr_val_dict.clear()
+            self.attr_val_dict.update(copy_state(state_to_load))
+            self.overlaid_ids_stale = True
 
     def restore_state(self):
         self.load_state(self.snapshot)
 
     def return_ravd(self):
-        return deepcopy(self.ref_attr_val_dict)
+        return copy_state(self.ref_attr_val_dict)
 
     def return_avd(self):
-        return deepcopy(self.attr_val_dict)
+        return copy_state(self.attr_val_dict)
 
     def refresh_components(self, components):
         '''\
@@ -337,14 +454,85 @@ class ApparentStateHandler:
         return edge_set
 
 
+    def component_classes(self, list_of_components):
+        '''\
+            Partition list_of_components into classes of interchangeable components, e.g., the
+            components of ten copies of the same static ability on ten identical permanents, so that
+            dependency need only be tested once per pair of classes. Two components are in the
+            same class if they have the same interchangeability_key, and the same impact when applied
+            to the original state (see first_order_data, which must be computed beforehand).
+            Each class, and the classes themselves, are in the order of list_of_components.
+            # NOTE #
+            A component whose host object is modified by a component outside of its class is
+            placed in a class of its own; the other component could affect it but not the other members
+            of its class, e.g., by removing its ability.
+        '''
+        classes = []
+        classes_by_key = defaultdict(list)
+        for component in list_of_components:
+            key = None if component.is_marker_effect_component else component.interchangeability_key()
+            if (key is None):
+                classes.append([component])
+                continue
+            delta_x = self.first_order_component_data[component.object_id][2]
+            for component_class in classes_by_key[key]:
+                if (self.first_order_component_data[component_class[0].object_id][2] == delta_x):
+                    component_class.append(component)
+                    break
+            else:
+                new_class = [component]
+                classes_by_key[key].append(new_class)
+                classes.append(new_class)
+
+        modifiers = defaultdict(set)
+        for component in list_of_components:
+            for object_id in self.first_order_component_data[component.object_id][2]:
+                modifiers[object_id].add(component.object_id)
+
+        result = []
+        for component_class in classes:
+            if (len(component_class) > 1):
+                class_ids = {component.object_id for component in component_class}
+                if any((modifiers[component.host_object.object_id] - class_ids) for component in component_class):
+                    result.extend([component] for component in component_class)
+                    continue
+            result.append(component_class)
+        return result
+
+
+    def may_interact(self, component_a, component_b):
+        '''\
+            Return False if the interaction matrix rules out dependency between component_a and
+            component_b in either direction, in which case there's no need to test the pair.
+        '''
+        if (self.interaction_matrix is None):
+            return True
+        return self.interaction_matrix.may_interact(component_a, component_b)
+
+
+    def pairwise_edges(self, list_of_components, true_pairs):
+        '''\
+            Return the set of edges found by testing each pair of components in true_pairs
+            for dependency in both directions; true_pairs must contain each pair in both orders.
+        '''
+        self.second_order_data(true_pairs)
+        self.refresh_components(list_of_components)
+        return self.third_order_data()
+
+
     def determine_raw_edges(self, list_of_components):
         '''\
             Return a set of tuples where each tuple represents the source vertex and the target vertex of a
             directed edge in a directed graph which symbolizes the dependency of the target component on the
             source component.
-        '''
-        component_indices = [n for n in range(len(list_of_components))]
 
+            Dependency is tested between the first component of each class of interchangeable components
+            (see component_classes) and the verdict is expanded to the other members of its class; there
+            are no edges within a class, so its members apply in presort order. The first two members of each
+            class are tested against each other to confirm this; if either depends on the other, every pair of
+            components is tested instead. Pairs which the interaction matrix rules out (see may_interact)
+            aren't tested at all.
+        '''
         # NOTE #
         # Edges are sorted so that they are added to the graph in the order implied by the presort.
         # This step avoids the need to check if successors of a given component are sorted before applying
@@ -354,18 +542,31 @@ class ApparentStateHandler:
         for i in range(len(list_of_components)):
             edge_sort_dict[list_of_components[i].object_id] = i
 
-        pairs = pairs_to_consider(component_indices)
-
-        true_pairs = []
-        for pair in pairs:
-            true_pair = (list_of_components[pair[0]], list_of_components[pair[1]])
-            true_pairs.append(true_pair)
-
         self.first_order_data(list_of_components)
         self.refresh_components(list_of_components)
-        self.second_order_data(true_pairs)
-        self.refresh_components(list_of_components)
-        set_of_edges = self.third_order_data()
+
+        component_classes = self.component_classes(list_of_components)
+        representatives = [component_class[0] for component_class in component_classes]
+        may_interact = self.may_interact
+        true_pairs = [pair for pair in permutations(representatives, 2) if may_interact(*pair)]
+        probe_ids = set()
+        for component_class in component_classes:
+            if (len(component_class) > 1) and may_interact(component_class[0], component_class[1]):
+                true_pairs.append((component_class[0], component_class[1]))
+                true_pairs.append((component_class[1], component_class[0]))
+                probe_ids.add(component_class[1].object_id)
+        representative_edges = self.pairwise_edges(list_of_components, true_pairs)
+
+        if any(((edge[0] in probe_ids) or (edge[1] in probe_ids)) for edge in representative_edges):
+            true_pairs = [pair for pair in permutations(list_of_components, 2) if may_interact(*pair)]
+            set_of_edges = self.pairwise_edges(list_of_components, true_pairs)
+        else:
+            members = {component_class[0].object_id:component_class for component_class in component_classes}
+            set_of_edges = set()
+            for (source_id, target_id) in representative_edges:
+                for source in members[source_id]:
+                    for target in members[target_id]:
+                        set_of_edges.add((source.object_id, target.object_id))
         return sorted(set_of_edges, key=lambda x: (edge_sort_dict[x[0]], edge_sort_dict[x[1]]))
 
 
@@ -477,12 +678,12 @@ class ApparentStateHandler:
                     # and values == integers counting the indegree of the corresponding vertex.
                     indegree_data = dict(dag.in_degree(component_ids))
 
-                    ids_to_sort = set(component_ids)
+                    # NOTE # A dict rather than a set, since it preserves insertion order.
+                    ids_to_sort = dict.fromkeys(component_ids)
 
                     def get_next_independent_id():
-                        # Despite being a set, indices_to_sort will maintain the
-                        # relative order of its elements even after elements are
-                        # removed. This order matches the initial presort.
+                        # ids_to_sort maintains the relative order of its elements even
+                        # after elements are removed. This order matches the initial presort.
                         for component_id in ids_to_sort:
                             if not(indegree_data[component_id]):
                                 return component_id
@@ -496,7 +697,7 @@ class ApparentStateHandler:
                         # becoming independent recursively, since they wait to apply until just after the last effect
                         # upon which they depend is applied. Any successor which becomes independent due to the
                         # removal of this component from the dag due to it being invalid waits its turn instead.
-                        ids_to_sort.remove(independent_component.object_id)
+                        del ids_to_sort[independent_component.object_id]
                         ic_valid = independent_component.valid
                         if ic_valid:
                             independent_component.enact(lock=True)
@@ -513,4 +714,365 @@ class ApparentStateHandler:
                         add_independent(components_by_id[next_independent_id])
 
 
-APPARENT_X = ApparentStateHandler()
+APPARENT_X = engine_service('APPARENT_X', ApparentStateHandler)
+
+
+####################
+# Read-Set Tracing #
+####################
+
+class ReadTracer:
+    '''\
+        Opt-in recording of what an evaluation depends on, as a set of (object_id, attribute)
+        pairs. While a trace is active, a pair is recorded for every read made through a
+        Characteristic or IndexedAttribute descriptor (i.e., the properties of Modifiable and
+        ExpandedPlayerObject), every SimpleAttributeReport.compute(), and every object tested
+        by a Selection_ against its predicate.
+            Example:
+                with READ_TRACER.trace() as reads:
+                    selection.selectable_objects()
+        Traces nest; the reads recorded by an inner trace are also recorded by the outer ones.
+
+        Within record_components(), each EffectComponent traces its enactment, and exposes the
+        result as its read_set attribute.
+        # NOTE #
+        While a trace is active, selections bypass their caches, indexes and maintained
+        totals, so that the reads of every object they would have tested are recorded.
+        The read set of the innermost active trace is kept by the Engine, as traced_reads.
+    '''
+    __slots__ = ('stack', 'n_recording', 'engine')
+
+    # NOTE #
+    # The types of object whose reads note() records, i.e., those with an object_id drawn
+    # from OBJECT_IDS; set once they're defined (see modifiables.py).
+    traced_types = ()
+
+    def __init__(self):
+        self.stack = list([])
+        self.n_recording = 0
+        self.engine = None
+
+    def bind_engine(self, engine):
+        self.engine = engine
+
+    def fork(self):
+        # NOTE # Traces belong to the Engine they were started in.
+        return ReadTracer()
+
+    @property
+    def active(self):
+        return (self.engine.traced_reads is not None)
+
+    @property
+    def recording_components(self):
+        return bool(self.n_recording)
+
+    @contextmanager
+    def trace(self):
+        engine = self.engine
+        reads = set()
+        self.stack.append(reads)
+        engine.traced_reads = reads
+        try:
+            yield reads
+        finally:
+            self.stack.pop()
+            engine.traced_reads = self.stack[-1] if self.stack else None
+            if (engine.traced_reads is not None):
+                engine.traced_reads |= reads
+
+    @contextmanager
+    def record_components(self):
+        self.n_recording += 1
+        try:
+            yield
+        finally:
+            self.n_recording -= 1
+
+    def note(self, obj, attribute):
+        traced_reads = self.engine.traced_reads
+        if (traced_reads is not None) and isinstance(obj, self.traced_types):
+            traced_reads.add((obj.object_id, attribute))
+
+
+READ_TRACER = engine_service('READ_TRACER', ReadTracer)
+
+
+class Characteristic:
+    '''\
+        Data descriptor for an attribute which is subject to modification by continuous effects.
+        Reading it returns the apparent value recorded in APPARENT_X.attr_val_dict if the attribute
+        of that object has been modified; otherwise, it returns the base value stored in the object's
+        backing field, whose name is the attribute name prefixed with an underscore.
+        Assigning to it routes the new value through APPARENT_X.modify_attribute_value.
+
+        The backing field name is resolved once, when the owning class is created, rather than on
+        every access; the overlay storage is that of the current Engine (see Engine.overlay).
+
+        coerce is an optional function applied to assigned values, e.g., TypeSet.coerce for
+        the characteristics in TYPESET_CHARX, or FrozenList.coerce for abilities, so that every
+        stored value is immutable and may be shared rather than copied.
+    '''
+    __slots__ = ('name', 'backing_field', 'coerce')
+
+    def __init__(self, coerce=None):
+        self.name = None
+        self.backing_field = None
+        self.coerce = coerce
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.backing_field = '_' + name
+
+    def __get__(self, obj, objtype=None):
+        if (obj is None):
+            return self
+        engine = CURRENT_ENGINE.get()
+        if (engine.traced_reads is not None):
+            engine.traced_reads.add((obj.object_id, self.name))
+        modified_values = engine.overlay.get(obj.object_id)
+        if (modified_values is not None):
+            if (self.name in modified_values):
+                return modified_values[self.name]
+        return getattr(obj, self.backing_field)
+
+    def __set__(self, obj, value):
+        if (self.coerce is not None):
+            value = self.coerce(value)
+        current_service(APPARENT_X).modify_attribute_value(obj, self.name, value)
+
+
+class BaseCharacteristic(Characteristic):
+    '''\
+        Characteristic whose base value is a field of the BaseCharacteristics record stored
+        in the object's _base slot, which is shared by objects with identical definitions,
+        rather than a backing field of the object itself.
+    '''
+    __slots__ = ('index',)
+
+    def __init__(self, coerce=None):
+        super().__init__(coerce=coerce)
+        self.index = None
+
+    def __set_name__(self, owner, name):
+        super().__set_name__(owner, name)
+        self.index = BaseCharacteristics._fields.index(name)
+
+    def __get__(self, obj, objtype=None):
+        if (obj is None):
+            return self
+        engine = CURRENT_ENGINE.get()
+        if (engine.traced_reads is not None):
+            engine.traced_reads.add((obj.object_id, self.name))
+        modified_values = engine.overlay.get(obj.object_id)
+        if (modified_values is not None):
+            if (self.name in modified_values):
+                return modified_values[self.name]
+        return obj._base[self.index]
+
+
+class ObjectIndex:
+    '''\
+        Secondary indexes over the game objects in a source list (GAME.list_of_game_objects),
+        keyed on the base values of the attributes in INDEX_KEYS, so that selections can start
+        from the objects with a given zone type, controller, owner, card type or object type
+        rather than scanning every object. See plan_selection in filters.py.
+
+            positions       object_id -> position of the object in the source list
+            buckets         index name -> key -> set of object_ids
+
+        Only base values are indexed. The apparent value of a characteristic may differ from
+        its base value only for the objects in APPARENT_X.overlaid(attribute), so candidate sets
+        for characteristics are completed with those objects.
+
+        The index is kept current by IndexedAttribute assignments. Objects appended to the
+        source list are registered lazily by sync(), and it is rebuilt if the source list is
+        replaced by a list of other objects, or changed in place otherwise, e.g., by removing one
+        object and appending another.
+        The source list is a VersionedList, so that sync() tells that it hasn't changed in O(1).
+    '''
+    # NOTE # Map each index name to a function returning the keys under which a base value is filed.
+    INDEX_KEYS = {
+        'current_zone': lambda value: (type(value),),
+        'controller': lambda value: (id(value),),
+        'owner': lambda value: (id(value),),
+        'card_types': lambda value: tuple(value),
+        'object_types': lambda value: tuple(value),
+    }
+
+    def __init__(self):
+        self.source = None
+        # NOTE # The version of source when it was last synced, and the object_ids of the
+        # registered objects, in source order.
+        self.source_version = None
+        self.registered_ids = []
+        # NOTE # Counts rebuilds, so that positions recorded before one are known to be stale.
+        self.generation = 0
+        self.positions = {}
+        self.buckets = {index_name: defaultdict(set) for index_name in self.INDEX_KEYS}
+        self.complete = True
+
+    def __len__(self):
+        return len(self.positions)
+
+    def fork(self):
+        '''\
+            Return a copy of the index for a forked Engine (see Engine.fork), whose source list is
+            a copy of this one's, with the same objects, so the copy carries on from its first sync().
+        '''
+        index = ObjectIndex()
+        index.source = self.source
+        index.source_version = self.source_version
+        index.registered_ids = self.registered_ids
+        index.generation = self.generation
+        index.positions = dict(self.positions)
+        index.buckets = {index_name: defaultdict(set, {key: set(object_ids) for key, object_ids in bucket.items()})
+                         for index_name, bucket in self.buckets.items()}
+        index.complete = self.complete
+        return index
+
+    def base_value(self, obj, index_name):
+        if (index_name == 'card_types'):
+            return obj._base.card_types
+        if (index_name == 'controller'):
+            return obj._controller
+        return getattr(obj, index_name)
+
+    def file(self, object_id, index_name, value):
+        bucket = self.buckets[index_name]
+        for key in self.INDEX_KEYS[index_name](value):
+            bucket[key].add(object_id)
+
+    def unfile(self, object_id, index_name, value):
+        bucket = self.buckets[index_name]
+        for key in self.INDEX_KEYS[index_name](value):
+            object_ids = bucket.get(key)
+            if (object_ids is not None):
+                object_ids.discard(object_id)
+                if not(object_ids):
+                    del bucket[key]
+
+    def register(self, obj, position):
+        try:
+            values = [(index_name, self.base_value(obj, index_name)) for index_name in self.INDEX_KEYS]
+        except AttributeError:
+            self.complete = False
+            return
+        self.positions[obj.object_id] = position
+        for index_name, value in values:
+            self.file(obj.object_id, index_name, value)
+
+    def rebuild(self, source):
+        self.source = source
+        self.generation += 1
+        self.positions.clear()
+        for bucket in self.buckets.values():
+            bucket.clear()
+        self.complete = True
+        for position, obj in enumerate(source):
+            self.register(obj, position)
+
+    def sync(self, source):
+        '''\
+            Bring the index up to date with source, and return True if every object in it
+            is indexed.
+        '''
+        if (source is self.source) and (source.version == self.source_version):
+            return self.complete
+        registered_ids = self.registered_ids
+        source_ids = list(map(OBJECT_ID, source))
+        n_registered = len(registered_ids)
+        if not(source_ids[:n_registered] == registered_ids):
+            self.rebuild(source)
+        else:
+            # NOTE # E.g., a copy of the source list (see fork), or one with objects appended.
+            self.source = source
+            for position in range(n_registered, len(source)):
+                self.register(source[position], position)
+        self.registered_ids = source_ids
+        self.source_version = source.version
+        return self.complete
+
+    def update(self, obj, index_name, old_value, new_value):
+        object_id = obj.object_id
+        if (object_id in self.positions):
+            self.unfile(object_id, index_name, old_value)
+            self.file(object_id, index_name, new_value)
+
+    def lookup(self, index_name, key):
+        return self.buckets[index_name].get(key, EMPTY_ID_SET)
+
+    def lookup_subclasses(self, index_name, ref_type):
+        '''\
+            For indexes keyed by type, return the object_ids filed under ref_type or any of
+            its subclasses, i.e., those for which isinstance(value, ref_type) holds.
+        '''
+        result = set()
+        for key, object_ids in self.buckets[index_name].items():
+            if issubclass(key, ref_type):
+                result |= object_ids
+        return result
+
+    def ordered(self, object_ids):
+        '''\
+            Return the objects with the given object_ids which are in the source list,
+            in source list order.
+        '''
+        positions = self.positions
+        source = self.source
+        return [source[position] for position in sorted(positions[object_id] for object_id in object_ids if (object_id in positions))]
+
+
+EMPTY_ID_SET = frozenset()
+OBJECT_ID = attrgetter('object_id')
+OBJECT_INDEX = engine_service('OBJECT_INDEX', ObjectIndex)
+
+
+class IndexedAttribute:
+    '''\
+        Data descriptor for a plain attribute which is covered by OBJECT_INDEX. The value is
+        kept in the slot named storage; assigning a new value refiles the object in the index.
+        Like an EngineField, values assigned within a forked Engine (see Engine.fork) are
+        recorded in its field overlay instead.
+    '''
+    __slots__ = ('storage', 'index_name', 'member', 'coerce')
+
+    def __init__(self, storage, index_name, coerce=None):
+        self.storage = storage
+        self.index_name = index_name
+        self.member = None
+        self.coerce = coerce
+
+    def __set_name__(self, owner, name):
+        self.member = owner.__dict__[self.storage]
+
+    def __get__(self, obj, objtype=None):
+        if (obj is None):
+            return self
+        engine = CURRENT_ENGINE.get()
+        if (engine.traced_reads is not None):
+            engine.traced_reads.add((obj.object_id, self.index_name))
+        if (engine.fields is not None):
+            entry = engine.fields.get(id(obj))
+            if (entry is not None) and (self.storage in entry[1]):
+                return entry[1][self.storage]
+        return self.member.__get__(obj, objtype)
+
+    def __set__(self, obj, value):
+        if (self.coerce is not None):
+            value = self.coerce(value)
+        try:
+            old_value = self.member.__get__(obj)
+        except AttributeError:
+            # NOTE # First assignment, during __init__; the object can't be indexed yet.
+            self.member.__set__(obj, value)
+            return
+        fields = CURRENT_ENGINE.get().fields
+        if (fields is None):
+            self.member.__set__(obj, value)
+        else:
+            changed_values = changed_fields(fields, obj)
+            old_value = changed_values.get(self.storage, old_value)
+            changed_values[self.storage] = value
+        OBJECT_INDEX.update(obj, self.index_name, old_value, value)
+        APPARENT_X.record_change(obj.object_id, self.index_name)
@@ -0,0 +1,165 @@
+from combinatorics import *
+
+
+'''\
+    Batched counterparts of the combination and cartesian product functions in combinatorics.py,
+    which represent a set of choices as a 2-D NumPy array with one row per choice, rather than
+    as a list of tuples, so that downstream evaluators can score candidate choices in bulk.
+
+        index arrays        rows of indices into the list(s) of objects being chosen from,
+                            in the same order as the corresponding function in combinatorics.py
+        object arrays       the objects themselves, gathered from index arrays by fancy indexing
+
+    Each index array can also be generated in chunks of at most chunk_size rows, so that the
+    whole array never has to be held in memory at once.
+'''
+# NOTE # Default number of rows per chunk.
+BATCH_CHUNK_SIZE = 65536
+
+
+def object_array(list_of_objects):
+    '''\
+        Return a 1-D NumPy array of dtype object holding list_of_objects. Filling a preallocated
+        array keeps NumPy from treating objects which are sequences as nested dimensions.
+    '''
+    result = np.empty(len(list_of_objects), dtype=object)
+    result[:] = list_of_objects
+    return result
+
+
+def iter_combination_index_chunks(n_objects, size_of_combination, chunk_size=BATCH_CHUNK_SIZE):
+    '''\
+        Generate the size_of_combination-combinations of range(n_objects), in the order of
+        itertools.combinations, as 2-D arrays of at most chunk_size rows.
+    '''
+    index_combinations = combinations(range(n_objects), size_of_combination)
+    if not(size_of_combination):
+        yield np.zeros((1, 0), dtype=np.intp)
+        return
+    while True:
+        chunk = np.fromiter(chain.from_iterable(islice(index_combinations, chunk_size)), dtype=np.intp)
+        if not(chunk.size):
+            return
+        yield chunk.reshape(-1, size_of_combination)
+
+
+def combination_index_array(n_objects, size_of_combination):
+    '''\
+        Return the size_of_combination-combinations of range(n_objects) as a single 2-D array
+        of shape (comb(n_objects, size_of_combination), size_of_combination).
+    '''
+    n_rows = comb(n_objects, size_of_combination)
+    if not(n_rows):
+        return np.zeros((0, size_of_combination), dtype=np.intp)
+    if not(size_of_combination):
+        return np.zeros((1, 0), dtype=np.intp)
+    flat = np.fromiter(chain.from_iterable(combinations(range(n_objects), size_of_combination)),
+                       dtype=np.intp, count=n_rows * size_of_combination)
+    return flat.reshape(n_rows, size_of_combination)
+
+
+def iter_product_index_chunks(sizes, chunk_size=BATCH_CHUNK_SIZE):
+    '''\
+        Generate the cartesian product of range(size) for each size in sizes, in the order of
+        itertools.product, as 2-D arrays of at most chunk_size rows. Each chunk is computed
+        from a range of row numbers with np.unravel_index.
+    '''
+    sizes = tuple(sizes)
+    n_rows = 1
+    for size in sizes:
+        n_rows *= size
+    if not(sizes):
+        yield np.zeros((1, 0), dtype=np.intp)
+        return
+    for start in range(0, n_rows, chunk_size):
+        row_numbers = np.arange(start, min(start + chunk_size, n_rows), dtype=np.intp)
+        yield np.stack(np.unravel_index(row_numbers, sizes), axis=1)
+
+
+def product_index_array(sizes):
+    '''\
+        Return the cartesian product of range(size) for each size in sizes as a single 2-D array;
+        like itertools.product, the product of no ranges is a single empty choice.
+    '''
+    sizes = tuple(sizes)
+    if not(sizes):
+        return np.zeros((1, 0), dtype=np.intp)
+    return np.indices(sizes, dtype=np.intp).reshape(len(sizes), -1).T
+
+
+def combinations_of_objects_array(size_of_combination, list_of_objects):
+    '''\
+        See: combinations_of_objects; return an object array with one combination per row.
+    '''
+    index_array = combination_index_array(len(list_of_objects), size_of_combination)
+    return object_array(list_of_objects)[index_array]
+
+
+def sublist_offsets(list_of_sublist_of_objects):
+    '''\
+        Return the concatenation of the sublists as an object array, and the offset of each
+        sublist within it; replaces the translation dictionary of
+        translate_list_of_sublist_of_objects_into_list_of_sublist_of_indices.
+    '''
+    sizes = [len(sublist_of_objects) for sublist_of_objects in list_of_sublist_of_objects]
+    offsets = np.zeros(len(sizes), dtype=np.intp)
+    if sizes:
+        offsets[1:] = np.cumsum(sizes[:-1])
+    concatenated = object_array(list(chain.from_iterable(list_of_sublist_of_objects)))
+    return concatenated, offsets
+
+
+def iter_product_of_objects_chunks(list_of_sublist_of_objects, chunk_size=BATCH_CHUNK_SIZE):
+    '''\
+        See: product_of_objects; generate object arrays with one choice per row, in chunks.
+    '''
+    concatenated, offsets = sublist_offsets(list_of_sublist_of_objects)
+    sizes = [len(sublist_of_objects) for sublist_of_objects in list_of_sublist_of_objects]
+    for index_chunk in iter_product_index_chunks(sizes, chunk_size):
+        yield concatenated[index_chunk + offsets]
+
+
+def product_of_objects_array(list_of_sublist_of_objects):
+    '''\
+        See: product_of_objects; return an object array with one choice per row.
+    '''
+    concatenated, offsets = sublist_offsets(list_of_sublist_of_objects)
+    index_array = product_index_array([len(sublist_of_objects) for sublist_of_objects in list_of_sublist_of_objects])
+    return concatenated[index_array + offsets]
+
+
+def numeric_parameter_array(parameter_list):
+    '''\
+        Return parameter_list as a 1-D numeric array, or None if it isn't one, e.g., if its
+        values are sequences, or aren't numbers.
+    '''
+    try:
+        parameter_array = np.asarray(parameter_list)
+    except ValueError:
+        return None
+    if not(parameter_array.ndim == 1) or not(parameter_array.dtype.kind in 'biuf'):
+        return None
+    return parameter_array
+
+
+def function_parameter_cartesian_product_array(list_of_parameter_ranges):
+    '''\
+        See: function_parameter_cartesian_product; return a 2-D array with one choice of
+        parameters per row. The array is numeric if every parameter range is 1-D and of the
+        same numeric dtype, and of dtype object otherwise, so that each parameter keeps its
+        own type, and parameters which are sequences are kept whole.
+    '''
+    parameter_lists = [list(parameter_range) for parameter_range in list_of_parameter_ranges]
+    index_array = product_index_array([len(parameter_list) for parameter_list in parameter_lists])
+    parameter_arrays = [numeric_parameter_array(parameter_list) for parameter_list in parameter_lists]
+    if not(parameter_arrays):
+        result = np.empty(index_array.shape, dtype=np.intp)
+    elif all((parameter_array is not None) for parameter_array in parameter_arrays) and \
+            (len(set(parameter_array.dtype for parameter_array in parameter_arrays)) == 1):
+        result = np.empty(index_array.shape, dtype=parameter_arrays[0].dtype)
+    else:
+        parameter_arrays = [object_array(parameter_list) for parameter_list in parameter_lists]
+        result = np.empty(index_array.shape, dtype=object)
+    for column, parameter_array in enumerate(parameter_arrays):
+        result[:, column] = parameter_array[index_array[:, column]]
+    return result
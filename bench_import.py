@@ -0,0 +1,63 @@
+'''\
+    Import-time budget for the module chain (top -> ... -> object_config).
+
+    Runs `python -X importtime -c "import object_config"` in fresh interpreters, reports
+    the self and cumulative import times of each module in the chain from the fastest run,
+    and fails if importing object_config takes longer than IMPORT_BUDGET_US, or if any
+    module in DEFERRED_MODULES was imported; these are loaded on first use instead (see
+    LazyModule in top.py).
+
+    Usage:
+        python bench_import.py [n_runs]
+'''
+import os
+import subprocess
+import sys
+
+
+MODULE_CHAIN = ['top', 'mana_value', 'combinatorics', 'apparent_state_handler', 'players',
+                'modifiables', 'zones', 'durations', 'epochs', 'abstractions', 'filters',
+                'abilities', 'layers', 'contfx_config', 'footprints', 'object_config']
+DEFERRED_MODULES = ['networkx', 'numpy']
+IMPORT_BUDGET_US = 150000
+N_RUNS = 5
+
+
+def measure_import_times(module_name='object_config'):
+    '''\
+        Return a dictionary mapping the name of each module imported while importing
+        module_name in a fresh interpreter to a 2-tuple of its (self, cumulative) import
+        time in microseconds.
+    '''
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import {}'.format(module_name)],
+                               cwd=os.path.dirname(os.path.abspath(__file__)),
+                               capture_output=True, text=True, check=True)
+    result = {}
+    for line in completed.stderr.splitlines():
+        if not(line.startswith('import time:')) or ('self [us]' in line):
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        result[name.strip()] = (int(self_us), int(cumulative_us))
+    return result
+
+
+def run(n_runs=N_RUNS):
+    runs = [measure_import_times() for _ in range(n_runs)]
+    fastest = min(runs, key=lambda import_times: import_times['object_config'][1])
+
+    print("{:<26}{:>12}{:>14}".format('module', 'self [us]', 'cumulative'))
+    for module_name in MODULE_CHAIN:
+        self_us, cumulative_us = fastest.get(module_name, (0, 0))
+        print("{:<26}{:>12}{:>14}".format(module_name, self_us, cumulative_us))
+    total_us = fastest['object_config'][1]
+    print("\nimport object_config: {} us (budget {} us, fastest of {} runs)".format(total_us, IMPORT_BUDGET_US, n_runs))
+
+    deferred_imported = [module_name for module_name in DEFERRED_MODULES if (module_name in fastest)]
+    if deferred_imported:
+        print("Imported eagerly, but should be deferred: {}".format(', '.join(deferred_imported)))
+    return (total_us <= IMPORT_BUDGET_US) and not(deferred_imported)
+
+
+if (__name__ == '__main__'):
+    n_runs = int(sys.argv[1]) if (len(sys.argv) > 1) else N_RUNS
+    sys.exit(0 if run(n_runs) else 1)
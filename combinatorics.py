@@ -25,6 +25,7 @@ def scry_splits(list_of_cards_to_scry):
     '''\
         Return a list of sublists of tuples representing the unique ways to
         scry given the list_of_cards_to_scry.
+        See also: ScryOutcomes, which enumerates the same outcomes lazily.
     '''
     n_cards_to_scry = len(list_of_cards_to_scry)
     if not(n_cards_to_scry):
@@ -71,6 +72,481 @@ def subpowerset(x, n=1, N=None):
     return chain.from_iterable(combinations(x, r) for r in range(n, N_))
 
 
+###################################
+# Streaming Selection Enumeration #
+###################################
+class SamplingRandom(Random):
+    '''\
+        Random whose state is carried over to a forked Engine (see Engine.fork), rather than
+        shared with it, so that sampling within the forked Engine doesn't change what's sampled
+        outside of it.
+    '''
+    def fork(self):
+        rng = SamplingRandom()
+        rng.setstate(self.getstate())
+        return rng
+
+
+# NOTE # Default source of randomness for SelectionSpace.sample; seeded for reproducibility.
+SAMPLING_RNG = engine_service('SAMPLING_RNG', partial(SamplingRandom, RANDOM_SEED))
+
+
+def subpowerset_sizes(n_elements, n=1, N=None):
+    '''\
+        Return the range of cardinalities which subpowerset(x, n, N) generates when len(x) is
+        n_elements.
+    '''
+    if (n is None):
+        if (N is not None):
+            raise ValueError("n is None but N is not None, impossible.")
+        n = N = n_elements
+    elif (N is None):
+        N = n_elements
+    return range(n, N + 1)
+
+
+def unrank_combination(n_elements, r, index):
+    '''\
+        Return the index-th r-combination of range(n_elements), in the order generated by
+        itertools.combinations.
+    '''
+    result = []
+    candidate = 0
+    for position in range(r):
+        n_remaining = r - position - 1
+        while True:
+            n_starting_with_candidate = comb(n_elements - candidate - 1, n_remaining)
+            if (index < n_starting_with_candidate):
+                break
+            index -= n_starting_with_candidate
+            candidate += 1
+        result.append(candidate)
+        candidate += 1
+    return tuple(result)
+
+
+def next_combination(n_elements, indices):
+    '''\
+        Return the r-combination of range(n_elements) following indices in the order
+        generated by itertools.combinations, or None if indices is the last one.
+    '''
+    r = len(indices)
+    indices = list(indices)
+    for position in reversed(range(r)):
+        if (indices[position] != position + n_elements - r):
+            indices[position] += 1
+            for following in range(position + 1, r):
+                indices[following] = indices[following - 1] + 1
+            return tuple(indices)
+    return None
+
+
+class SelectionSpace:
+    '''\
+        The space of selections which subpowerset(x, n, N) generates---the combinations of the
+        elements of x with cardinalities in the closed interval [n:N], smallest first, each size
+        in the order of itertools.combinations---without materialising it.
+
+        len(space)              exact size, from binomial coefficients
+        iter(space)             lazy iteration, in the same order as subpowerset
+        space[index]            the selection at index (unranking)
+        space.sample()          a selection drawn uniformly at random
+        space.chunks(k)         k (start, stop) index ranges partitioning the space, and
+        space.iter_range(a, b)  lazy iteration over one of them, e.g., per worker
+    '''
+    __slots__ = ('elements', 'sizes', 'size_counts')
+
+    def __init__(self, x, n=1, N=None):
+        self.elements = x if isinstance(x, list) else list(x)
+        self.sizes = subpowerset_sizes(len(self.elements), n, N)
+        self.size_counts = [comb(len(self.elements), r) for r in self.sizes]
+
+    def __len__(self):
+        return sum(self.size_counts)
+
+    def __iter__(self):
+        elements = self.elements
+        return chain.from_iterable(combinations(elements, r) for r in self.sizes)
+
+    def locate(self, index):
+        '''\
+            Return the cardinality of the selection at index, and its index among the
+            selections with that cardinality.
+        '''
+        n_selections = len(self)
+        if (index < 0):
+            index += n_selections
+        if not(0 <= index < n_selections):
+            raise IndexError("SelectionSpace index out of range.")
+        for r, size_count in zip(self.sizes, self.size_counts):
+            if (index < size_count):
+                return r, index
+            index -= size_count
+
+    def __getitem__(self, index):
+        r, index = self.locate(index)
+        elements = self.elements
+        return tuple(elements[i] for i in unrank_combination(len(elements), r, index))
+
+    def sample(self, rng=None):
+        '''\
+            Return a selection drawn uniformly at random using rng (a random.Random), or
+            SAMPLING_RNG by default.
+        '''
+        rng = SAMPLING_RNG if (rng is None) else rng
+        return self[rng.randrange(len(self))]
+
+    def iter_range(self, start, stop):
+        '''\
+            Generate the selections with indices in [start, stop), in order, unranking only
+            the first of them.
+        '''
+        stop = min(stop, len(self))
+        if (start >= stop):
+            return
+        elements = self.elements
+        n_elements = len(elements)
+        r, index = self.locate(start)
+        indices = unrank_combination(n_elements, r, index)
+        for _ in range(stop - start):
+            yield tuple(elements[i] for i in indices)
+            indices = next_combination(n_elements, indices)
+            if (indices is None):
+                r += 1
+                indices = tuple(range(r))
+
+    def chunks(self, n_chunks):
+        '''\
+            Return a list of n_chunks (start, stop) index ranges of near-equal length which
+            partition the space, in order.
+        '''
+        n_selections = len(self)
+        return [((n_selections * k) // n_chunks, (n_selections * (k + 1)) // n_chunks) for k in range(n_chunks)]
+
+
+def multinomial(counts):
+    '''\
+        Return the number of distinct orderings of a multiset with the given multiplicities.
+    '''
+    result = factorial(sum(counts))
+    for count in counts:
+        result //= factorial(count)
+    return result
+
+
+class ScryOutcomes:
+    '''\
+        The outcomes of scrying cards (listed top of the library first), enumerated directly
+        rather than as every split of every permutation (see scry_splits). Each outcome is a
+        2-tuple (top, bottom) of tuples of cards: those put back on top of the library, in
+        order, and those put on the bottom, in order.
+
+        bottom_ordered      If False, outcomes which differ only in the order of the cards put
+                            on the bottom are enumerated once, with the bottom cards in their
+                            original order.
+        key                 Optional function of a card; cards with equal keys are treated as
+                            identical, so outcomes which only differ by exchanging identical
+                            cards are enumerated once. Identical cards are used in their
+                            original order.
+
+        len(outcomes)       exact count
+        iter(outcomes)      lazy iteration: by the number of cards kept on top, then by the
+                            top ordering, then by the bottom ordering
+        outcomes[index]     the outcome at index (unranking)
+        outcomes.sample()   an outcome drawn uniformly at random
+
+        Example
+            With 5 distinct cards there are 6 * 5! = 720 outcomes; 326 if the order of the
+            bottom cards doesn't matter.
+    '''
+    __slots__ = ('cards', 'bottom_ordered', 'classes', 'counts', 'completion_counts')
+
+    def __init__(self, cards, bottom_ordered=True, key=None):
+        self.cards = list(cards)
+        self.bottom_ordered = bottom_ordered
+        # NOTE #
+        # classes lists the positions in cards of each class of identical cards, in order of
+        # first appearance.
+        self.classes = []
+        class_indices = {}
+        for position, card in enumerate(self.cards):
+            card_key = position if (key is None) else key(card)
+            if not(card_key in class_indices):
+                class_indices[card_key] = len(self.classes)
+                self.classes.append([])
+            self.classes[class_indices[card_key]].append(position)
+        self.counts = tuple(len(positions) for positions in self.classes)
+        self.completion_counts = {}
+
+    def n_completions(self, counts, n_top):
+        '''\
+            Return the number of ways to finish an outcome by putting n_top more cards on top,
+            from the remaining cards of each class given by counts, and the rest on the bottom.
+        '''
+        state = (counts, n_top)
+        result = self.completion_counts.get(state)
+        if (result is None):
+            if not(n_top):
+                result = multinomial(counts) if self.bottom_ordered else 1
+            else:
+                result = 0
+                for class_index, count in enumerate(counts):
+                    if count:
+                        result += self.n_completions(self.take(counts, class_index), n_top - 1)
+            self.completion_counts[state] = result
+        return result
+
+    def take(self, counts, class_index):
+        return counts[:class_index] + (counts[class_index] - 1,) + counts[class_index + 1:]
+
+    def __len__(self):
+        return sum(self.n_completions(self.counts, n_top) for n_top in range(len(self.cards) + 1))
+
+    def outcome(self, top_classes, bottom_classes):
+        '''\
+            Translate sequences of class indices into an outcome of concrete cards.
+        '''
+        cards = self.cards
+        used = [0] * len(self.classes)
+        def positions_for(class_indices):
+            result = []
+            for class_index in class_indices:
+                result.append(self.classes[class_index][used[class_index]])
+                used[class_index] += 1
+            return result
+        top_positions = positions_for(top_classes)
+        if self.bottom_ordered:
+            bottom_positions = positions_for(bottom_classes)
+        else:
+            bottom_positions = sorted(set(range(len(cards))).difference(top_positions))
+        return (tuple(cards[position] for position in top_positions), tuple(cards[position] for position in bottom_positions))
+
+    def arrangements(self, counts, n_top, top_classes):
+        if n_top:
+            for class_index, count in enumerate(counts):
+                if count:
+                    top_classes.append(class_index)
+                    yield from self.arrangements(self.take(counts, class_index), n_top - 1, top_classes)
+                    top_classes.pop()
+        elif self.bottom_ordered:
+            for bottom_classes in self.bottom_arrangements(counts, []):
+                yield self.outcome(top_classes, bottom_classes)
+        else:
+            yield self.outcome(top_classes, ())
+
+    def bottom_arrangements(self, counts, bottom_classes):
+        if not(any(counts)):
+            yield bottom_classes
+            return
+        for class_index, count in enumerate(counts):
+            if count:
+                bottom_classes.append(class_index)
+                yield from self.bottom_arrangements(self.take(counts, class_index), bottom_classes)
+                bottom_classes.pop()
+
+    def __iter__(self):
+        for n_top in range(len(self.cards) + 1):
+            yield from self.arrangements(self.counts, n_top, [])
+
+    def __getitem__(self, index):
+        n_outcomes = len(self)
+        if (index < 0):
+            index += n_outcomes
+        if not(0 <= index < n_outcomes):
+            raise IndexError("ScryOutcomes index out of range.")
+        counts = self.counts
+        n_top = 0
+        while (index >= self.n_completions(counts, n_top)):
+            index -= self.n_completions(counts, n_top)
+            n_top += 1
+        top_classes = []
+        for remaining in reversed(range(n_top)):
+            for class_index, count in enumerate(counts):
+                if count:
+                    n_following = self.n_completions(self.take(counts, class_index), remaining)
+                    if (index < n_following):
+                        top_classes.append(class_index)
+                        counts = self.take(counts, class_index)
+                        break
+                    index -= n_following
+        bottom_classes = []
+        if self.bottom_ordered:
+            while any(counts):
+                for class_index, count in enumerate(counts):
+                    if count:
+                        n_following = multinomial(self.take(counts, class_index))
+                        if (index < n_following):
+                            bottom_classes.append(class_index)
+                            counts = self.take(counts, class_index)
+                            break
+                        index -= n_following
+        return self.outcome(top_classes, bottom_classes)
+
+    def sample(self, rng=None):
+        '''\
+            Return an outcome drawn uniformly at random using rng (a random.Random), or
+            SAMPLING_RNG by default.
+        '''
+        rng = SAMPLING_RNG if (rng is None) else rng
+        return self[rng.randrange(len(self))]
+
+
+###################################################
+# Symmetry Reduction Over Interchangeable Objects #
+###################################################
+def interchangeable_classes(objects, key):
+    '''\
+        Partition objects into lists of interchangeable objects---those with equal, non-None
+        values of key(object)---in order of first appearance. An object whose key is None is
+        in a class of its own.
+    '''
+    classes = []
+    class_indices = {}
+    for position, obj in enumerate(objects):
+        object_key = key(obj)
+        if (object_key is None):
+            object_key = (None, position)
+        if not(object_key in class_indices):
+            class_indices[object_key] = len(classes)
+            classes.append([])
+        classes[class_indices[object_key]].append(obj)
+    return classes
+
+
+def bounded_compositions(total, bounds):
+    '''\
+        Generate the tuples of non-negative integers m with sum total and m[i] <= bounds[i],
+        in descending lexicographic order.
+    '''
+    if not(bounds):
+        if not(total):
+            yield ()
+        return
+    remaining_capacity = sum(bounds[1:])
+    for first in range(min(total, bounds[0]), max(0, total - remaining_capacity) - 1, -1):
+        for rest in bounded_compositions(total - first, bounds[1:]):
+            yield (first,) + rest
+
+
+class SymmetricSelectionSpace:
+    '''\
+        The selections of a SelectionSpace(x, n, N) up to exchanging interchangeable objects
+        (see interchangeable_classes). A selection is determined by how many objects it takes
+        from each class, so only one canonical selection per choice of counts is generated,
+        taking the first objects of each class.
+            Example
+                20 identical Saprolings and a Forest have 2^21 selections, but only 42
+                canonical selections.
+
+        len(space)              number of canonical selections
+        iter(space)             lazy iteration over canonical selections, by size
+        space.choices()         lazy iteration over their counts per class
+        space.selection(counts) the canonical selection with the given counts per class
+        space.weight(counts)    the number of selections it stands for
+    '''
+    __slots__ = ('classes', 'counts', 'sizes')
+
+    def __init__(self, x, n=1, N=None, key=None):
+        x = x if isinstance(x, list) else list(x)
+        self.classes = interchangeable_classes(x, (lambda obj: None) if (key is None) else key)
+        self.counts = tuple(len(objects_of_class) for objects_of_class in self.classes)
+        self.sizes = subpowerset_sizes(len(x), n, N)
+
+    def __len__(self):
+        # NOTE # Coefficients of the product over classes of (1 + t + ... + t^count).
+        coefficients = [1]
+        for count in self.counts:
+            convolved = [0] * (len(coefficients) + count)
+            for degree, coefficient in enumerate(coefficients):
+                for taken in range(count + 1):
+                    convolved[degree + taken] += coefficient
+            coefficients = convolved
+        return sum(coefficients[r] for r in self.sizes if (r < len(coefficients)))
+
+    def choices(self):
+        for r in self.sizes:
+            yield from bounded_compositions(r, self.counts)
+
+    def selection(self, counts):
+        return tuple(chain.from_iterable(objects_of_class[:taken] for objects_of_class, taken in zip(self.classes, counts)))
+
+    def weight(self, counts):
+        result = 1
+        for count, taken in zip(self.counts, counts):
+            result *= comb(count, taken)
+        return result
+
+    def __iter__(self):
+        return map(self.selection, self.choices())
+
+
+def symmetric_combinations_of_objects(size_of_combination, list_of_objects, key):
+    '''\
+        See: combinations_of_objects, but only return one combination per choice of how many
+        objects to take from each class of interchangeable objects.
+    '''
+    space = SymmetricSelectionSpace(list_of_objects, size_of_combination, size_of_combination, key=key)
+    return [list(selection) for selection in space]
+
+
+def symmetric_product_of_objects(list_of_sublist_of_objects, key, with_weights=False):
+    '''\
+        See: product_of_objects, but generate only one choice per orbit under exchanging
+        interchangeable objects. Objects are interchangeable if their keys are equal and they
+        belong to the same sublists. At each position a choice either repeats an object chosen
+        at an earlier position, or takes the first object of a class not chosen so far.
+        With with_weights, generate 2-tuples of a choice and the number of choices it stands for.
+    '''
+    all_objects = []
+    memberships = {}
+    for sublist_index, sublist_of_objects in enumerate(list_of_sublist_of_objects):
+        for obj in sublist_of_objects:
+            if not(id(obj) in memberships):
+                memberships[id(obj)] = set()
+                all_objects.append(obj)
+            memberships[id(obj)].add(sublist_index)
+    def signature(obj):
+        object_key = key(obj)
+        if (object_key is None):
+            return None
+        return (object_key, frozenset(memberships[id(obj)]))
+    classes = interchangeable_classes(all_objects, signature)
+    class_of = {id(obj): class_index for class_index, objects_of_class in enumerate(classes) for obj in objects_of_class}
+
+    n_positions = len(list_of_sublist_of_objects)
+    chosen = []
+    n_taken = [0] * len(classes)
+
+    def choose(position):
+        if (position == n_positions):
+            if with_weights:
+                weight = 1
+                for objects_of_class, taken in zip(classes, n_taken):
+                    weight *= factorial(len(objects_of_class)) // factorial(len(objects_of_class) - taken)
+                yield (list(chosen), weight)
+            else:
+                yield list(chosen)
+            return
+        members = set(id(obj) for obj in list_of_sublist_of_objects[position])
+        repeated = []
+        for obj in chosen:
+            if (id(obj) in members) and not(any((obj is other) for other in repeated)):
+                repeated.append(obj)
+        for obj in repeated:
+            chosen.append(obj)
+            yield from choose(position + 1)
+            chosen.pop()
+        for class_index, objects_of_class in enumerate(classes):
+            if (n_taken[class_index] < len(objects_of_class)) and (id(objects_of_class[0]) in members):
+                chosen.append(objects_of_class[n_taken[class_index]])
+                n_taken[class_index] += 1
+                yield from choose(position + 1)
+                n_taken[class_index] -= 1
+                chosen.pop()
+
+    return choose(0)
+
+
 def precon_subpowerset(x, set_of_cardinalities):
     '''\
         Generate the subset of the powerset of x where the elements are subsets with
@@ -794,6 +794,41 @@ def snapshot():
     FX_HANDLER.snapshot()
 
 
+def approximate_snapshot():
+    '''\
+        Derive the apparent state without solving for dependency; return the list of sublayers
+        in which a dependency could plausibly exist. See: EffectManager.approximate_snapshot
+    '''
+    return FX_HANDLER.approximate_snapshot()
+
+
+def query(objects, attributes):
+    '''\
+        Return a list with a dictionary mapping each of attributes to its apparent value for each
+        of objects, deriving only what they depend on. See: EffectManager.partial_snapshot
+    '''
+    FX_HANDLER.partial_snapshot(objects, attributes)
+    return [{attribute:getattr(obj, attribute) for attribute in attributes} for obj in objects]
+
+
+def what_if(objects, attributes, moves=(), removed_objects=(), added_effects=(), removed_effects=()):
+    '''\
+        Return what query(objects, attributes) would if each (object, zone) 2-tuple in moves were
+        moved, removed_objects ceased to exist and the effects were added or removed, leaving the
+        current state as it was. See: Hypothetical
+    '''
+    with Hypothetical() as hypothetical:
+        for game_object, dst_zone in moves:
+            hypothetical.move(game_object, dst_zone)
+        for game_object in removed_objects:
+            hypothetical.remove_object(game_object)
+        for effect in added_effects:
+            hypothetical.add_effect(effect)
+        for effect in removed_effects:
+            hypothetical.remove_effect(effect)
+        return hypothetical.query(objects, attributes)
+
+
 def set_to_string(set_of_strings):
     return " ".join(string.title() for string in set_of_strings)
 
@@ -1005,14 +1040,25 @@ class Morphable:
     '''\
         Mixin for use with Modifiable to handle Morph and the Sublayer 1b Continuous
         Effect that gets generated by the object being played face down.
+        # NOTE #
+        # The attributes this mixin uses are declared in Piece.__slots__, since only one
+        # base of a class may contribute a non-empty slot layout.
     '''
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.morph_effect_generator = MorphEffectGenerator(self)
-        self.morph_effect_generator.debug_string = "Morph Effect Generator of {}".format(self)
+        # NOTE #
+        # The MorphEffectGenerator is created the first time the object is turned face down,
+        # since most objects never are.
+        self.morph_effect_generator = None
+        self.morph_effect = None
 
     def turn_facedown(self):
         self.is_facedown = True
+        if (self.morph_effect_generator is None):
+            self.morph_effect_generator = MorphEffectGenerator(self)
+            self.morph_effect_generator.debug_string = "Morph Effect Generator of {}".format(self)
         morph_effect = self.morph_effect_generator.generate_effect()
         self.morph_effect = morph_effect
         GAME.list_of_immaterial_objects.append(morph_effect)
@@ -1024,11 +1070,13 @@ class Morphable:
 
 
 class Piece(Morphable, Modifiable):
+    __slots__ = ('morph_effect_generator', 'morph_effect')
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         # Automatically add ourselves to the state's list of game objects on
         # instantiation.
         GAME.list_of_game_objects.append(self)
         # Automatically provide ourselves with a reference to the GAME instance as our environment.
-        self.environment = GAME
+        self.environment = current_service(GAME)
         self.owner = self._controller
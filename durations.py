@@ -27,7 +27,7 @@ class EventHandler:
         if listener in self.listeners:
             self.listeners_to_remove.add(listener)
 
-EVENT_HANDLER = EventHandler()
+EVENT_HANDLER = engine_service('EVENT_HANDLER', EventHandler)
 
 
 class BoundaryEvent:
@@ -69,6 +69,7 @@ class BoundaryEventListener:
         self.active_player = None
         self.n_matches = 0
         self.n_to_match = n_to_match
+        self.event_handler = None
 
     def solve_active_player(self):
         self.active_player = self.reference_effect.reference_ability.host_object.controller
@@ -79,8 +80,9 @@ class BoundaryEventListener:
     def update_reference_effect(self, reference_effect):
         self.reference_effect = reference_effect
         self.solve_active_player()
-        # Now that references are synced, register with the event handler.
-        EVENT_HANDLER.register(self)
+        # Now that references are synced, register with the event handler of the current Engine.
+        self.event_handler = current_service(EVENT_HANDLER)
+        self.event_handler.register(self)
 
     def match(self, event):
         if (self.start == event.start):
@@ -99,7 +101,7 @@ class BoundaryEventListener:
         # Mark the effect for which we are the duration as expired
         setattr(self.reference_effect, 'expired', True)
         # Deregister ourselves from the event handler
-        EVENT_HANDLER.deregister(self)
+        self.event_handler.deregister(self)
 
     def clone(self, clone_type):
         return clone_type(start=self.start, epoch_type=self.epoch_type, n_to_match=self.n_to_match)
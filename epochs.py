@@ -7,6 +7,12 @@ class Game:
         Abbreviated form of the proof-of-concept engine supporting the game loop
         in the engine repository.
     '''
+    # NOTE # The lists of objects are the sources of selections, which tell whether they've
+    # changed by their versions; see VersionedList.
+    list_of_game_objects = VersionedListAttribute()
+    list_of_player_objects = VersionedListAttribute()
+    list_of_immaterial_objects = VersionedListAttribute()
+
     def __init__(self):
         self.current_player = None
         self.list_of_game_objects = list([])
@@ -18,6 +24,19 @@ class Game:
         self.n_extra_turns = 0
         self.limbo = list([])
 
+    def fork(self):
+        '''\
+            Return a copy for a forked Engine (see Engine.fork), with copies of the lists of
+            objects, so that objects can be added to or removed from the copies without changing
+            these. The objects themselves are shared.
+        '''
+        game = copy(self)
+        game.list_of_game_objects = list(self.list_of_game_objects)
+        game.list_of_player_objects = list(self.list_of_player_objects)
+        game.list_of_immaterial_objects = list(self.list_of_immaterial_objects)
+        game.limbo = list(self.limbo)
+        return game
+
     def registration(self):
         for player in self.players:
             player.environment = self
@@ -52,4 +71,4 @@ class Game:
     def broadcast_event(self, event):
         EVENT_HANDLER.broadcast_event(event)
 
-GAME = Game()
+GAME = engine_service('GAME', Game)
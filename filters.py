@@ -42,15 +42,120 @@ def partition_as_lists(predicate, iterable):
     return list(filter(predicate, t1)), list(filterfalse(predicate, t2))
 
 
+####################################
+# Binding Predicates For Selection #
+####################################
+# NOTE #
+# Conjunctions and Disjunctions instrument one in every ADAPTIVE_SAMPLE_PERIOD evaluation passes,
+# sampling one in every ADAPTIVE_SAMPLE_STRIDE objects tested during those passes; they need
+# ADAPTIVE_MIN_SAMPLES evaluations of a term before moving it, and halve their statistics
+# once any term has been evaluated more than ADAPTIVE_HISTORY_LIMIT times.
+ADAPTIVE_SAMPLE_PERIOD = 16
+ADAPTIVE_SAMPLE_STRIDE = 4
+ADAPTIVE_MIN_SAMPLES = 16
+ADAPTIVE_HISTORY_LIMIT = 4096
+
+def bind_operand(operand):
+    '''\
+        Return a zero-argument function which returns the value of operand for the current
+        evaluation pass. A Computable operand is computed at most once, the first time the
+        function is called, matching the lazy evaluation of @dynamic ref_val under
+        short-circuiting.
+    '''
+    if not(isinstance(operand, Computable)):
+        return lambda: operand
+    cache = []
+    def bound_operand():
+        if not(cache):
+            cache.append(operand.compute())
+        return cache[0]
+    return bound_operand
+
+
+def bind_predicate(predicate):
+    '''\
+        Return a one-argument function equivalent to predicate.value_test for the current
+        evaluation pass; see Bindable.
+    '''
+    bind = getattr(predicate, 'bind', None)
+    if (bind is None):
+        return predicate.value_test
+    return bind()
+
+
+def traced_predicate(predicate):
+    '''\
+        Return bind_predicate(predicate), wrapped so that, during a trace (see ReadTracer),
+        the attributes in predicate.read_attributes() which tested objects have, but which
+        aren't read through a Characteristic or IndexedAttribute (e.g., a player's life total),
+        are recorded as read. Those that are, record their own reads.
+    '''
+    test = bind_predicate(predicate)
+    read_attributes = getattr(predicate, 'read_attributes', None)
+    read_attributes = None if (read_attributes is None) else read_attributes()
+    if not(read_attributes):
+        return test
+    note = READ_TRACER.note
+    def traced_test(value):
+        for attribute in read_attributes:
+            if not(isinstance(getattr(type(value), attribute, None), (Characteristic, IndexedAttribute))):
+                if hasattr(value, attribute):
+                    note(value, attribute)
+        return test(value)
+    return traced_test
+
+
+def negate(test):
+    return lambda value: not(test(value))
+
+
+class Bindable:
+    '''\
+        Mixin for predicates which can be compiled into a specialised one-argument function,
+        via bind(), for use over a single evaluation pass, e.g., one call to
+        Selection_.selectable_objects(). Static operands are folded into the function, and
+        dynamic (Computable) operands are computed at most once per pass rather than once
+        per tested object. bind() must return the same results as value_test().
+        # NOTE #
+        A subclass which over-rides value_test() without also over-riding bind() falls back
+        to binding value_test() itself, so that an inherited bind() never disagrees with it.
+    '''
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if ('value_test' in cls.__dict__) and not('bind' in cls.__dict__):
+            cls.bind = Bindable.bind
+            cls.read_attributes = Bindable.read_attributes
+
+    def bind(self):
+        return self.value_test
+
+    def read_attributes(self):
+        '''\
+            Return the set of names of the attributes of tested objects which value_test() reads,
+            or None if they aren't known.
+        '''
+        return None
+
+    def dynamic_operands(self):
+        '''\
+            Return a list of the Computable operands which value_test() resolves.
+        '''
+        return []
+
+
 ###################################
 # Classes For Encoding Predicates #
 ###################################
-class P:
+class P(Bindable):
     '''\
         A predicate with a value_test(object) method that returns a boolean resulting from
         self.op(getattr(object, self.ref_attr), self.ref_val), where self.ref_val can be
         a dynamic value computed at test time.
     '''
+    __slots__ = ('ref_attr', 'op', '_ref_val')
+
     def __init__(self, ref_attr, op, ref_val):
         self.ref_attr = ref_attr
         self.op = op
@@ -63,34 +168,75 @@ class P:
     def value_test(self, object):
         return self.op(getattr(object, self.ref_attr), self.ref_val)
 
+    def bind(self):
+        op = self.op
+        ref_attr = self.ref_attr
+        if not(isinstance(self._ref_val, Computable)):
+            ref_val = self._ref_val
+            return lambda value: op(getattr(value, ref_attr), ref_val)
+        get_ref_val = bind_operand(self._ref_val)
+        return lambda value: op(getattr(value, ref_attr), get_ref_val())
+
+    def read_attributes(self):
+        return {self.ref_attr}
+
+    def dynamic_operands(self):
+        if isinstance(self._ref_val, Computable):
+            return [self._ref_val]
+        return []
+
 
 class inP(P):
     '''\
         Test for the presence of a value in an iterable attribute of a reference object.
         Not to be confused with typeinP.
+        # NOTE #
+        When the attribute is one of TYPESET_CHARX and the value is a fixed word, the test
+        is a single bitwise operation against the word's bit in TYPE_VOCABULARY.
     '''
+    __slots__ = ('bit',)
+
     def __init__(self, iterable_ref_attr, contained_ref_val):
         super().__init__(ref_attr=iterable_ref_attr, op=contains, ref_val=contained_ref_val)
+        self.bit = 0
+        if ((iterable_ref_attr in TYPESET_CHARX) and isinstance(contained_ref_val, str)):
+            self.bit = TYPE_VOCABULARY.intern(contained_ref_val)
 
     def value_test(self, object):
         # NOTE #
         # Over-rides P.value_test() to avoid the need for LHS argument in P (majority of Predicates).
+        if self.bit:
+            return bool(getattr(object, self.ref_attr).bits & self.bit)
         return self.op(getattr(object, self.ref_attr), self.ref_val)
 
+    def bind(self):
+        if self.bit:
+            ref_attr = self.ref_attr
+            bit = self.bit
+            return lambda value: bool(getattr(value, ref_attr).bits & bit)
+        return super().bind()
+
 
 class notinP(inP):
     '''\
         Test for the absence of a value in an iterable attribute of a reference object.
     '''
+    __slots__ = ()
+
     def value_test(self, value):
         return not(super().value_test(value))
 
+    def bind(self):
+        return negate(super().bind())
+
 
 class typeinP(P):
     '''\
         Test for the presence of a value of a specified type in an iterable attribute of a reference object.
         Not to be confused with inP.
     '''
+    __slots__ = ('iterable_reference_attribute', 'reference_type')
+
     def __init__(self, iterable_reference_attribute, reference_type):
         self.iterable_reference_attribute = iterable_reference_attribute
         self.reference_type = reference_type
@@ -98,21 +244,44 @@ class typeinP(P):
     def value_test(self, object):
         return any(isinstance(value, self.reference_type) for value in getattr(object, self.iterable_reference_attribute))
 
+    def bind(self):
+        iterable_reference_attribute = self.iterable_reference_attribute
+        reference_type = self.reference_type
+        def bound_typeinP(object):
+            for value in getattr(object, iterable_reference_attribute):
+                if isinstance(value, reference_type):
+                    return True
+            return False
+        return bound_typeinP
+
+    def read_attributes(self):
+        return {self.iterable_reference_attribute}
+
+    def dynamic_operands(self):
+        return []
+
 
 class typenotinP(typeinP):
     '''\
         Test for the absence of a value of a specified type in an iterable attribute of a reference object.
         Not to be confused with notinP.
     '''
+    __slots__ = ()
+
     def value_test(self, object):
         return not(super().value_test(object))
 
+    def bind(self):
+        return negate(super().bind())
+
 
 class idP(P):
     '''\
         Implement an identity predicate.
         value_test(self, object) ---> True, so long as object isn't None.
     '''
+    __slots__ = ()
+
     def __init__(self):
         pass
 
@@ -123,6 +292,15 @@ class idP(P):
     def value_test(self, test_object):
         return not(test_object is None)
 
+    def bind(self):
+        return lambda test_object: not(test_object is None)
+
+    def read_attributes(self):
+        return set()
+
+    def dynamic_operands(self):
+        return []
+
 
 class identifyP(idP):
     '''\
@@ -134,6 +312,8 @@ class identifyP(idP):
         # NOTE #
         Not to be confused with (object.ref_attr is ref_val), provided by isP.
     '''
+    __slots__ = ()
+
     def __init__(self, ref_val):
         self._ref_val = ref_val
 
@@ -144,6 +324,12 @@ class identifyP(idP):
     def value_test(self, test_object):
         return (test_object is self.ref_val)
 
+    def bind(self):
+        get_ref_val = bind_operand(self._ref_val)
+        return lambda test_object: (test_object is get_ref_val())
+
+    dynamic_operands = P.dynamic_operands
+
 
 class excludeP(identifyP):
     '''\
@@ -153,9 +339,14 @@ class excludeP(identifyP):
         as its source_set will return the singleton list containing the PlayerObject instance
         who is the non_active_player at test time (assuming a game with 2 players).
     '''
+    __slots__ = ()
+
     def value_test(self, test_object):
         return not(super().value_test(test_object))
 
+    def bind(self):
+        return negate(super().bind())
+
 
 class anyP(idP):
     '''\
@@ -166,6 +357,8 @@ class anyP(idP):
             value_test(self, test_object) returns True if, for at least one object in self.ref_val,
             self.ref_val[i], comparison_value is self.ref_val[i]        
     '''
+    __slots__ = ()
+
     def __init__(self, ref_attr, ref_val):
         # NOTE #
         # ref_val is an iterable of objects that test_object.ref_attr may or may not be identified
@@ -184,14 +377,28 @@ class anyP(idP):
                 return True
         return False
 
+    def bind(self):
+        # NOTE # Identity membership, so compare ids rather than relying on __eq__/__hash__.
+        ref_attr = self.ref_attr
+        get_candidate_ids = bind_operand(ComputeWrapper(lambda: {id(candidate) for candidate in self.ref_val}))
+        return lambda test_object: (id(getattr(test_object, ref_attr)) in get_candidate_ids())
+
+    read_attributes = P.read_attributes
+    dynamic_operands = P.dynamic_operands
+
 
 class notanyP(anyP):
     '''\
         Opposite of anyP.
     '''
+    __slots__ = ()
+
     def value_test(self, test_object):
         return not(super().value_test(test_object))
 
+    def bind(self):
+        return negate(super().bind())
+
 
 class differentP(identifyP):
     '''\
@@ -199,30 +406,46 @@ class differentP(identifyP):
         # NOTE #
         Not to be confused with not(object.ref_attr is ref_val), provided by isnotP.
     '''
+    __slots__ = ()
+
     def value_test(self, test_object):
         return not(super().value_test(test_object))
 
+    def bind(self):
+        return negate(super().bind())
+
 
 class eqP(P):
     ''' object.ref_attr == ref_val '''
+    __slots__ = ()
+
     def __init__(self, ref_attr, ref_val, **kwargs):
         super().__init__(ref_attr, eq, ref_val, **kwargs)
 
 
 class notP(eqP):
     ''' object.ref_attr != ref_val '''
+    __slots__ = ()
+
     def value_test(self, value):
         return not(super().value_test(value))
 
+    def bind(self):
+        return negate(super().bind())
+
 
 class lteP(P):
     ''' object.ref_attr <= ref_val '''
+    __slots__ = ()
+
     def __init__(self, ref_attr, ref_val, **kwargs):
         super().__init__(ref_attr, le, ref_val, **kwargs)
 
 
 class gteP(P):
     ''' object.ref_attr >= ref_val '''
+    __slots__ = ()
+
     def __init__(self, ref_attr, ref_val, **kwargs):
         super().__init__(ref_attr, ge, ref_val, **kwargs)
 
@@ -234,6 +457,8 @@ class lifetotalP(gteP):
 
         object.lifetotal >= ref_val
     '''
+    __slots__ = ()
+
     def __init__(self, ref_val, **kwargs):
         super().__init__(ref_attr='lifetotal', ref_val=ref_val, **kwargs)
 
@@ -244,6 +469,8 @@ class isP(P):
         # NOTE #
         Not to be confused with: object is ref_val, provided by identifyP.
     '''
+    __slots__ = ()
+
     def __init__(self, ref_attr, ref_val, **kwargs):
         super().__init__(ref_attr, is_, ref_val, **kwargs)
 
@@ -254,22 +481,36 @@ class isnotP(isP):
         # NOTE #
         Not to be confused with: not(object is ref_val), provided by differentP.
     '''
+    __slots__ = ()
+
     def value_test(self, value):
         return not(super().value_test(value))
 
+    def bind(self):
+        return negate(super().bind())
+
 
-class typeP:
+class typeP(Bindable):
     '''\
         isinstance(object, self.ref_type)
         # NOTE #
         Not to be confused with: isinstance(object.ref_attr, ref_val), provided by exactinstP.
     '''
+    __slots__ = ('ref_type',)
+
     def __init__(self, ref_type):
         self.ref_type = ref_type
 
     def value_test(self, value):
         return isinstance(value, self.ref_type)
 
+    def bind(self):
+        ref_type = self.ref_type
+        return lambda value: isinstance(value, ref_type)
+
+    def read_attributes(self):
+        return set()
+
 
 class typenotP(typeP):
     '''\
@@ -277,9 +518,14 @@ class typenotP(typeP):
         # NOTE #
         Not to be confusd with: not(isinstance(object.ref_attr, ref_val)), provided by notexactinstP.
     '''
+    __slots__ = ()
+
     def value_test(self, value):
         return not(super().value_test(value))
 
+    def bind(self):
+        return negate(super().bind())
+
 
 class exactinstP(P):
     '''\
@@ -287,6 +533,8 @@ class exactinstP(P):
         # NOTE #
         Not to be confused with isinstance(object, ref_val), provided by typeP.
     '''
+    __slots__ = ()
+
     def __init__(self, ref_attr, ref_val, **kwargs):
         super().__init__(ref_attr, isinstance, ref_val, **kwargs)
 
@@ -297,15 +545,22 @@ class notexactinstP(exactinstP):
         # NOTE #
         Not to be confused with not(isinstance(object, ref_val)), provided by typenotP.
     '''
+    __slots__ = ()
+
     def value_test(self, value):
         return not(super().value_test(value))
 
+    def bind(self):
+        return negate(super().bind())
+
 
 class anyinstP(P):
     '''\
         Returns true if isinstance(object.ref_attr, ref_val_i) for >= 1
         ref_val_i in self.ref_val <Iterable of Types>.
     '''
+    __slots__ = ()
+
     def __init__(self, ref_attr, ref_val, **kwargs):
         super().__init__(ref_attr, isinstance, ref_val, **kwargs)
 
@@ -316,21 +571,223 @@ class anyinstP(P):
                 return True
         return False
 
+    def bind(self):
+        ref_attr = self.ref_attr
+        get_acceptable_types = bind_operand(ComputeWrapper(lambda: tuple(self.ref_val)))
+        return lambda value: isinstance(getattr(value, ref_attr), get_acceptable_types())
+
 
 class notanyinstP(anyinstP):
     '''\
         Returns true if object.ref_attr is not an instance of any of the ref_val_i types
         in self.ref_val <Iterable of Types>.
     '''
+    __slots__ = ()
+
     def value_test(self, value):
         return not(super().value_test(value))
 
+    def bind(self):
+        return negate(super().bind())
 
-class Conjunction:
+
+class PredicateStatistics:
+    '''\
+        Sampled pass-rate and cost statistics for the terms of a bound Conjunction or
+        Disjunction, used to reorder the terms for the best short-circuit behaviour.
+
+        Every ADAPTIVE_SAMPLE_PERIOD-th evaluation pass is instrumented: for every
+        ADAPTIVE_SAMPLE_STRIDE-th object, each unpinned term is evaluated whether or not the
+        result was already decided, and its outcome and elapsed time are recorded. Before the next pass, the unpinned terms are
+        sorted by expected cost per decisive outcome:
+            Conjunction:    cost / (1 - pass_rate)      (decisive outcome == False)
+            Disjunction:    cost / pass_rate            (decisive outcome == True)
+        Terms without enough samples keep their relative position at the end.
+
+        The leading n_pinned terms are guards, e.g., typeP(Modifiable), which other terms may
+        rely on, and are never moved. Other guards, e.g., isnotP('enchanted_object', None), can't
+        be told apart from ordinary terms, so if any evaluation out of declaration order raises,
+        the terms return to declaration order for good (see abandon()), and the value is tested
+        again in that order; reordering never raises where declaration order wouldn't.
+    '''
+    __slots__ = ('n_terms', 'n_pinned', 'decisive_outcome', 'order', 'evaluations', 'decisions',
+                 'nanoseconds', 'n_passes', 'stale', 'enabled')
+
+    def __init__(self, n_terms, n_pinned, decisive_outcome):
+        self.n_terms = n_terms
+        self.n_pinned = n_pinned
+        self.decisive_outcome = decisive_outcome
+        self.order = tuple(range(n_terms))
+        self.evaluations = [0] * n_terms
+        self.decisions = [0] * n_terms
+        self.nanoseconds = [0] * n_terms
+        self.n_passes = 0
+        self.stale = False
+        self.enabled = True
+
+    def due_for_sample(self):
+        self.n_passes += 1
+        return self.enabled and (self.n_passes % ADAPTIVE_SAMPLE_PERIOD == 1)
+
+    def expected_cost(self, term_idx):
+        evaluations = self.evaluations[term_idx]
+        if (evaluations < ADAPTIVE_MIN_SAMPLES):
+            return float('inf')
+        decision_rate = self.decisions[term_idx] / evaluations
+        if not(decision_rate):
+            return float('inf')
+        return self.nanoseconds[term_idx] / evaluations / decision_rate
+
+    def reordered(self):
+        return self.order != tuple(range(self.n_terms))
+
+    def abandon(self):
+        '''\
+            Return to declaration order, and stop sampling and reordering, for good.
+        '''
+        self.enabled = False
+        self.stale = False
+        self.order = tuple(range(self.n_terms))
+
+    def reorder(self):
+        if self.stale and self.enabled:
+            self.stale = False
+            unpinned = sorted(range(self.n_pinned, self.n_terms), key=self.expected_cost)
+            self.order = tuple(range(self.n_pinned)) + tuple(unpinned)
+            # NOTE #
+            # Halve the statistics once they are large, so that they track drift in the
+            # composition of the objects being tested.
+            if (max(self.evaluations) > ADAPTIVE_HISTORY_LIMIT):
+                for term_idx in range(self.n_terms):
+                    self.evaluations[term_idx] >>= 1
+                    self.decisions[term_idx] >>= 1
+                    self.nanoseconds[term_idx] >>= 1
+
+    def guard(self, test, declared_tests):
+        '''\
+            Return a one-argument function which evaluates test, the junction of the bound terms
+            in self.order; if it raises, abandon reordering and evaluate declared_tests, the bound
+            terms in declaration order, instead.
+        '''
+        evaluate_declared = short_circuit(declared_tests, self.decisive_outcome)
+        def guarded(value):
+            try:
+                return test(value)
+            except Exception:
+                self.abandon()
+                return evaluate_declared(value)
+        return guarded
+
+    def instrument(self, tests, declared_tests):
+        '''\
+            Return a one-argument function which evaluates tests, a tuple of bound terms in
+            self.order, recording statistics, and returning the same result as short-circuit
+            evaluation in that order; guarded as in guard().
+        '''
+        decisive_outcome = self.decisive_outcome
+        n_pinned = self.n_pinned
+        term_indices = self.order
+        evaluations = self.evaluations
+        decisions = self.decisions
+        nanoseconds = self.nanoseconds
+        clock = perf_counter_ns
+        n_tests = len(tests)
+        n_tested = [0]
+        self.stale = True
+
+        def instrumented(value):
+            n_tested[0] += 1
+            if (n_tested[0] % ADAPTIVE_SAMPLE_STRIDE):
+                for test in tests:
+                    if (bool(test(value)) is decisive_outcome):
+                        return decisive_outcome
+                return not(decisive_outcome)
+            for position in range(n_pinned):
+                if (bool(tests[position](value)) is decisive_outcome):
+                    return decisive_outcome
+            decided = False
+            for position in range(n_pinned, n_tests):
+                term_idx = term_indices[position]
+                start = clock()
+                outcome = bool(tests[position](value))
+                nanoseconds[term_idx] += clock() - start
+                evaluations[term_idx] += 1
+                if (outcome is decisive_outcome):
+                    decisions[term_idx] += 1
+                    decided = True
+            return decisive_outcome if decided else not(decisive_outcome)
+        return self.guard(instrumented, declared_tests)
+
+
+def short_circuit(tests, decisive_outcome):
+    '''\
+        Return a one-argument function which evaluates tests in order, returning
+        decisive_outcome as soon as any test does.
+    '''
+    def evaluate(value):
+        for test in tests:
+            if (bool(test(value)) is decisive_outcome):
+                return decisive_outcome
+        return not(decisive_outcome)
+    return evaluate
+
+
+def n_leading_guards(predicates):
+    n_guards = 0
+    for predicate in predicates:
+        if not(isinstance(predicate, typeP)):
+            break
+        n_guards += 1
+    return n_guards
+
+
+def junction_read_attributes(predicates):
+    result = set()
+    for predicate in predicates:
+        read_attributes = getattr(predicate, 'read_attributes', None)
+        predicate_read_attributes = None if (read_attributes is None) else read_attributes()
+        if (predicate_read_attributes is None):
+            return None
+        result |= predicate_read_attributes
+    return result
+
+
+def junction_dynamic_operands(predicates):
+    result = []
+    for predicate in predicates:
+        result.extend(predicate.dynamic_operands())
+    return result
+
+
+def adapted_statistics(junction, predicates, decisive_outcome):
+    '''\
+        Return the PredicateStatistics of a Conjunction or Disjunction, reordered according
+        to the latest sample, creating (or resetting, if the flattened predicates have changed)
+        them as necessary; or None if there are fewer than two terms which may be reordered.
+    '''
+    n_terms = len(predicates)
+    n_pinned = n_leading_guards(predicates) if not(decisive_outcome) else 0
+    if ((n_terms - n_pinned) < 2):
+        return None
+    statistics = junction.statistics
+    if (statistics is None) or (statistics.n_terms != n_terms):
+        statistics = PredicateStatistics(n_terms, n_pinned, decisive_outcome)
+        junction.statistics = statistics
+    statistics.reorder()
+    return statistics
+
+
+class Conjunction(Bindable):
     '''\
         Support conjunctive composition of arbitrary predicates.
         Return True only if ALL of the constituent predicates return True.
+        # NOTE #
+        bind() evaluates the flattened constituent predicates in an order adapted to their
+        measured pass rates and costs; see PredicateStatistics. value_test() always uses
+        declaration order.
     '''
+    __slots__ = ('predicates', 'statistics')
+
     def __init__(self, *predicates):
         source_predicates = list(predicates)
         temp_predicates = []
@@ -340,18 +797,63 @@ class Conjunction:
             else:
                 temp_predicates.append(predicate)
         self.predicates = list(temp_predicates)
+        self.statistics = None
 
     def value_test(self, value):
         return all(predicate.value_test(value) for predicate in self.predicates)
 
+    def read_attributes(self):
+        return junction_read_attributes(self.predicates)
+
+    def dynamic_operands(self):
+        return junction_dynamic_operands(self.predicates)
+
+    def flattened_predicates(self):
+        '''\
+            Yield the constituent predicates, replacing nested Conjunctions by their own
+            constituent predicates, recursively.
+        '''
+        for predicate in self.predicates:
+            if (type(predicate) is Conjunction):
+                yield from predicate.flattened_predicates()
+            else:
+                yield predicate
+
+    def bind(self):
+        predicates = list(self.flattened_predicates())
+        statistics = adapted_statistics(self, predicates, decisive_outcome=False)
+        declared_tests = tuple(bind_predicate(predicate) for predicate in predicates)
+        tests = declared_tests
+        if (statistics is not None) and statistics.reordered():
+            tests = tuple(declared_tests[term_idx] for term_idx in statistics.order)
+        if (statistics is not None) and statistics.due_for_sample():
+            return statistics.instrument(tests, declared_tests)
+        if (len(tests) == 1):
+            test = tests[0]
+            return lambda value: bool(test(value))
+        def bound_conjunction(value):
+            for test in tests:
+                if not(test(value)):
+                    return False
+            return True
+        if (tests is declared_tests):
+            return bound_conjunction
+        return statistics.guard(bound_conjunction, declared_tests)
+
 CONJ = Conjunction
 
 
-class Disjunction:
+class Disjunction(Bindable):
     '''\
         Support disjunctive composition of arbitrary predicates.
         Return True only if AT LEAST ONE of the constituent predicates returns True.
+        # NOTE #
+        bind() evaluates the flattened constituent predicates in an order adapted to their
+        measured pass rates and costs; see PredicateStatistics. value_test() always uses
+        declaration order.
     '''
+    __slots__ = ('predicates', 'statistics')
+
     def __init__(self, *predicates):
         source_predicates = list(predicates)
         temp_predicates = []
@@ -361,13 +863,563 @@ class Disjunction:
             else:
                 temp_predicates.append(predicate)
         self.predicates = list(temp_predicates)
+        self.statistics = None
 
     def value_test(self, value):
         return any(predicate.value_test(value) for predicate in self.predicates)
 
+    def read_attributes(self):
+        return junction_read_attributes(self.predicates)
+
+    def dynamic_operands(self):
+        return junction_dynamic_operands(self.predicates)
+
+    def flattened_predicates(self):
+        '''\
+            Yield the constituent predicates, replacing nested Disjunctions by their own
+            constituent predicates, recursively.
+        '''
+        for predicate in self.predicates:
+            if (type(predicate) is Disjunction):
+                yield from predicate.flattened_predicates()
+            else:
+                yield predicate
+
+    def bind(self):
+        predicates = list(self.flattened_predicates())
+        statistics = adapted_statistics(self, predicates, decisive_outcome=True)
+        declared_tests = tuple(bind_predicate(predicate) for predicate in predicates)
+        tests = declared_tests
+        if (statistics is not None) and statistics.reordered():
+            tests = tuple(declared_tests[term_idx] for term_idx in statistics.order)
+        if (statistics is not None) and statistics.due_for_sample():
+            return statistics.instrument(tests, declared_tests)
+        if (len(tests) == 1):
+            test = tests[0]
+            return lambda value: bool(test(value))
+        def bound_disjunction(value):
+            for test in tests:
+                if test(value):
+                    return True
+            return False
+        if (tests is declared_tests):
+            return bound_disjunction
+        return statistics.guard(bound_disjunction, declared_tests)
+
 DISJ = Disjunction
 
 
+####################################
+# Planning Selections With Indexes #
+####################################
+def indexed_candidates(term, object_index, apparent_state):
+    '''\
+        Return the set of object_ids of the game objects which may satisfy term according to
+        object_index and apparent_state, the OBJECT_INDEX and APPARENT_X of the current Engine,
+        or None if term can't be answered by an index.
+        Exact type checks, since negated predicates subclass the affirmative ones.
+    '''
+    term_type = type(term)
+    if (term_type is exactinstP):
+        if (term.ref_attr == 'current_zone') and isinstance(term.ref_val, type):
+            return object_index.lookup_subclasses('current_zone', term.ref_val)
+    elif (term_type is isP):
+        if (term.ref_attr == 'owner'):
+            return object_index.lookup('owner', id(term.ref_val))
+        if (term.ref_attr == 'controller'):
+            return object_index.lookup('controller', id(term.ref_val)) | apparent_state.overlaid('controller')
+    elif (term_type is inP):
+        if (term.ref_attr == 'object_types') and isinstance(term._ref_val, str):
+            return object_index.lookup('object_types', term._ref_val)
+        if (term.ref_attr == 'card_types') and isinstance(term._ref_val, str):
+            return object_index.lookup('card_types', term._ref_val) | apparent_state.overlaid('card_types')
+    return None
+
+
+def plan_selection(source_set, predicate):
+    '''\
+        Return the objects of source_set which may satisfy predicate, in source order, using
+        OBJECT_INDEX to avoid a full scan; or None if the selection has to scan source_set.
+
+        Applies when source_set is LINKS.game_objects or LINKS.mutable_objects, and predicate is
+        a conjunction (or a disjunction of conjunctions) with at least one indexed term, e.g.,
+            CONJ(FIND.game_object_identity, FIND.creature, FIND.zone_battlefield, isP('controller', ...))
+        starts from the smallest of the candidate sets of its indexed terms. When source_set is
+        LINKS.mutable_objects, every conjunction must start with FIND.game_object_identity or
+        FIND.player_object_identity, so that it's known which objects it can match.
+    '''
+    links = current_service(LINKS)
+    if (source_set is links.game_objects):
+        guards_required = False
+    elif (source_set is links.mutable_objects):
+        guards_required = True
+    else:
+        return None
+
+    game = current_service(GAME)
+    object_index = current_service(OBJECT_INDEX)
+    apparent_state = current_service(APPARENT_X)
+    if not(object_index.sync(game.list_of_game_objects)):
+        return None
+
+    if (type(predicate) is Disjunction):
+        branches = list(predicate.flattened_predicates())
+    else:
+        branches = [predicate]
+
+    include_players = False
+    candidate_ids = set()
+    try:
+        for branch in branches:
+            if (type(branch) is Conjunction):
+                terms = list(branch.flattened_predicates())
+            else:
+                terms = [branch]
+            guard_type = terms[0].ref_type if (terms and (type(terms[0]) is typeP)) else None
+            if (guard_type is ExpandedPlayerObject):
+                include_players = guards_required
+                continue
+            if guards_required and not(guard_type is Modifiable):
+                return None
+            smallest = None
+            for term in terms:
+                term_candidates = indexed_candidates(term, object_index, apparent_state)
+                if (term_candidates is not None):
+                    if (smallest is None) or (len(term_candidates) < len(smallest)):
+                        smallest = term_candidates
+            if (smallest is None):
+                return None
+            candidate_ids |= smallest
+    except Exception:
+        # NOTE # Leave it to the full scan to evaluate (or fail to evaluate) dynamic operands.
+        return None
+
+    candidates = object_index.ordered(candidate_ids)
+    if include_players:
+        return list(game.list_of_player_objects) + candidates
+    return candidates
+
+
+# NOTE #
+# The attributes whose every change bumps APPARENT_X.versions: the characteristics (via
+# modify_attribute_value, load_state and calibrate) and the IndexedAttributes of Modifiable.
+VERSIONED_ATTRIBUTES = frozenset(CHARX) | frozenset(ObjectIndex.INDEX_KEYS)
+
+
+class Identity:
+    '''\
+        Key component which is equal to another only if they wrap the same object.
+        Keeps the object alive, so that its id can't be reused while the key exists.
+    '''
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return isinstance(other, Identity) and (self.value is other.value)
+
+    def __hash__(self):
+        return id(self.value)
+
+
+def operand_key(value):
+    if isinstance(value, bool):
+        # NOTE # Keep True and False apart from 1 and 0, which they're equal to.
+        return Identity(value)
+    if isinstance(value, (int, str, TypeSet, frozenset)) or (value is None):
+        return value
+    if isinstance(value, (list, tuple, set)):
+        return tuple(operand_key(element) for element in value)
+    return Identity(value)
+
+
+def selection_source_key(source_set):
+    '''\
+        Identify the contents of the persistent lists behind source_set by the identity and the
+        version of each list, in O(1); None for other sources.
+        # NOTE #
+        The lists are mutated in place, e.g., by removing one object and appending another, so
+        neither their identity nor their length identifies their contents; but they're
+        VersionedLists, which draw a new version, unique across every list, on each change.
+    '''
+    links = current_service(LINKS)
+    game = current_service(GAME)
+    if (source_set is links.game_objects):
+        source_lists = [game.list_of_game_objects]
+    elif (source_set is links.mutable_objects):
+        source_lists = [game.list_of_player_objects, game.list_of_game_objects]
+    elif (source_set is links.player_objects):
+        source_lists = [game.list_of_player_objects]
+    else:
+        return None
+    return tuple((id(source_list), source_list.version) for source_list in source_lists)
+
+
+########################
+# Canonical Predicates #
+########################
+# NOTE # Stands in for a Computable operand in the shape of a predicate; see predicate_key.
+DYNAMIC_OPERAND = 'DYNAMIC_OPERAND'
+PREDICATE_TABLE_LIMIT = 4096
+RESULT_CACHE_LIMIT = 1024
+# NOTE # Maps each predicate type to the result of predicate_fields.
+PREDICATE_FIELDS = {}
+
+
+def predicate_fields(predicate_type):
+    '''\
+        Return the names of the slots which define predicates of predicate_type; i.e., all
+        of its slots except the scratch statistics slot of junctions.
+    '''
+    fields = PREDICATE_FIELDS.get(predicate_type)
+    if (fields is None):
+        fields = []
+        for cls in reversed(predicate_type.__mro__):
+            for field in cls.__dict__.get('__slots__', ()):
+                if not(field in fields) and not(field == 'statistics'):
+                    fields.append(field)
+        fields = PREDICATE_FIELDS[predicate_type] = tuple(fields)
+    return fields
+
+
+def predicate_key(value, dynamic_key):
+    '''\
+        Return a hashable key for the structure of a predicate (or one of its operands) in which
+        each Computable operand is replaced by dynamic_key(operand), e.g.,
+            predicate_key(isP('controller', p0), Identity)
+                == (isP, ('controller', Identity(is_), Identity(p0), None))
+    '''
+    if isinstance(value, Bindable):
+        predicate_type = type(value)
+        fields = tuple(predicate_key(getattr(value, field, None), dynamic_key) for field in predicate_fields(predicate_type))
+        extra = getattr(value, '__dict__', None)
+        if extra:
+            fields += tuple((name, predicate_key(extra[name], dynamic_key)) for name in sorted(extra))
+        return (predicate_type, fields)
+    if isinstance(value, Computable):
+        return dynamic_key(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(predicate_key(element, dynamic_key) for element in value)
+    return operand_key(value)
+
+
+class PredicateTable:
+    '''\
+        Hash-consing for predicates, so that structurally identical predicate trees (e.g., those
+        generated by each copy of a card) are represented by a single shared instance, and a
+        cache of selection results shared by predicates with the same shape.
+
+            predicates      structural key -> canonical predicate, where Computable operands
+                            are only equal to themselves
+            shapes          id(canonical predicate) -> (canonical predicate, shape), where the
+                            shape of a predicate is its structural key with each of its
+                            dynamic operands replaced by DYNAMIC_OPERAND
+            results         (shape, selection key) -> selectable objects; see Selection_
+
+        Predicates with the same shape and the same values of their dynamic operands select the
+        same objects, so Selection_.selectable_objects() shares results between them, e.g., the
+        effects of every "Artifact creatures you control get +1/+1" controlled by the same player
+        select their objects once per state.
+
+            aggregates      (shape, dynamic operand values, attribute) -> SelectionAggregate
+
+        For the same reason, the counts and totals maintained for selections are registered
+        here rather than with each Selection_, so that a Selection_ created anew for each
+        snapshot, e.g., by a characteristic-defining ability, carries on maintaining the
+        aggregate left by the one before it.
+
+        The tables are cleared when they outgrow PREDICATE_TABLE_LIMIT and RESULT_CACHE_LIMIT.
+    '''
+    def __init__(self):
+        self.predicates = {}
+        self.shapes = {}
+        self.results = {}
+        self.aggregates = {}
+
+    def canonical(self, predicate):
+        '''\
+            Return the canonical instance of predicate. Nested junctions of the same type are
+            flattened and repeated constituent predicates dropped, in declaration order.
+        '''
+        entry = self.shapes.get(id(predicate))
+        if (entry is not None) and (entry[0] is predicate):
+            return predicate
+        if not(isinstance(predicate, Bindable)):
+            return predicate
+        if (type(predicate) in (Conjunction, Disjunction)):
+            constituents = []
+            for constituent in predicate.flattened_predicates():
+                constituent = self.canonical(constituent)
+                if not(any((constituent is included) for included in constituents)):
+                    constituents.append(constituent)
+            predicate = type(predicate)(*constituents)
+        key = predicate_key(predicate, Identity)
+        canonical_predicate = self.predicates.get(key)
+        if (canonical_predicate is not None):
+            return canonical_predicate
+        if (len(self.predicates) >= PREDICATE_TABLE_LIMIT):
+            self.predicates.clear()
+            self.shapes.clear()
+        self.predicates[key] = predicate
+        self.shapes[id(predicate)] = (predicate, self.compute_shape(predicate))
+        return predicate
+
+    def compute_shape(self, predicate):
+        '''\
+            Only the operands reported by dynamic_operands() are resolved to their values by
+            Selection_.selection_key(), so any other Computable operand keeps its identity.
+        '''
+        dynamic_ids = set(id(operand) for operand in predicate.dynamic_operands())
+        def dynamic_key(operand):
+            if (id(operand) in dynamic_ids):
+                return DYNAMIC_OPERAND
+            return Identity(operand)
+        return predicate_key(predicate, dynamic_key)
+
+    def shape(self, predicate):
+        '''\
+            Return the shape of predicate if it's canonical, otherwise None.
+        '''
+        entry = self.shapes.get(id(predicate))
+        if (entry is not None) and (entry[0] is predicate):
+            return entry[1]
+        return None
+
+    def fork(self):
+        '''\
+            Return a PredicateTable for a forked Engine (see Engine.fork) with the canonical
+            predicates of this one. Results and aggregates are keyed by the lists of objects of
+            the Engine they were made in, so the forked Engine makes its own.
+        '''
+        table = PredicateTable()
+        table.predicates = dict(self.predicates)
+        table.shapes = dict(self.shapes)
+        return table
+
+    def cached_result(self, shape, key):
+        return self.results.get((shape, key))
+
+    def store_result(self, shape, key, result):
+        if (len(self.results) >= RESULT_CACHE_LIMIT):
+            self.results.clear()
+        self.results[(shape, key)] = result
+
+    def aggregate(self, key):
+        ''' Return the SelectionAggregate registered under key, registering a new one if none is. '''
+        aggregate = self.aggregates.get(key)
+        if (aggregate is None):
+            if (len(self.aggregates) >= RESULT_CACHE_LIMIT):
+                self.aggregates.clear()
+            aggregate = self.aggregates[key] = SelectionAggregate(key[-1])
+        return aggregate
+
+
+PREDICATES = engine_service('PREDICATES', PredicateTable)
+
+
+###############################
+# Maintained Selection Totals #
+###############################
+class SelectionAggregate:
+    '''\
+        The number of game objects which satisfy the predicate of a Selection_ or, given an
+        attribute, the sum of that attribute over them; see Selection_.count and Selection_.total.
+
+        After a full evaluation, the total is maintained by re-testing only the objects which
+        APPARENT_X.changes records as having changed an attribute the predicate reads (or the
+        summed attribute), and the objects appended to GAME.list_of_game_objects since.
+        It's evaluated again in full when the source list is replaced or changed other than by
+        appending to it (i.e., OBJECT_INDEX has been rebuilt), or the change log has started a
+        new epoch. Aggregates are registered with PREDICATES under the shape of the predicate
+        and the values of its dynamic operands (see maintain_aggregate), so every predicate
+        which uses one selects the same objects.
+
+            members         object_id -> contribution (1 when counting) of each member
+    '''
+    __slots__ = ('attribute', 'watched', 'test', 'source', 'generation', 'n_scanned', 'epoch', 'cursor',
+                 'members', 'value')
+
+    def __init__(self, attribute=None):
+        self.attribute = attribute
+        self.watched = None
+        self.test = None
+        self.source = None
+        self.generation = None
+        self.n_scanned = 0
+        self.epoch = None
+        self.cursor = 0
+        self.members = None
+        self.value = 0
+
+    def contribution(self, obj):
+        if (self.attribute is None):
+            return 1
+        return getattr(obj, self.attribute) or 0
+
+    def add(self, obj):
+        contribution = self.contribution(obj)
+        self.members[obj.object_id] = contribution
+        self.value += contribution
+
+    def discard(self, object_id):
+        contribution = self.members.pop(object_id, None)
+        if (contribution is not None):
+            self.value -= contribution
+
+    def evaluate(self, source_set, predicate, source):
+        self.test = bind_predicate(predicate)
+        self.members = {}
+        self.value = 0
+        candidates = plan_selection(source_set, predicate)
+        for obj in (source if (candidates is None) else candidates):
+            if self.test(obj):
+                self.add(obj)
+
+    def apply_changes(self, source):
+        '''\
+            Re-test the objects with logged changes to watched attributes, and test the objects
+            appended to source since the last update.
+        '''
+        watched = self.watched
+        changes = current_service(APPARENT_X).changes
+        changed_ids = {object_id for (object_id, attribute) in changes[self.cursor:] if (attribute in watched)}
+        positions = current_service(OBJECT_INDEX).positions
+        test = self.test
+        for object_id in changed_ids:
+            self.discard(object_id)
+            position = positions.get(object_id)
+            if (position is not None) and (position < self.n_scanned):
+                obj = source[position]
+                if test(obj):
+                    self.add(obj)
+        for position in range(self.n_scanned, len(source)):
+            obj = source[position]
+            if test(obj):
+                self.add(obj)
+
+    def update(self, source_set, predicate, watched, source, generation):
+        '''\
+            Bring the total up to date with source, whose objects OBJECT_INDEX has indexed as of
+            generation, and return it; see maintain_aggregate.
+        '''
+        apparent_state = current_service(APPARENT_X)
+        if ((source is self.source) and (generation == self.generation)
+                and (apparent_state.changes_epoch == self.epoch)):
+            self.apply_changes(source)
+        else:
+            self.watched = watched
+            self.source = source
+            self.generation = generation
+            self.evaluate(source_set, predicate, source)
+        self.n_scanned = len(source)
+        self.epoch = apparent_state.changes_epoch
+        self.cursor = len(apparent_state.changes)
+        return self.value
+
+
+def maintain_aggregate(source_set, predicate, attribute=None):
+    '''\
+        Return the count of the objects of source_set which satisfy predicate (or, given an
+        attribute, the sum of attribute over them) as maintained by the SelectionAggregate
+        registered with PREDICATES for its shape and the values of its dynamic operands, or
+        None if it can't be maintained, i.e., unless source_set is LINKS.game_objects and every
+        attribute the predicate reads (and the summed attribute) is in VERSIONED_ATTRIBUTES.
+    '''
+    if not(source_set is current_service(LINKS).game_objects):
+        return None
+    read_attributes = getattr(predicate, 'read_attributes', None)
+    read_attributes = None if (read_attributes is None) else read_attributes()
+    if (read_attributes is None):
+        return None
+    if (attribute is not None):
+        read_attributes = read_attributes | {attribute}
+    if not(read_attributes <= VERSIONED_ATTRIBUTES):
+        return None
+    source = current_service(GAME).list_of_game_objects
+    object_index = current_service(OBJECT_INDEX)
+    if not(object_index.sync(source)):
+        return None
+    try:
+        operand_values = tuple(operand_key(operand.compute()) for operand in predicate.dynamic_operands())
+    except Exception:
+        return None
+    predicates = current_service(PREDICATES)
+    shape = predicates.shape(predicate)
+    # NOTE # A predicate which has been dropped from the table only shares its own aggregate.
+    shape = Identity(predicate) if (shape is None) else shape
+    aggregate = predicates.aggregate((shape, operand_values, attribute))
+    return aggregate.update(source_set, predicate, read_attributes, source, object_index.generation)
+
+
+# NOTE #
+# For each comparison, the number of objects past value at which its outcome is decided,
+# and that outcome; see decide_threshold.
+THRESHOLD_OUTCOMES = {
+    ge: (0, True),
+    lt: (0, False),
+    gt: (1, True),
+    le: (1, False),
+    eq: (1, False),
+    ne: (1, True),
+}
+
+
+def decide_threshold(op, value, objects):
+    '''\
+        Return op(n, value), where n is the number of objects, without consuming more
+        of objects than is needed to decide the outcome.
+    '''
+    decision = THRESHOLD_OUTCOMES.get(op)
+    if (decision is None) or not(isinstance(value, int)):
+        return op(sum(1 for _ in objects), value)
+    offset, outcome = decision
+    bound = value + offset
+    if (bound <= 0):
+        return outcome
+    n = 0
+    for _ in objects:
+        n += 1
+        if (n >= bound):
+            return outcome
+    return op(n, value)
+
+
+######################################
+# Interchangeable Selectable Objects #
+######################################
+def referenced_object_ids():
+    '''\
+        Return the object_ids of the game objects which another game object refers to, as
+        the object it enchants, equips or copies, or as one of its targets. Such objects are
+        never interchangeable with others.
+    '''
+    result = set()
+    target_temp_ids = set()
+    game_objects = GAME.list_of_game_objects
+    for game_object in game_objects:
+        for referenced in (game_object.enchanted_object, game_object.equipped_object, game_object.copy_source_object):
+            if (referenced is not None):
+                result.add(getattr(referenced, 'object_id', None))
+        target_temp_ids.update(game_object.target_data)
+    if target_temp_ids:
+        result.update(game_object.object_id for game_object in game_objects if (game_object.temp_id in target_temp_ids))
+    return result
+
+
+def create_interchangeability_key():
+    '''\
+        Return a key function for interchangeable_classes which is Modifiable.interchangeability_key
+        for game objects which aren't referred to by other game objects, and None otherwise.
+    '''
+    referenced_ids = referenced_object_ids()
+    def interchangeability_key(obj):
+        if not(isinstance(obj, Modifiable)) or (obj.object_id in referenced_ids):
+            return None
+        return obj.interchangeability_key()
+    return interchangeability_key
+
+
 class Selection_:
     '''\
         Represent criteria which govern the task of making a selection.
@@ -383,10 +1435,14 @@ class Selection_:
                         set of selectable objects.
                         See also: subpowerset function in combinatorics.py
     '''
+    __slots__ = ('_source_set', '_predicate', 'sizes', '_cached_key', '_cached_result')
+
     def __init__(self, source_set, predicate, sizes=[0,None]):
         self._source_set = source_set
-        self._predicate = predicate
+        self._predicate = PREDICATES.canonical(predicate)
         self.sizes = list(sizes)
+        self.cached_key = None
+        self.cached_result = None
 
     @dynamic
     def source_set(self):
@@ -396,13 +1452,76 @@ class Selection_:
     def predicate(self):
         return self._predicate
 
+    # NOTE # The key and result of the last call to selectable_objects(), per Engine; see EngineField.
+    cached_key = EngineField('_cached_key')
+    cached_result = EngineField('_cached_result')
+
+    def candidate_objects(self, predicate):
+        '''\
+            Return the objects of the source set which have to be tested against predicate,
+            using OBJECT_INDEX where possible; see plan_selection.
+        '''
+        candidates = plan_selection(self._source_set, predicate)
+        if (candidates is None):
+            return self.source_set
+        return candidates
+
+    def selection_key(self, predicate):
+        '''\
+            Return a key which changes whenever the result of selectable_objects() may change,
+            or None if the result can't be cached. The key combines:
+                the identities and versions of the source list(s);
+                the values of the predicate's dynamic operands; and,
+                the versions (see ApparentStateHandler.versions) of the attributes it reads,
+            so it's only valid if every attribute the predicate reads is in VERSIONED_ATTRIBUTES.
+        '''
+        if isinstance(self._predicate, Computable):
+            return None
+        read_attributes = getattr(predicate, 'read_attributes', None)
+        read_attributes = None if (read_attributes is None) else read_attributes()
+        if (read_attributes is None) or not(read_attributes <= VERSIONED_ATTRIBUTES):
+            return None
+        source_key = selection_source_key(self._source_set)
+        if (source_key is None):
+            return None
+        try:
+            operand_values = tuple(operand_key(operand.compute()) for operand in predicate.dynamic_operands())
+        except Exception:
+            return None
+        versions = APPARENT_X.versions
+        return (source_key, operand_values, tuple(versions[attribute] for attribute in sorted(read_attributes)))
+
     def selectable_objects(self, as_list=True):
         '''\
             Return the subset of the source set defined by the predicate---i.e., filter
             the source set to contain only objects with properties which satisfy the
             constraints on selected objects represented by the predicate.
+            # NOTE #
+            The result is reused while selection_key() is unchanged, and shared with other
+            selections whose predicates have the same shape; see PredicateTable.
         '''
-        result = filter(lambda x: self.predicate.value_test(x), self.source_set)
+        predicate = self.predicate
+        # NOTE # READ_TRACER.active, without going through the stand-in.
+        if (CURRENT_ENGINE.get().traced_reads is not None):
+            result = filter(traced_predicate(predicate), self.source_set)
+            return list(result) if as_list else result
+        key = self.selection_key(predicate)
+        if (key is not None) and (key == self.cached_key):
+            result = self.cached_result
+            return list(result) if as_list else iter(result)
+        predicates = current_service(PREDICATES)
+        shape = None if (key is None) else predicates.shape(predicate)
+        result = None if (shape is None) else predicates.cached_result(shape, key)
+        if (result is None):
+            result = filter(bind_predicate(predicate), self.candidate_objects(predicate))
+            if (shape is not None):
+                result = list(result)
+                predicates.store_result(shape, key, result)
+        if (key is not None):
+            result = list(result)
+            self.cached_key = key
+            self.cached_result = result
+            return list(result) if as_list else iter(result)
         if as_list:
             return list(result)
         return result
@@ -415,13 +1534,57 @@ class Selection_:
                 number of selected objects per selection.
             See also: the subpowerset function in combinatorics.py
         '''
-        result = subpowerset(x=self.selectable_objects(), n=self.sizes[0], N=self.sizes[1])
+        result = self.selection_space()
         if as_list:
             return list(result)
+        return iter(result)
+
+    def selection_space(self):
+        '''\
+            Return the legal selections as a SelectionSpace, which can be counted, iterated
+            lazily, indexed, sampled, and split into chunks without being materialised.
+        '''
+        return SelectionSpace(x=self.selectable_objects(), n=self.sizes[0], N=self.sizes[1])
+
+    def symmetric_selection_space(self):
+        '''\
+            Return the legal selections up to exchanging interchangeable objects, e.g.,
+            identical untapped tokens, as a SymmetricSelectionSpace.
+        '''
+        return SymmetricSelectionSpace(x=self.selectable_objects(), n=self.sizes[0], N=self.sizes[1],
+                                       key=create_interchangeability_key())
+
+    def maintained(self, attribute=None):
+        '''\
+            Return the count of (or, given an attribute, the sum of attribute over) the
+            selectable objects as maintained by a SelectionAggregate, or None if it can't be;
+            see maintain_aggregate.
+        '''
+        if not(type(self).selectable_objects is Selection_.selectable_objects):
+            return None
+        if isinstance(self._predicate, Computable) or (CURRENT_ENGINE.get().traced_reads is not None):
+            return None
+        return maintain_aggregate(self._source_set, self._predicate, attribute)
+
+    def count(self):
+        result = self.maintained()
+        if (result is None):
+            return len(self.selectable_objects())
+        return result
+
+    def total(self, attribute):
+        '''\
+            Return the sum of attribute over the selectable objects, counting None as 0.
+            Example:
+                The total power of creatures you control.
+        '''
+        result = self.maintained(attribute)
+        if (result is None):
+            return sum((getattr(obj, attribute) or 0) for obj in self.selectable_objects(as_list=False))
         return result
 
     def __len__(self):
-        return len(self.selectable_objects())
+        return self.count()
 
     def threshold(self, op, value):
         '''\
@@ -430,10 +1593,15 @@ class Selection_:
             Example:
                 If you control 4 or more lands.
         '''
-        return op(len(self), value)
+        result = self.maintained()
+        if (result is None):
+            return decide_threshold(op, value, self.selectable_objects(as_list=False))
+        return op(result, value)
 
 
 class LockedSelection_(Selection_):
+    __slots__ = ('selectable_objects_cache',)
+
     def __init__(self, source_set, predicate, sizes=[0, None]):
         self._source_set = source_set
         self._predicate = predicate
@@ -442,30 +1610,39 @@ class LockedSelection_(Selection_):
 
     def selectable_objects(self, as_list=True):
         if (self.selectable_objects_cache is None):
-            self.selectable_objects_cache = list(filter(lambda x: self.predicate.value_test(x), self.source_set))
+            predicate = self.predicate
+            self.selectable_objects_cache = list(filter(bind_predicate(predicate), self.candidate_objects(predicate)))
         return self.selectable_objects_cache
 
 
 class Selection(Selection_):
     ''' Eligible elements of this selection must be game objects. '''
+    __slots__ = ()
+
     def __init__(self, predicate, sizes=[0,None], **kwargs):
         super().__init__(source_set=LINKS.game_objects, predicate=predicate, sizes=sizes, **kwargs)
 
 
 class EffectSelection(Selection_):
     ''' Eligible elements of this selection are either player objects or game objects. '''
+    __slots__ = ()
+
     def __init__(self, predicate, sizes=[0,None], **kwargs):
         super().__init__(source_set=LINKS.mutable_objects, predicate=predicate, sizes=sizes, **kwargs)
 
 
 class LockedSelection(LockedSelection_):
     ''' Eligible elements of this locked selection must be game objects. '''
+    __slots__ = ()
+
     def __init__(self, predicate, sizes=[0,None], **kwargs):
         super().__init__(source_set=LINKS.game_objects, predicate=predicate, sizes=sizes, **kwargs)
 
 
 class PlayerSelection(Selection_):
     ''' Eligible elements of this selection must be player objects. '''
+    __slots__ = ()
+
     def __init__(self, predicate, sizes=[0,None], **kwargs):
         super().__init__(source_set=LINKS.player_objects, predicate=predicate, sizes=sizes, **kwargs)
 
@@ -475,45 +1652,61 @@ class AnyPLife(PlayerSelection):
         Which players have a lifetotal >= ref_val?
         Primary use case: finding players who can pay lifetotal costs.
     '''
+    __slots__ = ()
+
     def __init__(self, ref_val, sizes=[1,2]):
         super().__init__(predicate=lifetotalP(ref_val=ref_val), sizes=sizes)
 
 
 class APLife(PlayerSelection):
+    __slots__ = ()
+
     def __init__(self, ref_val, sizes=[1,1]):
         super().__init__(predicate=CONJ(lifetotalP(ref_val=ref_val), identifyP(LINKS.active_player)), sizes=sizes)
 
 
 class NAPLife(PlayerSelection):
+    __slots__ = ()
+
     def __init__(self, ref_val, sizes=[1,1]):
         super().__init__(predicate=CONJ(lifetotalP(ref_val=ref_val), identifyP(LINKS.non_active_player)), sizes=sizes)
 
 
 class CPLife(PlayerSelection):
+    __slots__ = ()
+
     def __init__(self, ref_val, sizes=[1,1]):
         super().__init__(predicate=CONJ(lifetotalP(ref_val=ref_val), identifyP(LINKS.current_player)), sizes=sizes)
 
 
 class ImmaterialSelection(Selection_):
     ''' Eligible elements of this selection must be immaterial objects---e.g., abilities. '''
+    __slots__ = ()
+
     def __init__(self, predicate, sizes=[0,None], **kwargs):
         super().__init__(set=LINKS.immaterial_objects, predicate=predicate, sizes=sizes, **kwargs)
 
 
 class ZoneSelection(Selection_):
     ''' Eligible elements of this selection must be zones. '''
+    __slots__ = ()
+
     def __init__(self, predicate, sizes=[0,None], **kwargs):
         super().__init__(set=LINKS.zones, predicate=predicate, sizes=sizes, **kwargs)
 
 
 class UnsharedZoneSelection(Selection_):
     ''' Eligible elements of this selection must be unshared zones---e.g., a specific player's hand. '''
+    __slots__ = ()
+
     def __init__(self, predicate, sizes=[0,None], **kwargs):
         super().__init__(set=LINKS.unshared_zones, predicate=predicate, sizes=sizes, **kwargs)
 
 
 class SharedZoneSelection(Selection_):
     ''' Eligible elements of this selection must be shared zones---e.g., the battlefield. '''
+    __slots__ = ()
+
     def __init__(self, predicate, sizes=[0,None], **kwargs):
         super().__init__(set=LINKS.shared_zones, predicate=predicate, sizes=sizes, **kwargs)
 
@@ -527,9 +1720,11 @@ class ScrySelection(Selection_):
         Assumes that the number to scry is always a fixed number and there's never
         a 'scry up to X' or 'scry at least X but no more than Y' quantifiers.
         The selection_set that gets returned from this type of Selection contains
-        2-tuples representing every possible way to partition self.source_set into two
-        partitions, with at most one empty, where permutation of the elements matters.
+        2-tuples (top, bottom) representing every possible way to partition self.set, the top
+        n_to_scry cards of the current player's library, into two partitions, where permutation of the elements matters; see ScryOutcomes.
     '''
+    __slots__ = ()
+
     def __init__(self, sizes=[0,None]):
         self.sizes = sizes
 
@@ -549,8 +1744,18 @@ class ScrySelection(Selection_):
         raise NotImplementedError("ScrySelections don't really have selectable_objects.")
 
     def selection_set(self, as_list=True):
-        cards_to_scry = list(self.source_set)
-        return scry_splits(cards_to_scry)
+        result = self.scry_outcomes()
+        if as_list:
+            return list(result)
+        return iter(result)
+
+    def scry_outcomes(self, bottom_ordered=True, key=None):
+        '''\
+            Return the ways to scry as a ScryOutcomes, which can be counted, iterated lazily,
+            indexed and sampled; see ScryOutcomes for bottom_ordered and key.
+        '''
+        cards_to_scry = list(self.set)
+        return ScryOutcomes(cards_to_scry, bottom_ordered=bottom_ordered, key=key)
 
 
 class IntegerSelection(Selection_):
@@ -558,6 +1763,8 @@ class IntegerSelection(Selection_):
         Special case of selection for returning sets of integers which are
         eligible for numerical decisions.
     '''
+    __slots__ = ('_min_value', '_max_value')
+
     def __init__(self, min_value, max_value, sizes=[1,1]):
         self._min_value = min_value
         self._max_value = max_value + 1
@@ -583,7 +1790,14 @@ class IntegerSelection(Selection_):
 
 # NOTE # Namespace for centralizing / standardizing representation of frequently used predicates.
 class PhiLibrary:
+    '''\
+        Namespace of named predicates, e.g., FIND.creature, FIND.zone_battlefield, FIND.owner_ap.
+        Apart from the few defined in __init__, each predicate is defined by registering a
+        recipe under its name, and is only built the first time that name is looked up, after
+        which it's an ordinary attribute; see __getattr__.
+    '''
     def __init__(self):
+        self.recipes = {}
         self.player_shortforms = [('ap', LINKS.active_player), ('nap', LINKS.non_active_player), ('curr', LINKS.current_player)]
         self.active_player = identifyP(ref_val=LINKS.active_player)
         self.active_player_opponents = differentP(ref_val=LINKS.active_player)
@@ -608,6 +1822,34 @@ class PhiLibrary:
         self.generate_zone_predicates()
         self.generate_charx_predicates()
 
+    def define(self, name, recipe, *args):
+        '''\
+            Register recipe(*args) as the definition of the predicate called name.
+        '''
+        self.recipes[name] = (recipe, args)
+
+    def __getattr__(self, name):
+        '''\
+            Only called when name isn't an attribute yet; build it if it has a recipe.
+        '''
+        recipes = self.__dict__.get('recipes')
+        entry = None if (recipes is None) else recipes.get(name)
+        if (entry is None):
+            # NOTE # Another thread may have built it since the lookup which called us.
+            if (name in self.__dict__):
+                return self.__dict__[name]
+            raise AttributeError("{} has no predicate named {}".format(type(self).__name__, name))
+        recipe, args = entry
+        # NOTE # The recipe is only dropped once the predicate is stored, so that a recipe which
+        # raises can be retried, and a concurrent lookup finds one or the other; if two threads
+        # build it, both return the one stored first.
+        predicate = self.__dict__.setdefault(name, recipe(*args))
+        recipes.pop(name, None)
+        return predicate
+
+    def __dir__(self):
+        return list(super().__dir__()) + list(self.recipes)
+
 
     def _init_from_player_data(self, shared_ref_attr, true_class, negated_class, players_to_include=['ap', 'nap', 'curr']):
         '''\
@@ -620,8 +1862,8 @@ class PhiLibrary:
             if (shortform[0] in players_to_include):
                 true_attribute = "{}_{}".format(shared_ref_attr, shortform[0])
                 negated_attribute = "{}_not_{}".format(shared_ref_attr, shortform[0])
-                setattr(self, true_attribute, true_class(shared_ref_attr, shortform[1]))
-                setattr(self, negated_attribute, negated_class(shared_ref_attr, shortform[1]))
+                self.define(true_attribute, true_class, shared_ref_attr, shortform[1])
+                self.define(negated_attribute, negated_class, shared_ref_attr, shortform[1])
                 self.player_kontrol_predicate_attributes.append(true_attribute)
                 self.player_kontrol_predicate_attributes.append(negated_attribute)
 
@@ -630,15 +1872,15 @@ class PhiLibrary:
         n_true_list = len(true_list)
         n_negated_list = len(negated_list)
         for i in range(n_true_list):
-            setattr(self, true_list[i], true_class(shared_ref_attr, true_list[i]))
+            self.define(true_list[i], true_class, shared_ref_attr, true_list[i])
         for i in range(n_negated_list):
-            setattr(self, negated_list[i], negated_class(shared_ref_attr, negated_list[i]))
+            self.define(negated_list[i], negated_class, shared_ref_attr, negated_list[i])
 
     def _init_from_data2(self, shared_ref_attr, true_list, true_class, negated_list, negated_class):
         n_true_list = len(true_list)
         for i in range(n_true_list):
-            setattr(self, true_list[i], true_class(shared_ref_attr, true_list[i]))
-            setattr(self, negated_list[i], negated_class(shared_ref_attr, true_list[i]))
+            self.define(true_list[i], true_class, shared_ref_attr, true_list[i])
+            self.define(negated_list[i], negated_class, shared_ref_attr, true_list[i])
 
 
     def generate_player_owner_predicates(self):
@@ -655,12 +1897,17 @@ class PhiLibrary:
         self.generate_player_controller_predicates()
         self.generate_player_controwner_predicates()
 
+    def player_zone_predicate(self, player_shortform, negated):
+        if negated:
+            return CONJ(self.zone_unshared, isnotP("player", player_shortform[1]))
+        return DISJ(self.zone_shared, isP("player", player_shortform[1]))
+
     def generate_player_zone_predicates(self):
         for player_shortform in self.player_shortforms:
             true_attribute_name = "zones_{}".format(player_shortform[0])
             negated_attribute_name = "zones_not_{}".format(player_shortform[0])
-            setattr(self, true_attribute_name, DISJ(self.zone_shared, isP("player", player_shortform[1])))
-            setattr(self, negated_attribute_name, CONJ(self.zone_unshared, isnotP("player", player_shortform[1])))
+            self.define(true_attribute_name, self.player_zone_predicate, player_shortform, False)
+            self.define(negated_attribute_name, self.player_zone_predicate, player_shortform, True)
             self.player_zone_predicate_attributes.extend([true_attribute_name,negated_attribute_name])
 
     def generate_zone_predicates(self):
@@ -669,8 +1916,8 @@ class PhiLibrary:
             zone_class = zone_type[1]
             true_attribute_name = "zone_is_{}".format(zone_name)
             negated_attribute_name = "zone_is_not_{}".format(zone_name)
-            setattr(self, true_attribute_name, typeP(zone_class))
-            setattr(self, negated_attribute_name, typenotP(zone_class))
+            self.define(true_attribute_name, typeP, zone_class)
+            self.define(negated_attribute_name, typenotP, zone_class)
             self.zone_identity_predicates.extend([true_attribute_name, negated_attribute_name])
 
     def generate_object_zone_predicates(self):
@@ -679,8 +1926,8 @@ class PhiLibrary:
             zone_class = zone_type[1]
             true_attribute_name = "zone_{}".format(zone_name)
             negated_attribute_name = "zone_not_{}".format(zone_name)
-            setattr(self, true_attribute_name, exactinstP("current_zone", zone_class))
-            setattr(self, negated_attribute_name, notexactinstP("current_zone", zone_class))
+            self.define(true_attribute_name, exactinstP, "current_zone", zone_class)
+            self.define(negated_attribute_name, notexactinstP, "current_zone", zone_class)
             self.object_zone_predicate_attributes.extend([true_attribute_name, negated_attribute_name])
 
     def generate_relevant_object_zone_by_kontrol_predicates(self):
@@ -690,7 +1937,8 @@ class PhiLibrary:
         relevant_kontrol_predicate_attributes = ['controwner_ap', 'controwner_not_ap', 'controwner_nap', 'controwner_not_nap', 'controwner_curr', 'controwner_not_curr']
         for relevant_zone_predicate_attribute in relevant_zone_predicate_attributes:
             for relevant_kontrol_predicate_attribute in relevant_kontrol_predicate_attributes:
-                self @ [relevant_zone_predicate_attribute, relevant_kontrol_predicate_attribute]
+                atoms = [relevant_zone_predicate_attribute, relevant_kontrol_predicate_attribute]
+                self.define(self._process_list_of_atoms(atoms)[1], self.__matmul__, atoms)
                 self.relevant_object_zone_by_kontrol_predicate_attributes.append(relevant_kontrol_predicate_attribute+"_"+relevant_zone_predicate_attribute)
 
 
@@ -732,41 +1980,48 @@ class PhiLibrary:
         sorted_list_of_atoms, sorted_string_of_atoms = self._process_list_of_atoms(list_of_atoms)
         if not(sorted_string_of_atoms in self.__dict__):
             individual_predicates = [getattr(self, atom) for atom in sorted_list_of_atoms]
-            composition_of_predicates = CONJ(*individual_predicates)
+            composition_of_predicates = PREDICATES.canonical(CONJ(*individual_predicates))
+            self.recipes.pop(sorted_string_of_atoms, None)
             setattr(self, sorted_string_of_atoms, composition_of_predicates)
             return composition_of_predicates
         return getattr(self, sorted_string_of_atoms)
 
 
 
-FIND = PhiLibrary()
+def extended_phi_library():
+    '''\
+        Return a PhiLibrary with the example extensions below; each Engine owns one.
+    '''
+    library = PhiLibrary()
+
+    # NOTE #
+    # Example extensions to PhiLibrary.
+    library.physical_status_tapped = eqP("physical_status_tapped", True)
+    library.physical_status_untapped = eqP("physical_status_tapped", False)
+    library.has_summoning_sickness = eqP("has_summoning_sickness", True)
+    library.not_has_summoning_sickness = eqP("has_summoning_sickness", False)
+    library.is_not_summoning_sick = DISJ(library.noncreature, library.not_has_summoning_sickness)
+
+    library.can_become_tapped = CONJ(library.is_not_summoning_sick, library.physical_status_untapped)
+    library.can_become_untapped = library.physical_status_tapped
 
+    library.can_be_permanent = CONJ(library.noninstant, library.nonsorcery)
 
-# NOTE #
-# Example extensions to PhiLibrary.
-FIND.physical_status_tapped = eqP("physical_status_tapped", True)
-FIND.physical_status_untapped = eqP("physical_status_tapped", False)
-FIND.has_summoning_sickness = eqP("has_summoning_sickness", True)
-FIND.not_has_summoning_sickness = eqP("has_summoning_sickness", False)
-FIND.is_not_summoning_sick = DISJ(FIND.noncreature, FIND.not_has_summoning_sickness)
-
-FIND.can_become_tapped = CONJ(FIND.is_not_summoning_sick, FIND.physical_status_untapped)
-FIND.can_become_untapped = FIND.physical_status_tapped
-
-FIND.can_be_permanent = CONJ(FIND.noninstant, FIND.nonsorcery)
-
-FIND.nonaura_enchantment = CONJ(FIND.enchantment, notinP("subtypes", "aura"))
-FIND.nonbasic_land = CONJ(FIND.land, notinP("supertypes", "basic"))
-
-FIND.plains = CONJ(FIND.land, inP("subtypes", "plains"))
-FIND.island = CONJ(FIND.land, inP("subtypes", "island"))
-FIND.swamp = CONJ(FIND.land, inP("subtypes", "swamp"))
-FIND.mountain = CONJ(FIND.land, inP("subtypes", "mountain"))
-FIND.forest = CONJ(FIND.land, inP("subtypes", "forest"))
-
-# Alias #
-FIND.GOBJ = FIND.game_object_identity
-FIND.POBJ = FIND.player_object_identity
+    library.nonaura_enchantment = CONJ(library.enchantment, notinP("subtypes", "aura"))
+    library.nonbasic_land = CONJ(library.land, notinP("supertypes", "basic"))
+
+    library.plains = CONJ(library.land, inP("subtypes", "plains"))
+    library.island = CONJ(library.land, inP("subtypes", "island"))
+    library.swamp = CONJ(library.land, inP("subtypes", "swamp"))
+    library.mountain = CONJ(library.land, inP("subtypes", "mountain"))
+    library.forest = CONJ(library.land, inP("subtypes", "forest"))
+
+    # Alias #
+    library.GOBJ = library.game_object_identity
+    library.POBJ = library.player_object_identity
+    return library
+
+FIND = engine_service('FIND', extended_phi_library)
 
 
 #################################################
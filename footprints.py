@@ -0,0 +1,259 @@
+from contfx_config import *
+
+
+'''\
+    Static analysis of the catalogue of continuous effect generators defined in contfx_config.py.
+
+    Each generator declares what its effects select (its external predicates, and those created by
+    its phi factories), and what its components write (the reference_attributes of their Deltas).
+    From these, derive the Footprint of the component(s) it generates in each (sub)layer:
+        reads       the names of the attributes which determine whether such a component exists,
+                    what it applies to, or what it does to the objects it applies to; and,
+        writes      the names of the attributes its Deltas assign;
+    either of which is None when it can't be determined without enacting the component, e.g., when
+    its Deltas are created by delta factories.
+
+    Two components in the same (sub)layer can only be found to depend on one another (see
+    ApparentStateHandler.third_order_data) if one of them writes an attribute which the other
+    reads or writes. The InteractionMatrix records every pair of generators whose components
+    can't, so that ApparentStateHandler.determine_raw_edges can skip testing them.
+
+    The matrix is derived on first use, which takes a few milliseconds, and kept in memory.
+'''
+
+# NOTE # Computables which read (and write) the abilities of the object they're applied to.
+ABILITY_COMPUTABLES = (RulesTextAndCopiableEffectAbilityRemover, IdempotentManaAbilityGrant,
+                       KeywordAbilityGrant, ProhibitKeywordAbility, KeywordAbilityLoss, StaticAbilityGrant)
+
+
+def union_reads(*reads):
+    '''\
+        Return the union of the given sets of attribute names, or None if any of them is None.
+    '''
+    result = set()
+    for attribute_names in reads:
+        if (attribute_names is None):
+            return None
+        result |= attribute_names
+    return result
+
+
+def computable_reads(value):
+    '''\
+        Return the set of names of the attributes read by computing value, or None if they
+        aren't known; values which aren't Computable read nothing.
+    '''
+    if not(isinstance(value, Computable)):
+        return set()
+    if isinstance(value, (K, ConstantLambda)):
+        return set()
+    if isinstance(value, ConcatReduction):
+        return {value.ref_attr}
+    if isinstance(value, ABILITY_COMPUTABLES):
+        return {'abilities'}
+    if isinstance(value, SimpleAttributeReport):
+        return union_reads({value.ref_attr}, computable_reads(value._ref_obj))
+    if isinstance(value, Lambda):
+        return union_reads(computable_reads(value.l_operand), computable_reads(value.r_operand))
+    if isinstance(value, ReflexiveDelta):
+        return union_reads(set(value.reference_attributes), computable_reads(value.arbitrary_function))
+    if isinstance(value, Delta):
+        return computable_reads(value.arbitrary_function)
+    return None
+
+
+def predicate_reads(predicate):
+    '''\
+        Return the set of names of the attributes read by predicate, either of the objects it
+        tests, or by its dynamic operands; or None if they aren't known.
+    '''
+    read_attributes = getattr(predicate, 'read_attributes', None)
+    tested = None if (read_attributes is None) else read_attributes()
+    return union_reads(tested, *(computable_reads(operand) for operand in predicate.dynamic_operands()))
+
+
+class Footprint:
+    '''\
+        The attributes read and written by the components a generator creates in one (sub)layer.
+        Reads are partitioned by the objects they're read from:
+            reads           any object, e.g., those tested by the effect's predicate;
+            target_reads    only the objects the component applies to, i.e., by ReflexiveDeltas; and,
+            host_reads      only the host object of the generator.
+        reads is None if any of them isn't known.
+    '''
+    __slots__ = ('reads', 'writes', 'target_reads', 'host_reads')
+
+    def __init__(self, reads, writes, target_reads=set(), host_reads=set()):
+        self.reads = reads
+        self.writes = writes
+        self.target_reads = set(target_reads)
+        self.host_reads = set(host_reads)
+
+    @property
+    def known(self):
+        return (self.reads is not None) and (self.writes is not None)
+
+    @property
+    def all_reads(self):
+        return self.reads | self.target_reads | self.host_reads
+
+    def may_interact(self, other):
+        '''\
+            Return False only if neither footprint writes an attribute the other reads or writes.
+        '''
+        if not(self.known and other.known):
+            return True
+        return bool((self.writes & (other.all_reads | other.writes)) or (other.writes & self.all_reads))
+
+    def merge(self, other):
+        '''\
+            Return the footprint of the components of both footprints taken together.
+        '''
+        return Footprint(reads=union_reads(self.reads, other.reads),
+                         writes=union_reads(self.writes, other.writes),
+                         target_reads=(self.target_reads | other.target_reads),
+                         host_reads=(self.host_reads | other.host_reads))
+
+    def __repr__(self):
+        return "Footprint(reads={}, writes={}, target_reads={}, host_reads={})".format(self.reads, self.writes, self.target_reads, self.host_reads)
+
+
+def deltas_footprint(deltas, reads=set(), host_reads=set()):
+    '''\
+        Return the Footprint of applying deltas, given the reads made to decide what to apply them to.
+        # NOTE #
+        A ReflexiveDelta propagates the object it's applied to as the ref_obj of its computables,
+        so it only reads attributes of that object.
+    '''
+    target_reads = set()
+    for delta in deltas:
+        delta_reads = computable_reads(delta)
+        if (delta_reads is None):
+            return Footprint(reads=None, writes=None)
+        if isinstance(delta, ReflexiveDelta):
+            target_reads |= delta_reads
+        else:
+            reads = union_reads(reads, delta_reads)
+    return Footprint(reads=reads,
+                     writes=set(chain.from_iterable(delta.reference_attributes for delta in deltas)),
+                     target_reads=target_reads,
+                     host_reads=host_reads)
+
+
+def ability_catalogue():
+    '''\
+        Return a dictionary mapping the name of each continuous effect generator defined in
+        contfx_config.py to its type.
+    '''
+    return {name:value for name, value in globals().items()
+            if isinstance(value, type) and issubclass(value, ContinuousEffectGenerator)
+            and (value.__module__ == 'contfx_config')}
+
+
+def ability_footprints(ability_type):
+    '''\
+        Return a dictionary mapping each (sub)layer in which an instance of ability_type generates
+        components to their Footprint, derived from an instance without a host object.
+    '''
+    try:
+        ability = ability_type(host_object=None)
+        selection_reads = predicate_reads(ability.generate_effect_predicate())
+    except Exception:
+        return {}
+
+    # NOTE #
+    # A static ability's effect only exists while its host has it, and the host's zone (which no
+    # continuous effect writes) is appropriate; over-ridden antecedents are arbitrary conditions.
+    host_reads = set()
+    if isinstance(ability, StaticAbility):
+        if ('antecedents_verified' in ability_type.__dict__):
+            selection_reads = None
+        host_reads.add('abilities')
+
+    result = {}
+    for component in ability.components:
+        if (type(component) is EffectComponent) and not(component.delta_factories) and (selection_reads is not None):
+            footprint = deltas_footprint(component.external_deltas, reads=selection_reads, host_reads=host_reads)
+        else:
+            footprint = Footprint(reads=None, writes=None)
+        if (component.layer in result):
+            footprint = result[component.layer].merge(footprint)
+        result[component.layer] = footprint
+    return result
+
+
+class InteractionMatrix:
+    '''\
+        For each (sub)layer, the set of ordered pairs of names of generators in the catalogue whose
+        components can never depend on one another in that (sub)layer, in either direction.
+        Components of generators outside of the catalogue, and marker and copy effect components,
+        may interact with anything.
+    '''
+    __slots__ = ('catalogue', 'footprints', 'independent')
+
+    def __init__(self):
+        self.catalogue = None
+        self.footprints = None
+        self.independent = None
+
+    def analyse(self):
+        footprints = {name:ability_footprints(ability_type) for name, ability_type in self.catalogue.items()}
+        independent = set()
+        for (name_a, footprints_a), (name_b, footprints_b) in product(footprints.items(), repeat=2):
+            for layer, footprint_a in footprints_a.items():
+                if (layer in footprints_b) and not(footprint_a.may_interact(footprints_b[layer])):
+                    independent.add((name_a, name_b, layer))
+        self.footprints = footprints
+        # NOTE # Assigned last, since it marks the matrix as derived; see load.
+        self.independent = independent
+
+    def load(self):
+        '''\
+            Derive the matrix if it hasn't been yet. The instances of the generators it inspects
+            are created in a scratch Engine, so that they don't draw ids from the current one.
+        '''
+        if (self.independent is None):
+            self.catalogue = ability_catalogue()
+            scratch = Engine()
+            try:
+                scratch.run(self.analyse)
+            finally:
+                scratch.close()
+        return self
+
+    def generator_name(self, component):
+        if not(type(component) is EffectComponent):
+            return None
+        ability_type = type(component.reference_effect.reference_ability)
+        if not(self.catalogue.get(ability_type.__name__) is ability_type):
+            return None
+        return ability_type.__name__
+
+    def footprint(self, component):
+        '''\
+            Return the Footprint of component, or None if it isn't known.
+        '''
+        if component.is_marker_effect_component:
+            footprint = deltas_footprint(component.deltas)
+            # NOTE # A marker's component applies only to the marker's host object.
+            return Footprint(reads=footprint.reads, writes=footprint.writes,
+                             target_reads=footprint.target_reads) if footprint.known else None
+        self.load()
+        name = self.generator_name(component)
+        if (name is None):
+            return None
+        footprint = self.footprints[name].get(component.layer)
+        return footprint if ((footprint is not None) and footprint.known) else None
+
+    def may_interact(self, component_a, component_b):
+        self.load()
+        name_a = self.generator_name(component_a)
+        name_b = self.generator_name(component_b)
+        if (name_a is None) or (name_b is None):
+            return True
+        return not((name_a, name_b, component_a.layer) in self.independent)
+
+
+INTERACTION_MATRIX = InteractionMatrix()
+ApparentStateHandler.interaction_matrix = INTERACTION_MATRIX
+
@@ -1,6 +1,11 @@
 from abilities import *
 
 
+# NOTE # The sublayers over which partial_snapshot slices components; copy effects are always applied.
+SLICED_SUBLAYERS = ['2', '3', '4', '5', '6', '7a', '7b', '7c', '7d', '8']
+EMPTY_READS = frozenset()
+
+
 class EffectManager:
     '''\
         Determine which static abilities should generate continuous effects,
@@ -14,6 +19,13 @@ class EffectManager:
         Note: Only continuous effects which modify the characteristics or controller of
               game objects, or which modify the abilities of players, are currently supported.
         Note: Mutate / merging with permanents is not currently supported.
+
+        A partial snapshot (see partial_snapshot) only applies the components which the apparent
+        values of given attributes of given objects depend on.
+
+        In approximate mode (see approximate_snapshot), each sublayer is applied in presort order
+        without testing for dependency, and the sublayers in which a dependency could plausibly
+        exist are recorded in self.flagged_sublayers.
         
     '''
     def __init__(self):
@@ -24,6 +36,12 @@ class EffectManager:
         self.game_objects = list([])
         self.immaterial_objects = list([])
         self.solved_copiable_values = False
+        self.approximate = False
+        self.flagged_sublayers = list([])
+
+    def fork(self):
+        # NOTE # What's gathered by a snapshot is that of the Engine it was taken in; see Engine.fork.
+        return EffectManager()
 
     def calibrate(self):
         self.static_ids = set([])
@@ -33,6 +51,7 @@ class EffectManager:
         self.game_objects = LINKS.game_objects.compute()
         self.immaterial_objects = LINKS.immaterial_objects.compute()
         self.solved_copiable_values = False
+        self.flagged_sublayers.clear()
 
     @property
     def unused_marker_effect_components(self):
@@ -141,38 +160,290 @@ class EffectManager:
 
             to_apply = self.next_effect_to_apply(initial=False)
 
+    def presort_and_flag(self, components):
+        '''\
+            Enact components in presort order, and flag their sublayer if the enactment of a
+            component wrote an attribute value of an object which an earlier component had read
+            (see ReadTracer), in which case the earlier component might have depended on the later one.
+            The existence of a component of an effect generated by a static ability counts as a
+            read of the abilities of its host object.
+            # NOTE #
+            A component's reads of the attributes it modifies on the objects it applies to, e.g.,
+            the power a +1/+1 modification adds to, don't count (see reflexive_attributes); what
+            it does doesn't depend on them, so it commutes with other such modifications.
+        '''
+        presorted_components = APPARENT_X.presort(components)
+        if (len(presorted_components) == 1):
+            presorted_components[0].enact(lock=True)
+            return
+        read_so_far = set()
+        flagged = False
+        with READ_TRACER.record_components():
+            for component in presorted_components:
+                APPARENT_X.refresh_ref_attr_val_dict()
+                component.enact(lock=True)
+                if not(flagged):
+                    written = APPARENT_X.ref_attr_val_dict
+                    flagged = any(((object_id, attribute) in read_so_far)
+                                  for object_id in written for attribute in written[object_id])
+                reflexive = self.reflexive_attributes(component)
+                if reflexive:
+                    read_so_far.update(read for read in component.read_set if not(read[1] in reflexive))
+                else:
+                    read_so_far |= component.read_set
+                if not(component.is_marker_effect_component) and component.generator_static:
+                    read_so_far.add((component.host_object.object_id, 'abilities'))
+        APPARENT_X.refresh_ref_attr_val_dict()
+        if flagged:
+            self.flagged_sublayers.append(presorted_components[0].layer)
+
+    def reflexive_attributes(self, component):
+        '''\
+            Return the attributes which component only reads of the objects it applies to, to
+            modify them (see Footprint.target_reads), and reads in no other way; or an empty set
+            if its Footprint isn't known.
+        '''
+        matrix = APPARENT_X.interaction_matrix
+        footprint = None if (matrix is None) else matrix.footprint(component)
+        if (footprint is None):
+            return EMPTY_READS
+        return (footprint.target_reads & footprint.writes) - footprint.reads - footprint.host_reads
+
     def layer_sort(self, components):
         valid_components = [c for c in components if (c.valid)]
-        APPARENT_X.solve_sort(valid_components)
+        if not(self.approximate):
+            APPARENT_X.solve_sort(valid_components)
+        elif valid_components:
+            self.presort_and_flag(valid_components)
         self.used_components.extend(components)
 
-    def snapshot(self):
-        APPARENT_X.calibrate()
-        self.calibrate()
-        components = self.gather_components()
+    def layer_sort_sublayers(self, components, sublayer_strings):
         sublayers = self.partition_by_sublayer(components)
-
-        for sublayer in ['1a', '1b']:
+        for sublayer in sublayer_strings:
             if sublayers[sublayer]:
                 self.layer_sort(sublayers[sublayer])
 
+    def snapshot(self):
+        APPARENT_X.calibrate()
+        self.calibrate()
+        self.layer_sort_sublayers(self.gather_components(), ['1a', '1b'])
         self.solve_copiable_values()
+        self.layer_sort_sublayers(self.regather_components(), ['2', '3', '4', '5', '6'])
+        self.layer_sort_sublayers(self.regather_components(), ['6', '7a', '7b', '7c', '7d', '8'])
+
+    def affected_object_ids(self, component):
+        if component.is_marker_effect_component:
+            return {component.reference_marker.host_object.object_id}
+        component.reference_effect.refresh_selectable_objects_cache()
+        result = {affected_object.object_id for affected_object in component.set_of_affected_objects}
+        component.reference_effect.refresh_selectable_objects_cache()
+        return result
+
+    def backward_slice(self, components, object_ids, attributes):
+        '''\
+            Return the set of ids of the components, among those in SLICED_SUBLAYERS, which the
+            apparent values of attributes of the objects with object_ids might depend on; or None if
+            the Footprint of some component isn't known (see APPARENT_X.interaction_matrix).
+
+            Working backward from the last sublayer, a component is kept if it writes one of the
+            needed attributes of an object it might apply to, in the sublayer in which it's needed or an
+            earlier one; the attributes it reads are then needed as well, in its sublayer, of the objects
+            it reads them from, and so are the other components of its effect
+            (see 613.6). This repeats until no more components are kept. The objects a component
+            applies to are only known in advance if no component in its sublayer or an earlier one
+            writes an attribute its selection reads; otherwise, it might apply to any object.
+        '''
+        matrix = APPARENT_X.interaction_matrix
+        footprints = {}
+        for component in components:
+            footprint = None if (matrix is None) else matrix.footprint(component)
+            if (footprint is None):
+                return None
+            footprints[id(component)] = footprint
 
-        components = self.regather_components()
         sublayers = self.partition_by_sublayer(components)
+        written_so_far = {}
+        written = set()
+        for sublayer in SLICED_SUBLAYERS:
+            for component in sublayers[sublayer]:
+                written |= footprints[id(component)].writes
+            written_so_far[sublayer] = set(written)
+
+        # NOTE #
+        # Maps each needed attribute to a list of 2-tuples of the position in SLICED_SUBLAYERS of the
+        # sublayer in which it's read, and the set of ids of the objects it's read from, or None for
+        # any object. Only components in that sublayer or an earlier one can change what's read.
+        needed = {attribute:[(len(SLICED_SUBLAYERS), set(object_ids))] for attribute in attributes}
+        def need(position, needed_attributes, needed_ids):
+            for attribute in needed_attributes:
+                needed.setdefault(attribute, []).append((position, needed_ids))
+
+        def is_needed(position, attribute, affected_ids):
+            return any(((position <= read_position) and ((read_ids is None) or (affected_ids is None) or (read_ids & affected_ids)))
+                       for read_position, read_ids in needed.get(attribute, []))
+
+        kept = set()
+        def keep(component, affected_ids):
+            kept.add(id(component))
+            position = SLICED_SUBLAYERS.index(component.layer)
+            footprint = footprints[id(component)]
+            need(position, footprint.reads, None)
+            need(position, footprint.target_reads, affected_ids)
+            if footprint.host_reads:
+                need(position, footprint.host_reads, {component.host_object.object_id})
+            if not(component.is_marker_effect_component):
+                for sibling in component.reference_effect.components:
+                    if (id(sibling) in footprints) and not(id(sibling) in kept):
+                        keep(sibling, None)
+
+        n_kept = None
+        while (n_kept != len(kept)):
+            n_kept = len(kept)
+            for position in reversed(range(len(SLICED_SUBLAYERS))):
+                sublayer = SLICED_SUBLAYERS[position]
+                for component in sublayers[sublayer]:
+                    if (id(component) in kept):
+                        continue
+                    footprint = footprints[id(component)]
+                    if not(any(is_needed(position, attribute, None) for attribute in footprint.writes)):
+                        continue
+                    affected_ids = None
+                    if component.is_marker_effect_component or not(footprint.reads & written_so_far[sublayer]):
+                        affected_ids = self.affected_object_ids(component)
+                        if not(any(is_needed(position, attribute, affected_ids) for attribute in footprint.writes)):
+                            continue
+                    keep(component, affected_ids)
+        return kept
+
+    def partial_snapshot(self, objects, attributes):
+        '''\
+            Derive the apparent values of attributes of objects, applying copy effects and then only
+            the components in the backward slice (see backward_slice). Other apparent values may be
+            wrong until the next snapshot.
+            Return True if the slice was applied, or False if a full snapshot was taken instead,
+            because a footprint wasn't known, or because applying the slice generated new effects.
+        '''
+        APPARENT_X.calibrate()
+        self.calibrate()
+        self.layer_sort_sublayers(self.gather_components(), ['1a', '1b'])
+        self.solve_copiable_values()
 
-        for sublayer in ['2', '3', '4', '5', '6']:
-            if sublayers[sublayer]:
-                self.layer_sort(sublayers[sublayer])
+        components = self.regather_components()
+        kept = self.backward_slice(components, {obj.object_id for obj in objects}, attributes)
+        if (kept is None):
+            self.snapshot()
+            return False
+        self.layer_sort_sublayers([component for component in components if (id(component) in kept)], ['2', '3', '4', '5', '6'])
 
+        considered = {id(component) for component in components}
         components = self.regather_components()
-        sublayers = self.partition_by_sublayer(components)
+        if any(not(id(component) in considered) for component in components):
+            self.snapshot()
+            return False
+        self.layer_sort_sublayers([component for component in components if (id(component) in kept)], ['6', '7a', '7b', '7c', '7d', '8'])
+        return True
+
+    def approximate_snapshot(self):
+        '''\
+            Derive the apparent state as snapshot() does, but in approximate mode, i.e., apply
+            the components of each sublayer in timestamp order rather than solving for dependency.
+            Return the list of flagged sublayers; if it's empty, the apparent state is the one
+            snapshot() would derive, and otherwise, snapshot() should be called if exactness matters.
+        '''
+        self.approximate = True
+        try:
+            self.snapshot()
+        finally:
+            self.approximate = False
+        return list(self.flagged_sublayers)
 
-        for sublayer in ['6', '7a', '7b', '7c', '7d', '8']:
-            if sublayers[sublayer]:
-                self.layer_sort(sublayers[sublayer])
 
 
 
+FX_HANDLER = engine_service('FX_HANDLER', EffectManager)
 
-FX_HANDLER = EffectManager()
+
+################################
+# Hypothetical (What-If) State #
+################################
+class Hypothetical:
+    '''\
+        An overlay on the current (solved) state, within which a small change to it---objects moved
+        between zones, added or removed, and continuous effects generated by resolution added or
+        removed---can be made and its apparent state derived, without touching the current state.
+
+            with Hypothetical() as what_if:
+                what_if.move(permanent, ZH.p0_zone_graveyard)
+                result = what_if.query(creatures, ['power', 'toughness'])
+
+        On entry, the current Engine is forked (see Engine.fork) and the fork is activated; on exit,
+        the Engine which was current is current again. The fork shares the objects of the current
+        state, and copies only what the change touches: the zone-related fields of the objects
+        which are moved, the contents of the zones they're moved between, the fields of the effects
+        and components which are applied again, and GAME's lists of objects. It starts out with the
+        solution of the current state, so the apparent values which aren't derived again are those
+        of the current state; query only derives what the requested values depend on (see
+        EffectManager.partial_snapshot).
+        Since the current state is never changed, a Hypothetical can be nested, abandoned by an
+        exception, or entered in one thread while another uses the current state.
+        # NOTE #
+        Objects are never copied, so objects of the current state (and effects created outside the
+        context) can be used as they are. The contents of a Zone within the context are those of
+        its contents property, rather than those of the Zone itself.
+    '''
+    def __init__(self):
+        self.engine = None
+        self.activation = None
+
+    def __enter__(self):
+        self.engine = CURRENT_ENGINE.get().fork()
+        self.activation = self.engine.activate()
+        self.activation.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.activation.__exit__(exc_type, exc_value, traceback)
+        self.engine.close()
+        self.engine = self.activation = None
+        return False
+
+    ################################
+    # Changes To The Current State #
+    ################################
+    def move(self, game_object, dst_zone, top=False):
+        ZH.move_obj(game_object.current_zone, dst_zone, top, game_object)
+
+    def add_object(self, game_object, dst_zone, top=False):
+        ''' Put game_object, which needn't have existed, into dst_zone. '''
+        if not(game_object in GAME.list_of_game_objects):
+            GAME.list_of_game_objects.append(game_object)
+        if (game_object.current_zone is None):
+            dst_zone.add_object(game_object, top=top)
+        else:
+            self.move(game_object, dst_zone, top=top)
+
+    def remove_object(self, game_object):
+        ''' Make game_object cease to exist, e.g., a token leaving the battlefield. '''
+        if (game_object.current_zone is not None):
+            game_object.current_zone.remove_specific_object_(game_object)
+        GAME.list_of_game_objects.remove(game_object)
+
+    def add_effect(self, effect):
+        GAME.list_of_immaterial_objects.append(effect)
+
+    def remove_effect(self, effect):
+        GAME.list_of_immaterial_objects.remove(effect)
+
+    ###############################
+    # Hypothetical Apparent State #
+    ###############################
+    def snapshot(self):
+        FX_HANDLER.snapshot()
+
+    def query(self, objects, attributes):
+        '''\
+            Return a list with a dictionary mapping each of attributes to its apparent value in the
+            hypothetical state for each of objects. See: EffectManager.partial_snapshot
+        '''
+        FX_HANDLER.partial_snapshot(objects, attributes)
+        return [{attribute:getattr(obj, attribute) for attribute in attributes} for obj in objects]
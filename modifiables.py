@@ -2,31 +2,68 @@ from players import *
 
 
 class Modifiable:
-    def __init__(self, **kwargs):
+    # NOTE #
+    # Every per-instance attribute is declared here so that instances use a compact
+    # slotted layout rather than a __dict__; subclasses which add their own attributes
+    # should declare them in their own __slots__.
+    # The base values of the characteristics in BASE_CHARX live in a BaseCharacteristics
+    # record which is shared by every object with an identical definition.
+    __slots__ = (
+        # Layer Sort Attributes
+        '_base', '_abilities', '_base_controller',
+        # Miscellaneous Attributes
+        'object_id', '_temp_id', '_temp_id_history', '_prior_zone', '_current_zone', 'environment', '_owner',
+        # Marker Attributes
+        'markers', 'can_have_markers', 'prohibited_marker_types',
+        # Information Concerning Choices
+        'enchanted_object', 'enchanted_player', 'equipped_object', 'target_data', 'copy_source_object',
+        'chosen_opponent', 'chosen_X', '_object_types', '_solved_copiable_values', '_timestamp',
+        # Physical Status
+        'is_tapped', 'is_facedown', 'is_flipped', 'is_phased_out',
+        # Combat
+        'is_attacking', 'is_blocking',
+        # Scratch values used by Sublayer 7d effects which switch power and toughness
+        '_switched_power', '_switched_toughness'
+    )
+
+    def __init__(self,
+                 impl_name="",
+                 mana_cost="",
+                 color=EMPTY_TYPESET,
+                 card_types=EMPTY_TYPESET,
+                 subtypes=EMPTY_TYPESET,
+                 supertypes=EMPTY_TYPESET,
+                 abilities=None,
+                 power=0,
+                 toughness=0,
+                 loyalty=0,
+                 controller=""):
         #########################
         # Layer Sort Attributes #
         #########################
-        self._impl_name = ""
-        self._mana_cost = ""
-        self._color = set([])
-        self._card_types = set([])
-        self._subtypes = set([])
-        self._supertypes = set([])
-        self._abilities = list([])
-        self._power = 0
-        self._toughness = 0
-        self._loyalty = 0
-        self._controller = ""
+        self._base = HASH_CONS.base_characteristics(impl_name,
+                                                    mana_cost,
+                                                    card_types,
+                                                    subtypes,
+                                                    supertypes,
+                                                    power,
+                                                    toughness,
+                                                    loyalty,
+                                                    color)
+        self._abilities = FrozenList.coerce(abilities)
+        self._controller = controller
 
         ############################
         # Miscellaneous Attributes #
         ############################
-        self.object_id = id(self)
-        self.temp_id = uuid.uuid4().hex
-        self.temp_id_history = set([])
+        self.object_id = OBJECT_IDS.allocate()
+        self.temp_id = TEMP_IDS.allocate()
+        # NOTE # Created on the first zone change; see update_temp_id.
+        self.temp_id_history = None
         self.prior_zone = None
         self.current_zone = None
         self.environment = None
+        self.owner = None
 
         #####################
         # Marker Attributes #
@@ -46,7 +83,8 @@ class Modifiable:
         self.chosen_opponent = None
         self.chosen_X = None
         self.object_types = set([])
-        self.copiable_values = {}
+        # NOTE # None means the copiable values are the base values; see copiable_values.
+        self._copiable_values = None
         self.timestamp = 0
 
         ###################
@@ -63,121 +101,56 @@ class Modifiable:
         self.is_attacking = False
         self.is_blocking = False
 
-
-        for kwarg in kwargs:
-            if kwarg in CHARX:
-                under_kwarg = '_' + kwarg
-                setattr(self, under_kwarg, kwargs[kwarg])
-            else:
-                setattr(self, kwarg, kwargs[kwarg])
-
-        self.solve_copiable_values()
+        self.switched_power = None
+        self.switched_toughness = None
 
 
     def update_temp_id(self):
-        self.temp_id_history.add(self.temp_id)
-        self.temp_id = uuid.uuid4().hex
-
-
-    def query_(self, attribute_name):
         '''\
-            Links to the apparent state handler which records the apparent value
-            of certain attributes in the event they've been modified; otherwise,
-            return the base attribute value.
+            Retire the current temp_id, keeping only the TEMP_ID_HISTORY_LENGTH most recent
+            ones in temp_id_history, and allocate a new one. The history is replaced rather than
+            changed in place, since it's an EngineField.
         '''
-        if (self.object_id in APPARENT_X.attr_val_dict):
-            if (attribute_name in APPARENT_X.attr_val_dict[self.object_id]):
-                return APPARENT_X.attr_val_dict[self.object_id][attribute_name]
-        return getattr(self, "_{}".format(attribute_name))
-
-
-    @property
-    def impl_name(self):
-        return self.query_('impl_name')
-
-    @impl_name.setter
-    def impl_name(self, value):
-        APPARENT_X.modify_attribute_value(self, 'impl_name', value)
-
-    @property
-    def mana_cost(self):
-        return self.query_('mana_cost')
-
-    @mana_cost.setter
-    def mana_cost(self, value):
-        APPARENT_X.modify_attribute_value(self, 'mana_cost', value)
-
-    @property
-    def color(self):
-        return self.query_('color')
-
-    @color.setter
-    def color(self, value):
-        APPARENT_X.modify_attribute_value(self, 'color', value)
-
-    @property
-    def card_types(self):
-        return self.query_('card_types')
-
-    @card_types.setter
-    def card_types(self, value):
-        APPARENT_X.modify_attribute_value(self, 'card_types', value)
-
-    @property
-    def subtypes(self):
-        return self.query_('subtypes')
-
-    @subtypes.setter
-    def subtypes(self, value):
-        APPARENT_X.modify_attribute_value(self, 'subtypes', value)
-
-    @property
-    def supertypes(self):
-        return self.query_('supertypes')
-
-    @supertypes.setter
-    def supertypes(self, value):
-        APPARENT_X.modify_attribute_value(self, 'supertypes', value)
-
-    @property
-    def abilities(self):
-        return self.query_('abilities')
-
-    @abilities.setter
-    def abilities(self, value):
-        APPARENT_X.modify_attribute_value(self, 'abilities', value)
-
-    @property
-    def power(self):
-        return self.query_('power')
-
-    @power.setter
-    def power(self, value):
-        APPARENT_X.modify_attribute_value(self, 'power', value)
-
-    @property
-    def toughness(self):
-        return self.query_('toughness')
-
-    @toughness.setter
-    def toughness(self, value):
-        APPARENT_X.modify_attribute_value(self, 'toughness', value)
-
-    @property
-    def loyalty(self):
-        return self.query_('loyalty')
-
-    @loyalty.setter
-    def loyalty(self, value):
-        APPARENT_X.modify_attribute_value(self, 'loyalty', value)
-
-    @property
-    def controller(self):
-        return self.query_('controller')
-
-    @controller.setter
-    def controller(self, value):
-        APPARENT_X.modify_attribute_value(self, 'controller', value)
+        temp_id_history = deque(() if (self.temp_id_history is None) else self.temp_id_history,
+                                maxlen=TEMP_ID_HISTORY_LENGTH)
+        temp_id_history.append(self.temp_id)
+        self.temp_id_history = temp_id_history
+        self.temp_id = TEMP_IDS.allocate()
+
+
+    ###################################################################
+    # Characteristics Subject To Modification By Continuous Effects #
+    ###################################################################
+    impl_name = BaseCharacteristic(HASH_CONS.freeze)
+    mana_cost = BaseCharacteristic(HASH_CONS.freeze)
+    color = BaseCharacteristic(TypeSet.coerce)
+    card_types = BaseCharacteristic(TypeSet.coerce)
+    subtypes = BaseCharacteristic(TypeSet.coerce)
+    supertypes = BaseCharacteristic(TypeSet.coerce)
+    abilities = Characteristic(FrozenList.coerce)
+    power = BaseCharacteristic()
+    toughness = BaseCharacteristic()
+    loyalty = BaseCharacteristic()
+    controller = Characteristic()
+
+    ######################################
+    # Attributes Covered By OBJECT_INDEX #
+    ######################################
+    _controller = IndexedAttribute('_base_controller', 'controller')
+    owner = IndexedAttribute('_owner', 'owner')
+    current_zone = IndexedAttribute('_current_zone', 'current_zone')
+    object_types = IndexedAttribute('_object_types', 'object_types', coerce=HASH_CONS.freeze)
+
+    ############################################
+    # Attributes Changed Within Forked Engines #
+    ############################################
+    temp_id = EngineField('_temp_id')
+    temp_id_history = EngineField('_temp_id_history')
+    prior_zone = EngineField('_prior_zone')
+    timestamp = EngineField('_timestamp')
+    _copiable_values = EngineField('_solved_copiable_values')
+    switched_power = EngineField('_switched_power')
+    switched_toughness = EngineField('_switched_toughness')
 
     @property
     def mana_value_X(self):
@@ -214,10 +187,23 @@ class Modifiable:
         '''\
             Lock in the subset of Modifiable characteristics which are determined
             after Layer Sort is finished with Sublayer 1b.
+            # NOTE #
+            If none of them have been modified, nothing is stored; copiable_values
+            is then derived from the base values on demand.
         '''
-        self.copiable_values = {}
-        for attribute in COPIABLE_ATTRIBUTES:
-            self.copiable_values[attribute] = getattr(self, attribute)
+        modified_values = APPARENT_X.attr_val_dict.get(self.object_id)
+        if not(modified_values) or modified_values.keys().isdisjoint(COPIABLE_ATTRIBUTES):
+            self._copiable_values = None
+        else:
+            self._copiable_values = {attribute: getattr(self, attribute) for attribute in COPIABLE_ATTRIBUTES}
+
+    @property
+    def copiable_values(self):
+        if (self._copiable_values is None):
+            copiable_values = self._base._asdict()
+            copiable_values['abilities'] = self._abilities
+            return copiable_values
+        return self._copiable_values
 
     ##################
     # Marker Methods #
@@ -243,5 +229,30 @@ class Modifiable:
     def count_markers_by_type(self, marker_type):
         return sum(1 for marker in self.markers if isinstance(marker, marker_type))
 
+    def interchangeability_key(self):
+        '''\
+            Return a key which is equal for two objects only if nothing about them---type,
+            apparent characteristics (abilities by type), controller, owner, zone, physical
+            and combat status, markers, attachments and choices---tells them apart, so that
+            choosing one rather than the other makes no difference.
+            See: SymmetricSelectionSpace
+            # NOTE #
+            Doesn't account for other objects referring to this one; see referenced_object_ids.
+        '''
+        return (type(self),
+                tuple(getattr(self, attribute) for attribute in BASE_CHARX),
+                tuple(type(ability) for ability in self.abilities),
+                id(self.controller), id(self.owner), id(self.current_zone), self.object_types,
+                self.is_tapped, self.is_facedown, self.is_flipped, self.is_phased_out,
+                self.is_attacking, self.is_blocking,
+                tuple(sorted(type(marker).__name__ for marker in self.markers)),
+                id(self.enchanted_object), id(self.enchanted_player), id(self.equipped_object),
+                id(self.copy_source_object), id(self.chosen_opponent), self.chosen_X,
+                tuple(self.target_data))
+
     def __repr__(self):
         return "| {} | {} |".format(self.object_id, self.impl_name)
+
+
+# NOTE # Only reads of mutable objects are recorded; see ReadTracer.note.
+ReadTracer.traced_types = (ExpandedPlayerObject, Modifiable)
@@ -1,23 +1,45 @@
-from contfx_config import *
+from footprints import *
 
 
 #######################################
 # Setting Up Minimal Player Instances #
 #######################################
-p0 = ExpandedPlayerObject(player_idx=0)
-p1 = ExpandedPlayerObject(player_idx=1)
+def setup_players():
+    '''\
+        Create the two players of the game hosted by the current Engine, and return them.
+    '''
+    p0 = ExpandedPlayerObject(player_idx=0)
+    p1 = ExpandedPlayerObject(player_idx=1)
+
+    p0.repr_string = "Player 0"
+    p1.repr_string = "Player 1"
+
+    GAME.list_of_player_objects = [p0, p1]
+    GAME.active_idx = 0
+    GAME.current_player = p0
 
-p0.repr_string = "Player 0"
-p1.repr_string = "Player 1"
+    GAME.list_of_game_objects = list([])
+    GAME.list_of_immaterial_objects = list([])
 
-GAME.list_of_player_objects = [p0, p1]
-GAME.active_idx = 0
-GAME.current_player = p0
+    ZH.sync_zones_from_zh_to_players(p0, p1)
+    return p0, p1
+
+
+def new_engine():
+    '''\
+        Return a new Engine hosting a game with two players, independent of every other Engine.
+        Example:
+            engine = new_engine()
+            with engine.activate():
+                p0, p1 = GAME.list_of_player_objects
+                ...
+    '''
+    engine = Engine()
+    engine.run(setup_players)
+    return engine
 
-GAME.list_of_game_objects = list([])
-GAME.list_of_immaterial_objects = list([])
 
-ZH.sync_zones_from_zh_to_players(p0, p1)
+p0, p1 = setup_players()
 
 
 ########################
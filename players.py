@@ -11,12 +11,12 @@ class ExpandedPlayerObject:
         self.starting_lifetotal = 20
         self.max_hand_size = 7
         self.has_priority = False
-        self.object_id = id(self)
-        self.temp_id = uuid.uuid4().hex
-        self.temp_id_history = set([])
+        self.object_id = OBJECT_IDS.allocate()
+        self.temp_id = TEMP_IDS.allocate()
+        self.temp_id_history = None
         self.environment = None
         self.n_lands_played_this_turn = 0
-        self._abilities = list([])
+        self._abilities = EMPTY_ABILITIES
         self.markers = list([])
 
     def __repr__(self):
@@ -26,13 +26,4 @@ class ExpandedPlayerObject:
         assert isinstance(object, ExpandedPlayerObject)
         return self.player_idx == object.player_idx
 
-    @property
-    def abilities(self):
-        if (self.object_id in APPARENT_X.attr_val_dict):
-            if ('abilities' in APPARENT_X.attr_val_dict[self.object_id]):
-                return APPARENT_X.attr_val_dict[self.object_id]['abilities']
-        return self._abilities
-
-    @abilities.setter
-    def abilities(self, value):
-        APPARENT_X.modify_attribute_value(self, 'abilities', value)
+    abilities = Characteristic(FrozenList.coerce)
@@ -0,0 +1,106 @@
+from object_config import *
+
+
+# Testing Counts and Sums Maintained by Selections #
+
+alpha_myr = AlphaMyr(p0)
+test_artifact = TestArtifact(p0)
+opposing_myr = AlphaMyr(p1)
+humility = Humility(p1)
+
+artifacts_you_control = Selection(CONJ(FIND.zone_battlefield, FIND.artifact, isP('controller', p0)))
+creatures = Selection(CONJ(FIND.zone_battlefield, FIND.creature))
+
+ZH.zone_battlefield.add_object(alpha_myr)
+ZH.zone_battlefield.add_object(opposing_myr)
+snapshot()
+
+assert len(artifacts_you_control) == 1
+assert creatures.total('power') == 4
+assert artifacts_you_control.threshold(ge, 1)
+assert not(artifacts_you_control.threshold(gt, 1))
+
+
+# Another artifact enters the battlefield under p0's control.
+ZH.zone_battlefield.add_object(test_artifact)
+snapshot()
+
+assert len(artifacts_you_control) == ObjectCounter(artifacts_you_control).compute() == 2
+assert artifacts_you_control.threshold(eq, 2)
+assert artifacts_you_control.threshold(lt, 3)
+
+
+# Humility enters the battlefield; each creature is 1/1, so the maintained sum follows the
+# changes to power made while applying its effect.
+ZH.zone_battlefield.add_object(humility)
+snapshot()
+
+assert creatures.total('power') == ObjectTotal(creatures, 'power').compute() == 2
+assert len(creatures) == 2
+
+
+# Humility and Alpha Myr leave the battlefield.
+ZH.zone_battlefield.remove_specific_object_(humility)
+ZH.zone_battlefield.remove_specific_object_(alpha_myr)
+ZH.p0_zone_graveyard.add_object(alpha_myr)
+snapshot()
+
+assert len(artifacts_you_control) == 1
+assert creatures.total('power') == 2
+assert not(artifacts_you_control.threshold(ge, 2))
+assert artifacts_you_control.threshold(ne, 0)
+
+
+# Counts agree with the selectable objects.
+assert len(artifacts_you_control) == len(artifacts_you_control.selectable_objects())
+assert len(creatures) == len(creatures.selectable_objects())
+
+
+# Threshold queries which can't be maintained stop scanning once they're decided.
+scanned = []
+def scan(objects):
+    for obj in objects:
+        scanned.append(obj)
+        yield obj
+
+assert decide_threshold(ge, 2, scan(range(10)))
+assert len(scanned) == 2
+assert not(decide_threshold(le, 0, scan(range(10))))
+assert len(scanned) == 3
+assert decide_threshold(eq, 10, scan(range(10)))
+assert decide_threshold(lt, 0, iter([])) is False
+
+
+# Aggregates are registered by the shape of the predicate and the values of its dynamic operands,
+# so a Selection created anew for each snapshot, as by Master of Etherium's characteristic-defining
+# ability, carries on maintaining the count left by the one before it.
+evaluations = []
+evaluate = SelectionAggregate.evaluate
+def counted_evaluate(self, *args):
+    evaluations.append(self)
+    return evaluate(self, *args)
+SelectionAggregate.evaluate = counted_evaluate
+
+master_of_etherium = MasterOfEtherium(p1)
+ZH.zone_battlefield.add_object(master_of_etherium)
+snapshot()
+assert (master_of_etherium.power, len(evaluations)) == (2, 1)
+snapshot()
+assert (master_of_etherium.power, len(evaluations)) == (2, 1)
+test_artifact._controller = p1
+snapshot()
+assert (master_of_etherium.power, len(evaluations)) == (3, 1)
+
+artifacts_they_control = CONJ(FIND.zone_battlefield, FIND.artifact, isP('controller', p1))
+assert len(Selection(artifacts_they_control)) == 3
+assert len(evaluations) == 2
+opposing_myr._controller = p0
+assert len(Selection(CONJ(FIND.zone_battlefield, FIND.artifact, isP('controller', p1)))) == 2
+assert len(evaluations) == 2
+
+# Changing the list of game objects other than by appending to it evaluates the count again.
+GAME.list_of_game_objects.remove(master_of_etherium)
+ZH.zone_battlefield.add_object(TestArtifact(p1))
+assert len(Selection(artifacts_they_control)) == 2
+assert len(evaluations) == 3
+SelectionAggregate.evaluate = evaluate
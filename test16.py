@@ -0,0 +1,57 @@
+from object_config import *
+
+
+# Testing Read-Set Tracing #
+
+master_of_etherium = MasterOfEtherium(p0)
+test_artifact = TestArtifact(p0)
+mountain = Mountain(p1)
+
+ZH.zone_battlefield.add_object(master_of_etherium)
+ZH.zone_battlefield.add_object(test_artifact)
+ZH.zone_battlefield.add_object(mountain)
+
+# Tracing is opt-in; outside of a trace, nothing is recorded.
+assert not(READ_TRACER.active)
+snapshot()
+assert all((component.read_set is None) for component in FX_HANDLER.used_components)
+
+
+# Scenario: Enact each component while recording the reads it makes.
+with READ_TRACER.record_components():
+    snapshot()
+
+assert master_of_etherium.power == master_of_etherium.toughness == 2
+
+cda_component = [component for component in FX_HANDLER.used_components if component.is_cda][0]
+boost_component = [component for component in FX_HANDLER.used_components if (component.layer == '7c')][0]
+
+# Outcome # The CDA counts the artifacts p0 controls on the battlefield, so it reads the
+# zone and card types of every game object, but the controller only of the artifacts,
+# and sets Master of Etherium's power and toughness.
+for game_object in [master_of_etherium, test_artifact, mountain]:
+    assert (game_object.object_id, 'current_zone') in cda_component.read_set
+    assert (game_object.object_id, 'card_types') in cda_component.read_set
+assert (test_artifact.object_id, 'controller') in cda_component.read_set
+assert not((mountain.object_id, 'controller') in cda_component.read_set)
+assert (master_of_etherium.object_id, 'power') in cda_component.read_set
+
+# Outcome # The static ability reads the controller of its host, and the characteristics
+# of the objects it might affect, but nothing about the players.
+assert (master_of_etherium.object_id, 'controller') in boost_component.read_set
+assert (test_artifact.object_id, 'card_types') in boost_component.read_set
+assert not(any((object_id == p0.object_id) for (object_id, attribute) in boost_component.read_set))
+
+
+# Traces nest; the reads of the inner trace are also recorded by the outer trace.
+with READ_TRACER.trace() as outer_reads:
+    with READ_TRACER.trace() as inner_reads:
+        artifacts = Selection(CONJ(FIND.zone_battlefield, FIND.artifact)).selectable_objects()
+    SAR(ref_obj=p1, ref_attr='lifetotal').compute()
+
+assert len(artifacts) == 2
+assert (mountain.object_id, 'card_types') in inner_reads
+assert inner_reads <= outer_reads
+assert (p1.object_id, 'lifetotal') in outer_reads
+assert not((p1.object_id, 'lifetotal') in inner_reads)
+assert not(READ_TRACER.active)
@@ -0,0 +1,38 @@
+from object_config import *
+
+
+# Testing Streaming Selection Enumeration #
+
+creatures = [TestCreatureII(p0) for _ in range(30)]
+for creature in creatures:
+    ZH.zone_battlefield.add_object(creature)
+snapshot()
+
+selection = Selection(CONJ(FIND.zone_battlefield, FIND.creature))
+space = selection.selection_space()
+
+# Outcome # With the default sizes, [0, None], there are 2^30 selections; they're counted
+# rather than generated.
+assert len(space) == 2**30
+
+# Outcome # Iteration is lazy, and follows the order of subpowerset.
+assert list(islice(iter(space), 32)) == list(islice(subpowerset(creatures, 0, None), 32))
+
+# Outcome # Indexing unranks a selection without generating those before it.
+assert space[0] == ()
+assert space[1] == (creatures[0],)
+assert space[-1] == tuple(creatures)
+assert space[31] == (creatures[0], creatures[1])
+
+# Outcome # Sampling draws a selection of legal size from the space.
+sampled = space.sample(rng=Random(0))
+assert all((creature in creatures) for creature in sampled)
+
+# Outcome # Chunks partition the space, so workers can enumerate it independently.
+small_selection = Selection(CONJ(FIND.zone_battlefield, FIND.creature), sizes=[2,3])
+small_space = small_selection.selection_space()
+assert len(small_space) == comb(30, 2) + comb(30, 3)
+chunked = []
+for start, stop in small_space.chunks(7):
+    chunked.extend(small_space.iter_range(start, stop))
+assert chunked == list(small_space) == small_selection.selection_set()
@@ -0,0 +1,34 @@
+from object_config import *
+
+
+# Testing Scry Outcome Enumeration #
+
+cards = [AlphaMyr(p0), Mountain(p0), Swamp(p0), TestArtifact(p0), Clone(p0)]
+
+# Outcome # Scrying five distinct cards has 6 * 5! outcomes, the same ones as scry_splits,
+# but they're generated directly rather than from every permutation.
+outcomes = ScryOutcomes(cards)
+assert len(outcomes) == 6 * factorial(5) == len(scry_splits(cards))
+assert set(outcomes) == set((tuple(top), tuple(bottom)) for (top, bottom) in scry_splits(cards))
+assert outcomes[0] == ((), tuple(cards))
+assert outcomes[-1] == (tuple(reversed(cards)), ())
+assert [outcomes[index] for index in range(0, 720, 37)] == list(islice(outcomes, 0, 720, 37))
+
+# Outcome # When the order of the bottom cards doesn't matter, an outcome is decided by the
+# ordered cards kept on top: the sum of 5!/(5-k)! over k.
+unordered_outcomes = ScryOutcomes(cards, bottom_ordered=False)
+assert len(unordered_outcomes) == len(list(unordered_outcomes)) == 1 + 5 + 20 + 60 + 120 + 120
+for top, bottom in unordered_outcomes:
+    assert list(bottom) == [card for card in cards if (card in bottom)]
+
+# Outcome # Identical cards are only distinguished when asked for; three Mountains and two
+# Swamps have C(5,2) orderings in all, so scrying them has far fewer distinct outcomes.
+lands = [Mountain(p0), Mountain(p0), Swamp(p0), Mountain(p0), Swamp(p0)]
+by_name = ScryOutcomes(lands, key=lambda card: card.impl_name)
+named_outcomes = set((tuple(card.impl_name for card in top), tuple(card.impl_name for card in bottom)) for (top, bottom) in by_name)
+assert len(by_name) == len(named_outcomes) == 6 * comb(5, 2)
+assert len(ScryOutcomes(lands)) == 720
+
+# Outcome # Sampling returns one of the outcomes.
+top, bottom = by_name.sample(rng=Random(0))
+assert (len(top) + len(bottom)) == 5
@@ -0,0 +1,34 @@
+from object_config import *
+
+
+# Testing Symmetry Reduction Over Interchangeable Objects #
+
+myrs = [AlphaMyr(p0) for _ in range(20)]
+mountain = Mountain(p0)
+for game_object in myrs + [mountain]:
+    ZH.zone_battlefield.add_object(game_object)
+snapshot()
+
+permanents = Selection(FIND.zone_battlefield)
+space = permanents.symmetric_selection_space()
+
+# Outcome # Twenty identical Alpha Myrs and a Mountain have 2^21 selections, but a selection
+# is decided by how many Myrs it takes and whether it takes the Mountain.
+assert len(permanents.selection_space()) == 2**21
+assert len(space) == len(list(space)) == 21 * 2
+assert sum(space.weight(counts) for counts in space.choices()) == 2**21
+assert space.selection((3, 1)) == tuple(myrs[:3]) + (mountain,)
+
+# Outcome # Tapping a Myr, or attaching one Myr to another, tells them apart from the rest.
+myrs[0].is_tapped = True
+myrs[1].enchanted_object = myrs[2]
+space = permanents.symmetric_selection_space()
+assert len(space.classes) == 5
+assert len(space) == 2 * 2 * 2 * 18 * 2
+
+# Outcome # Choosing one object for each of two positions from the same list only
+# distinguishes whether the same Myr is chosen twice.
+untapped_myrs = myrs[3:]
+choices = list(symmetric_product_of_objects([untapped_myrs, untapped_myrs], key=create_interchangeability_key(), with_weights=True))
+assert [(choice, weight) for (choice, weight) in choices] == [([myrs[3], myrs[3]], 17), ([myrs[3], myrs[4]], 17 * 16)]
+assert len(symmetric_combinations_of_objects(2, myrs, key=create_interchangeability_key())) < len(combinations_of_objects(2, myrs))
@@ -0,0 +1,60 @@
+from object_config import *
+from batch_combinatorics import *
+
+
+# Testing Batched Combinatorics #
+
+creatures = [TestCreatureII(p0) for _ in range(12)]
+lands = [Mountain(p1) for _ in range(3)]
+
+# Outcome # Index arrays hold one choice per row, in the order of itertools.
+combination_indices = combination_index_array(12, 4)
+assert combination_indices.shape == (comb(12, 4), 4)
+assert [tuple(row) for row in combination_indices.tolist()] == list(combinations(range(12), 4))
+
+product_indices = product_index_array([3, 1, 4])
+assert [tuple(row) for row in product_indices.tolist()] == list(product(range(3), range(1), range(4)))
+
+# Outcome # Chunks concatenate to the full index array.
+assert (np.concatenate(list(iter_combination_index_chunks(12, 4, chunk_size=100))) == combination_indices).all()
+assert (np.concatenate(list(iter_product_index_chunks([3, 1, 4], chunk_size=5))) == product_indices).all()
+
+# Outcome # Object arrays gather the same choices as the list-based functions.
+assert combinations_of_objects_array(3, creatures).tolist() == combinations_of_objects(3, creatures)
+assert product_of_objects_array([creatures[:2], lands, creatures[5:9]]).tolist() == product_of_objects([creatures[:2], lands, creatures[5:9]])
+chunked = np.concatenate(list(iter_product_of_objects_chunks([creatures[:2], lands], chunk_size=4)))
+assert chunked.tolist() == product_of_objects([creatures[:2], lands])
+
+# Outcome # Parameter products stay numeric, so candidates can be scored in bulk.
+parameters = function_parameter_cartesian_product_array([range(3), [0, 5], range(2)])
+assert parameters.dtype.kind == 'i'
+assert [tuple(row) for row in parameters.tolist()] == function_parameter_cartesian_product([range(3), [0, 5], range(2)])
+assert parameters.sum(axis=1).max() == 2 + 5 + 1
+
+# Outcome # Edge cases agree with itertools.
+assert combination_index_array(3, 0).shape == (1, 0)
+assert combination_index_array(2, 3).shape == (0, 3)
+assert combinations_of_objects_array(5, creatures[:2]).tolist() == combinations_of_objects(5, creatures[:2]) == []
+
+# Outcome # Products of no ranges hold a single empty choice, and an empty range empties the product.
+assert product_index_array([]).shape == (1, 0)
+assert (np.concatenate(list(iter_product_index_chunks([]))) == product_index_array([])).all()
+assert product_of_objects_array([]).tolist() == product_of_objects([]) == [[]]
+assert [tuple(row) for row in function_parameter_cartesian_product_array([]).tolist()] == function_parameter_cartesian_product([]) == [()]
+assert product_index_array([3, 0]).shape == (0, 2)
+assert list(iter_product_index_chunks([3, 0])) == []
+assert product_of_objects_array([creatures[:2], []]).tolist() == product_of_objects([creatures[:2], []]) == []
+assert function_parameter_cartesian_product_array([range(2), []]).tolist() == function_parameter_cartesian_product([range(2), []]) == []
+
+# Outcome # Parameters which are sequences are kept whole, and each parameter keeps its own type
+# unless every range has the same numeric dtype.
+pairs = [[(1, 2), (3, 4)], [5, 6]]
+parameters = function_parameter_cartesian_product_array(pairs)
+assert parameters.dtype == object and parameters.shape == (4, 2)
+assert [tuple(row) for row in parameters.tolist()] == function_parameter_cartesian_product(pairs)
+mixed = [[1, 2], [3.5]]
+parameters = function_parameter_cartesian_product_array(mixed)
+assert [tuple(row) for row in parameters.tolist()] == function_parameter_cartesian_product(mixed)
+assert [type(value) for value in parameters[:, 0]] == [int, int]
+assert function_parameter_cartesian_product_array([[0.5, 1.5], [2.5]]).dtype.kind == 'f'
+assert function_parameter_cartesian_product_array(iter([iter([1, 2]), (x for x in 'ab')])).tolist() == [[1, 'a'], [1, 'b'], [2, 'a'], [2, 'b']]
@@ -0,0 +1,50 @@
+from object_config import *
+
+
+# Testing Interchangeable Effect Components #
+
+angers = [Anger(p0) for _ in range(6)]
+for anger in angers:
+    ZH.p0_zone_graveyard.add_object(anger)
+mountain = Mountain(p0)
+creatures = [TestCreature(p0) for _ in range(2)]
+ZH.zone_battlefield.add_object(mountain)
+for creature in creatures:
+    ZH.zone_battlefield.add_object(creature)
+snapshot()
+
+# Outcome # Each copy of Anger's static ability grants haste.
+assert all(any(isinstance(ability, KWAHaste) for ability in creature.abilities) for creature in creatures)
+
+
+# Humility enters the battlefield; its layer 6 component is sorted with those of the six copies of
+# Anger's static ability.
+humility = Humility(p1)
+ZH.zone_battlefield.add_object(humility)
+
+sorted_components = []
+determine_raw_edges = ApparentStateHandler.determine_raw_edges
+def record_raw_edges(self, list_of_components):
+    raw_edges = determine_raw_edges(self, list_of_components)
+    sorted_components.append((list(list_of_components), self.component_classes(list_of_components), dict(self.second_order_component_data)))
+    return raw_edges
+
+ApparentStateHandler.determine_raw_edges = record_raw_edges
+snapshot()
+ApparentStateHandler.determine_raw_edges = determine_raw_edges
+
+layer_6_components, layer_6_classes, layer_6_trials = [data for data in sorted_components if (len(data[0]) == 7)][0]
+
+# Outcome # The copies form one class, in timestamp order; Humility's component forms another.
+assert len(layer_6_classes) == 2
+assert layer_6_classes[0] == layer_6_components[:6]
+assert [component.host_object for component in layer_6_classes[0]] == angers
+
+# Outcome # Dependency was tested between the two classes, and between the first two copies,
+# rather than between each of the 42 ordered pairs of components.
+assert len(layer_6_trials) == 4
+
+# Outcome # Humility has the later timestamp, so each creature loses haste; it's a 1/1.
+for creature in creatures:
+    assert not(creature.abilities)
+    assert (creature.power, creature.toughness) == (1, 1)
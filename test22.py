@@ -0,0 +1,62 @@
+from object_config import *
+
+
+# Testing the Ability-Pair Interaction Matrix #
+
+test_creature = TestCreature(p0)
+mountain = Mountain(p0)
+clutches = Clutches(controller=p1)
+
+ZH.zone_battlefield.add_object(test_creature)
+ZH.zone_battlefield.add_object(mountain)
+ZH.zone_battlefield.add_object(clutches)
+clutches.enchanted_object = mountain
+
+# Outcome # Both static abilities generate components in layer 4, but one only writes the
+# card types of lands, and the other only writes the supertypes of the enchanted permanent,
+# so neither can depend on the other.
+matrix = INTERACTION_MATRIX.load()
+footprint = matrix.footprints['LandsAlsoArtifactsStaticAbility']['4']
+assert footprint.writes == {'card_types'}
+assert not(footprint.may_interact(matrix.footprints['ClutchesStaticAbility']['4']))
+assert ('LandsAlsoArtifactsStaticAbility', 'ClutchesStaticAbility', '4') in matrix.independent
+assert ('ClutchesStaticAbility', 'LandsAlsoArtifactsStaticAbility', '4') in matrix.independent
+
+# Outcome # Generators with components that can't be analysed interact with everything.
+assert matrix.footprints['MasterOfEtheriumCDA']['7a'].reads is None
+assert not(any((name == 'MasterOfEtheriumCDA') for (name, _, _) in matrix.independent))
+
+
+# Scenario: Solve the layer system with and without consulting the matrix.
+trials = []
+pairwise_edges = ApparentStateHandler.pairwise_edges
+def record_trials(self, list_of_components, true_pairs):
+    trials.append(len(true_pairs))
+    return pairwise_edges(self, list_of_components, true_pairs)
+
+ApparentStateHandler.pairwise_edges = record_trials
+snapshot()
+with_matrix = (list(trials), mountain.card_types, mountain.supertypes, mountain.controller)
+
+del trials[:]
+APPARENT_X.interaction_matrix = None
+snapshot()
+without_matrix = (list(trials), mountain.card_types, mountain.supertypes, mountain.controller)
+APPARENT_X.interaction_matrix = INTERACTION_MATRIX
+ApparentStateHandler.pairwise_edges = pairwise_edges
+
+# Outcome # The pair of layer 4 components wasn't tested, and the outcome is the same.
+assert with_matrix[0] == [0]
+assert without_matrix[0] == [2]
+assert with_matrix[1:] == without_matrix[1:]
+assert mountain.card_types == set(['land', 'artifact'])
+assert 'legendary' in mountain.supertypes
+assert mountain.controller is p1
+
+
+# Outcome # The matrix is derived in memory on first use, in a scratch Engine, so deriving it
+# again draws no ids from the current one and gives the same matrix.
+n_effect_ids = len(EFFECT_IDS)
+derived = InteractionMatrix().load()
+assert len(EFFECT_IDS) == n_effect_ids
+assert derived.independent == matrix.independent
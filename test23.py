@@ -0,0 +1,48 @@
+from object_config import *
+
+
+# Testing Approximate Snapshots #
+
+alpha_myr = AlphaMyr(p0)
+master_of_etherium = MasterOfEtherium(p0)
+ZH.zone_battlefield.add_object(alpha_myr)
+ZH.zone_battlefield.add_object(master_of_etherium)
+
+# Outcome # Without a plausible dependency, nothing is flagged, and the apparent state is exact.
+assert approximate_snapshot() == []
+assert not(FX_HANDLER.approximate)
+approximate_values = (alpha_myr.power, alpha_myr.toughness, master_of_etherium.power)
+snapshot()
+assert (alpha_myr.power, alpha_myr.toughness, master_of_etherium.power) == approximate_values == (3, 2, 2)
+
+
+# Outcome # Two anthems on one creature each read the power they add to, but either order gives
+# the same result, so nothing is flagged.
+second_master_of_etherium = MasterOfEtherium(p0)
+ZH.zone_battlefield.add_object(second_master_of_etherium)
+assert approximate_snapshot() == []
+approximate_values = (alpha_myr.power, alpha_myr.toughness, master_of_etherium.power, second_master_of_etherium.power)
+snapshot()
+assert (alpha_myr.power, alpha_myr.toughness, master_of_etherium.power, second_master_of_etherium.power) == approximate_values == (4, 3, 4, 4)
+ZH.zone_battlefield.remove_specific_object_(second_master_of_etherium)
+
+
+# Test Creature II's ability (all artifacts are enchantments) has an earlier timestamp than Test
+# Creature's ability (all lands are artifacts), but depends on it.
+test_creature_ii = TestCreatureII(p0)
+ZH.zone_battlefield.add_object(test_creature_ii)
+test_creature = TestCreature(p0)
+ZH.zone_battlefield.add_object(test_creature)
+mountain = Mountain(p1)
+ZH.zone_battlefield.add_object(mountain)
+
+# Outcome # Applied in timestamp order, the Mountain isn't an enchantment; layer 4 is flagged,
+# since Test Creature's ability changed the card types of an object after Test Creature II's
+# ability had read them.
+assert approximate_snapshot() == ['4']
+assert not('enchantment' in mountain.card_types)
+
+# Outcome # Re-running the flagged snapshot with the exact solver applies them in dependency order.
+snapshot()
+assert FX_HANDLER.flagged_sublayers == []
+assert mountain.card_types == set(['land', 'artifact', 'enchantment'])
@@ -0,0 +1,40 @@
+from object_config import *
+
+
+# Testing Partial Snapshots #
+
+test_creature = TestCreature(p0)
+test_creature_ii = TestCreatureII(p0)
+alpha_myr = AlphaMyr(p1)
+mountain = Mountain(p1)
+humility = Humility(p1)
+for game_object in [test_creature, test_creature_ii, alpha_myr, mountain, humility]:
+    ZH.zone_battlefield.add_object(game_object)
+
+snapshot()
+n_components = len(FX_HANDLER.used_components)
+expected = {game_object.object_id:(game_object.power, game_object.toughness, game_object.card_types)
+            for game_object in [test_creature, alpha_myr, mountain]}
+assert (alpha_myr.power, alpha_myr.toughness) == (1, 1)
+
+
+# Outcome # Querying power and toughness applies Humility's layer 7b component, along with the
+# components its selection depends on (the type-changing effects in layer 4) and its layer 6
+# component (613.6), but not the components that only affect other characteristics.
+assert query([alpha_myr], ['power', 'toughness']) == [{'power': 1, 'toughness': 1}]
+assert (len(FX_HANDLER.used_components) == n_components)
+assert (test_creature.power, test_creature.toughness) == expected[test_creature.object_id][:2]
+
+
+# Outcome # Nothing writes color, so querying it doesn't apply any components at all.
+assert query([mountain], ['color']) == [{'color': set([])}]
+assert FX_HANDLER.partial_snapshot([mountain], ['color'])
+assert not(FX_HANDLER.used_components)
+
+
+# Outcome # The card types of the Mountain depend only on the type-changing effects; they're
+# solved exactly, including the dependency of Test Creature II's ability on Test Creature's.
+assert query([mountain], ['card_types']) == [{'card_types': expected[mountain.object_id][2]}]
+assert mountain.card_types == set(['land', 'artifact', 'enchantment'])
+assert all((component.layer == '4') for component in FX_HANDLER.used_components)
+assert not(alpha_myr.power == 1)
@@ -0,0 +1,127 @@
+from object_config import *
+from threading import Thread
+from time import perf_counter
+
+
+# Testing Hypothetical Snapshots #
+
+alpha_myr = AlphaMyr(p1)
+test_creature = TestCreature(p0)
+mountain = Mountain(p1)
+humility = Humility(p1)
+for game_object in [alpha_myr, test_creature, mountain, humility]:
+    ZH.zone_battlefield.add_object(game_object)
+overcome = Overcome(p0)
+ZH.zone_stack.add_object(overcome)
+
+snapshot()
+current_state = {object_id:dict(modified_values) for object_id, modified_values in APPARENT_X.attr_val_dict.items()}
+current_zones = [list(zone) for zone in ZH.zones]
+current_ids = [(game_object.temp_id, game_object.timestamp) for game_object in GAME.list_of_game_objects]
+n_game_objects = len(GAME.list_of_game_objects)
+assert (alpha_myr.power, alpha_myr.toughness) == (1, 1)
+assert mountain.card_types == set(['land', 'artifact'])
+
+
+def unchanged():
+    return (({object_id:dict(modified_values) for object_id, modified_values in APPARENT_X.attr_val_dict.items()} == current_state)
+            and ([list(zone) for zone in ZH.zones] == current_zones)
+            and ([(game_object.temp_id, game_object.timestamp) for game_object in GAME.list_of_game_objects] == current_ids)
+            and (len(GAME.list_of_game_objects) == n_game_objects)
+            and not(GAME.list_of_immaterial_objects))
+
+
+# Outcome # If Humility left the battlefield, Alpha Myr would be 2/1; afterwards, the current
+# state is as it was, without being derived again.
+assert what_if([alpha_myr], ['power', 'toughness'], moves=[(humility, ZH.p1_zone_graveyard)]) == [{'power': 2, 'toughness': 1}]
+assert (alpha_myr.power, alpha_myr.toughness) == (1, 1)
+assert humility in ZH.zone_battlefield
+assert unchanged()
+
+
+# Outcome # If Test Creature ceased to exist, the Mountain wouldn't be an artifact.
+assert what_if([mountain], ['card_types'], removed_objects=[test_creature]) == [{'card_types': set(['land'])}]
+assert test_creature in GAME.list_of_game_objects
+assert unchanged()
+
+
+# Outcome # Within a Hypothetical, Overcome can resolve; its effect has a timestamp later than
+# Humility's, so it applies after it. Objects of the current state are used as they are, while
+# objects created within the context are discarded, and zones' contents there are their copies.
+with Hypothetical() as hypothetical:
+    resolve_effects(overcome)
+    hypothetical.move(overcome, ZH.p0_zone_graveyard)
+    token = TestArtifact(p0)
+    hypothetical.add_object(token, ZH.zone_battlefield)
+    hypothetical.snapshot()
+    assert (test_creature.power, test_creature.toughness) == (3, 3)
+    assert (alpha_myr.power, alpha_myr.toughness) == (1, 1)
+    assert (token in ZH.zone_battlefield.contents) and not(token in ZH.zone_battlefield)
+    assert (overcome.current_zone is ZH.p0_zone_graveyard) and not(overcome in ZH.zone_stack.contents)
+    assert hypothetical.query([test_creature, token], ['power', 'controller']) == [{'power': 3, 'controller': p0},
+                                                                                   {'power': 0, 'controller': p0}]
+assert not(token in GAME.list_of_game_objects) and not(token in ZH.zone_battlefield)
+assert (overcome in ZH.zone_stack) and (overcome.current_zone is ZH.zone_stack)
+assert (test_creature.power, test_creature.toughness) == (1, 1)
+assert unchanged()
+
+
+# Outcome # The current state is left as it was even if an exception is raised within the context.
+try:
+    with Hypothetical() as hypothetical:
+        hypothetical.move(humility, ZH.zone_exile)
+        hypothetical.snapshot()
+        raise RuntimeError
+except RuntimeError:
+    pass
+assert unchanged()
+snapshot()
+assert unchanged()
+
+
+# Outcome # Hypotheticals can be nested, each within the state of the one around it.
+with Hypothetical() as outer:
+    outer.move(humility, ZH.p1_zone_graveyard)
+    with Hypothetical() as inner:
+        inner.remove_object(test_creature)
+        assert inner.query([mountain], ['card_types']) == [{'card_types': set(['land'])}]
+    assert (test_creature in ZH.zone_battlefield.contents) and not(humility in ZH.zone_battlefield.contents)
+    assert outer.query([alpha_myr], ['power', 'toughness']) == [{'power': 2, 'toughness': 1}]
+    assert outer.query([mountain], ['card_types']) == [{'card_types': set(['land', 'artifact'])}]
+assert unchanged()
+
+
+# Outcome # A Hypothetical in a worker thread doesn't disturb the current state of the main one.
+def worker(results):
+    with Hypothetical() as hypothetical:
+        hypothetical.move(humility, ZH.p1_zone_graveyard)
+        results.append(hypothetical.query([alpha_myr], ['power', 'toughness']))
+
+results = []
+thread = Thread(target=worker, args=(results,))
+thread.start()
+thread.join()
+assert results == [[{'power': 2, 'toughness': 1}]]
+assert (alpha_myr.power, alpha_myr.toughness) == (1, 1)
+assert unchanged()
+
+
+# Outcome # A what-if only derives what its query depends on, starting from the current
+# solution, so on a board where little depends on the change it's cheaper than a snapshot.
+def fastest(function, n_runs=7):
+    timings = []
+    for _ in range(n_runs):
+        start = perf_counter()
+        function()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+bystanders = [Mountain(p0) for _ in range(20)] + [TestArtifact(p1) for _ in range(20)]
+bystanders += [TestCreatureII(p0) for _ in range(10)]
+for game_object in bystanders:
+    ZH.zone_battlefield.add_object(game_object)
+snapshot()
+snapshot_time = fastest(snapshot)
+what_if_time = fastest(lambda: what_if([alpha_myr], ['power', 'toughness'], moves=[(humility, ZH.p1_zone_graveyard)]))
+assert what_if_time < snapshot_time, (what_if_time, snapshot_time)
+assert (alpha_myr.power, alpha_myr.toughness) == (1, 1)
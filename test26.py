@@ -0,0 +1,76 @@
+from object_config import *
+from threading import Thread
+
+
+# Testing Independent Engines #
+
+def build_board(with_humility):
+    p0, p1 = GAME.list_of_player_objects
+    board = [TestCreature(p0), AlphaMyr(p1), Mountain(p1)]
+    if with_humility:
+        board.append(Humility(p1))
+    for game_object in board:
+        ZH.zone_battlefield.add_object(game_object)
+    return board
+
+def apparent_values(board):
+    snapshot()
+    return [(game_object.power, game_object.toughness, set(game_object.card_types)) for game_object in board]
+
+
+# Outcome # Each Engine hosts its own game; the module-level names refer to the services of the
+# current Engine, and to those of the default Engine otherwise.
+humble = new_engine()
+proud = new_engine()
+humble_board = humble.run(build_board, True)
+proud_board = proud.run(build_board, False)
+assert not(GAME.list_of_game_objects)
+assert humble.run(lambda: len(GAME.list_of_game_objects)) == 4
+assert proud.run(lambda: len(GAME.list_of_game_objects)) == 3
+assert not(current_service(GAME) is humble.service('GAME'))
+
+
+# Outcome # Snapshots in one Engine don't disturb the apparent state of the other.
+humble_values = humble.run(apparent_values, humble_board)
+proud_values = proud.run(apparent_values, proud_board)
+assert humble_values[1] == (1, 1, set(['artifact', 'creature']))
+assert proud_values[1] == (2, 1, set(['artifact', 'creature']))
+with humble.activate():
+    assert (humble_board[1].power, humble_board[1].toughness) == (1, 1)
+    with proud.activate():
+        assert (proud_board[1].power, proud_board[1].toughness) == (2, 1)
+    assert (humble_board[1].power, humble_board[1].toughness) == (1, 1)
+    assert current_service(GAME) is humble.service('GAME')
+    with proud.activate():
+        assert current_service(GAME) is proud.service('GAME')
+        assert len(GAME.list_of_game_objects) == 3
+    assert len(GAME.list_of_game_objects) == 4
+
+
+# Outcome # Worker threads can each simulate a game of their own concurrently.
+results = {}
+def simulate(key, with_humility):
+    engine = new_engine()
+    board = engine.run(build_board, with_humility)
+    results[key] = [engine.run(apparent_values, board) for _ in range(5)]
+    engine.close()
+
+workers = [Thread(target=simulate, args=(key, bool(key % 2))) for key in range(4)]
+for worker in workers:
+    worker.start()
+for worker in workers:
+    worker.join()
+assert len(results) == 4
+for key, values in results.items():
+    assert all((value == (humble_values if (key % 2) else proud_values)) for value in values)
+
+
+# Outcome # A closed Engine releases its services.
+proud.close()
+assert not(proud.services)
+assert not(any((type(service).resolved[0][0] is proud) for service in STAND_INS))
+try:
+    proud.run(lambda: GAME.list_of_game_objects)
+    raise AssertionError("A closed Engine shouldn't create services.")
+except RuntimeError:
+    pass
@@ -0,0 +1,23 @@
+from object_config import *
+
+
+# Testing Scry Selections #
+
+library = [AlphaMyr(p0), Mountain(p0), Swamp(p0), TestArtifact(p0)]
+ZH.p0_zone_library.add_objects(library)
+GAME.current_player = p0
+
+# Outcome # A ScrySelection draws from the top n_to_scry cards of the current player's library.
+selection = ScrySelection([2])
+assert selection.n_to_scry == 2
+assert list(selection.set) == list(p0.zone_library[:2])
+
+# Outcome # Its selection set holds the same (top, bottom) splits as ScryOutcomes of those cards.
+outcomes = selection.selection_set()
+assert len(outcomes) == 3 * factorial(2)
+assert outcomes == list(ScryOutcomes(list(p0.zone_library[:2])))
+assert list(selection.selection_set(as_list=False)) == outcomes
+assert len(selection.scry_outcomes(bottom_ordered=False)) == 1 + 2 + 2
+
+# Outcome # Scrying zero cards has only the empty outcome.
+assert ScrySelection([0]).selection_set() == [((), ())]
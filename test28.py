@@ -0,0 +1,53 @@
+from object_config import *
+
+
+# Testing Adaptive Ordering of Conjunctions #
+
+creatures = [TestCreature(p0) for _ in range(64)]
+for creature in creatures:
+    ZH.zone_battlefield.add_object(creature)
+
+# Every fourth creature, which is every creature sampled by the instrumented passes, enchants the
+# next one.
+for creature_idx in range(3, 64, 4):
+    creatures[creature_idx].enchanted_object = creatures[(creature_idx + 1) % 64]
+
+def select(predicate, n_passes=8 * ADAPTIVE_SAMPLE_PERIOD):
+    results = []
+    for _ in range(n_passes):
+        test = predicate.bind()
+        results.append([creature for creature in creatures if test(creature)])
+    return results
+
+
+# Outcome # A cheap, decisive term is moved ahead of the others, and the bound conjunction agrees
+# with value_test.
+slow_predicate = CONJ(FIND.zone_battlefield, P('power', lambda power, v: sum(range(64)) and (power == v), 2),
+                      isP('controller', p1))
+results = select(slow_predicate)
+assert slow_predicate.statistics.enabled
+assert slow_predicate.statistics.order[0] == 2
+assert all((result == [creature for creature in creatures if slow_predicate.value_test(creature)] == [])
+           for result in results)
+
+
+# Outcome # isnotP('enchanted_object', None) guards the following term, but isn't a typeP, so it
+# isn't pinned; sampling sees only enchanting creatures, for which the guarded term is the most
+# decisive, and moves it first. Evaluating it for a creature which enchants nothing raises, so the
+# conjunction returns to declaration order for good, without raising.
+guarded_predicate = CONJ(FIND.zone_battlefield, isnotP('enchanted_object', None),
+                         P('enchanted_object', lambda enchanted_object, v: (enchanted_object.impl_name == v), 'nope'))
+results = select(guarded_predicate)
+assert all((result == []) for result in results)
+assert not(guarded_predicate.statistics.enabled)
+assert guarded_predicate.statistics.order == (0, 1, 2)
+assert not(guarded_predicate.statistics.reordered())
+
+# Outcome # A genuine exception in declaration order still propagates.
+broken_predicate = CONJ(FIND.zone_battlefield, P('enchanted_object', lambda enchanted_object, v: (enchanted_object.impl_name == v), 'nope'),
+                        isnotP('enchanted_object', None))
+try:
+    select(broken_predicate, n_passes=1)
+    raise AssertionError("Declaration order raises for a creature which enchants nothing.")
+except AttributeError:
+    pass
@@ -0,0 +1,64 @@
+from object_config import *
+
+
+# Testing Versioned Selection Caches #
+
+alpha_myr = AlphaMyr(p0)
+mountain = Mountain(p1)
+for game_object in [alpha_myr, mountain]:
+    ZH.zone_battlefield.add_object(game_object)
+
+def expected(predicate):
+    return [game_object for game_object in GAME.list_of_game_objects if predicate.value_test(game_object)]
+
+def selected(predicate):
+    selection = Selection(predicate)
+    result = selection.selectable_objects()
+    assert (selection.cached_key is not None)
+    assert (result == selection.selectable_objects() == expected(predicate))
+    return result
+
+
+# Outcome # Results are cached, and agree with value_test.
+assert selected(FIND.creature) == [alpha_myr]
+assert selected(FIND.artifact) == [alpha_myr]
+assert GAME.active_player is p0
+assert selected(FIND.controller_ap) == [alpha_myr]
+
+
+# Outcome # Changes to the apparent state invalidate the cached results which read the changed
+# attributes: Test Creature makes every land an artifact.
+test_creature = TestCreature(p0)
+ZH.zone_battlefield.add_object(test_creature)
+snapshot()
+assert selected(FIND.artifact) == [alpha_myr, mountain]
+assert selected(FIND.creature) == [alpha_myr, test_creature]
+mountain.controller = p0
+assert selected(FIND.controller_ap) == [alpha_myr, mountain, test_creature]
+
+
+# Outcome # Changes to the value of a dynamic operand invalidate the cached results.
+GAME.swap_active_player()
+assert selected(FIND.controller_ap) == []
+GAME.swap_active_player()
+
+
+# Outcome # Removing an object and creating another, leaving the list of game objects the same
+# length, invalidates the cached results.
+GAME.list_of_game_objects.remove(alpha_myr)
+test_creature_ii = TestCreatureII(p0)
+assert len(GAME.list_of_game_objects) == 3
+assert selected(FIND.creature) == [test_creature, test_creature_ii]
+
+
+# Outcome # So does replacing an object in place.
+GAME.list_of_game_objects[GAME.list_of_game_objects.index(test_creature_ii)] = alpha_myr
+assert selected(FIND.creature) == [test_creature, alpha_myr]
+
+
+# Outcome # The source list is identified by its identity and version, so the key doesn't grow
+# with the number of objects.
+selection = Selection(FIND.creature)
+selection.selectable_objects()
+source_list = GAME.list_of_game_objects
+assert selection.cached_key[0] == ((id(source_list), source_list.version),)
@@ -0,0 +1,75 @@
+from object_config import *
+
+
+# Testing Indexed Selections #
+
+battlefield = [AlphaMyr(p0), TestCreature(p0), Mountain(p1), MasterOfEtherium(p1), Swamp(p0)]
+graveyard = [TestCreatureII(p1), Mountain(p1)]
+for game_object in battlefield:
+    ZH.zone_battlefield.add_object(game_object)
+for game_object in graveyard:
+    ZH.p1_zone_graveyard.add_object(game_object)
+
+# NOTE # (source, predicate) pairs which plan_selection answers from OBJECT_INDEX.
+indexed_selections = [
+    (LINKS.game_objects, CONJ(FIND.game_object_identity, FIND.creature, FIND.zone_battlefield)),
+    (LINKS.game_objects, CONJ(FIND.zone_battlefield, isP('controller', p1))),
+    (LINKS.game_objects, CONJ(FIND.land, isP('owner', p1))),
+    (LINKS.game_objects, DISJ(CONJ(FIND.artifact, FIND.zone_battlefield),
+                              CONJ(FIND.creature, exactinstP('current_zone', Graveyard)))),
+    (LINKS.mutable_objects, CONJ(FIND.game_object_identity, FIND.artifact, FIND.zone_battlefield)),
+]
+
+def source_objects(source_set):
+    if (source_set is LINKS.mutable_objects):
+        return GAME.list_of_player_objects + GAME.list_of_game_objects
+    return list(GAME.list_of_game_objects)
+
+def check_indexed_selections():
+    for source_set, predicate in indexed_selections:
+        scanned = [obj for obj in source_objects(source_set) if predicate.value_test(obj)]
+        candidates = plan_selection(source_set, predicate)
+        assert (candidates is not None)
+        assert (len(candidates) <= len(source_objects(source_set)))
+        assert list(filter(bind_predicate(predicate), candidates)) == scanned
+        assert Selection_(source_set, predicate).selectable_objects() == scanned
+
+
+# Outcome # Indexed selections agree with full scans of the source list.
+check_indexed_selections()
+
+
+# Outcome # ...after snapshots which change characteristics: Test Creature makes the lands
+# artifacts; Master of Etherium's power depends on them.
+snapshot()
+assert 'artifact' in battlefield[2].card_types
+check_indexed_selections()
+
+
+# Outcome # ...after changes to base values and moves between zones.
+battlefield[4].controller = p1
+ZH.move_obj(ZH.p1_zone_graveyard, ZH.zone_battlefield, False, graveyard[0])
+ZH.move_obj(ZH.zone_battlefield, ZH.zone_exile, False, battlefield[0])
+check_indexed_selections()
+
+
+# Outcome # ...after objects are created, and after the list of game objects is changed in place.
+ZH.zone_battlefield.add_object(TestLand(p1))
+check_indexed_selections()
+GAME.list_of_game_objects.remove(battlefield[3])
+ZH.zone_battlefield.add_object(TestArtifact(p1))
+check_indexed_selections()
+GAME.list_of_game_objects[GAME.list_of_game_objects.index(battlefield[1])] = battlefield[3]
+check_indexed_selections()
+
+
+# Outcome # The index tells that the list of game objects hasn't changed by its version, without
+# comparing its contents; any change in place draws a new version.
+registered_ids = OBJECT_INDEX.registered_ids
+check_indexed_selections()
+assert OBJECT_INDEX.registered_ids is registered_ids
+version = GAME.list_of_game_objects.version
+GAME.list_of_game_objects.reverse()
+assert GAME.list_of_game_objects.version != version
+check_indexed_selections()
+assert not(OBJECT_INDEX.registered_ids is registered_ids)
@@ -0,0 +1,66 @@
+from object_config import *
+
+
+# Testing Bound Predicates #
+
+GAME.current_player = p0
+alpha_myr = AlphaMyr(p0)
+test_creature = TestCreature(p0)
+rune_of_flight = RuneOfFlight(p1)
+rune_of_flight.enchanted_object = alpha_myr
+for game_object in [alpha_myr, test_creature, Mountain(p1), MasterOfEtherium(p1), rune_of_flight]:
+    ZH.zone_battlefield.add_object(game_object)
+for game_object in [TestCreatureII(p1), Swamp(p0)]:
+    ZH.p1_zone_graveyard.add_object(game_object)
+ZH.zone_stack.add_object(Overcome(p0))
+snapshot()
+
+def outcome(test, value):
+    try:
+        return bool(test(value))
+    except Exception as exception:
+        return type(exception)
+
+def check_bound_predicates(predicates):
+    tested_objects = GAME.list_of_player_objects + GAME.list_of_game_objects
+    for predicate in predicates:
+        expected = [outcome(predicate.value_test, obj) for obj in tested_objects]
+        for _ in range(2 * ADAPTIVE_SAMPLE_PERIOD):
+            test = bind_predicate(predicate)
+            assert [outcome(test, obj) for obj in tested_objects] == expected, predicate
+
+
+# Outcome # Every named predicate, once bound, agrees with its value_test, including those with
+# dynamic operands, e.g., FIND.controller_ap.
+named_predicates = [getattr(FIND, name) for name in (list(FIND.recipes) + dir(FIND))]
+named_predicates = [predicate for predicate in named_predicates if isinstance(predicate, Bindable)]
+assert len(named_predicates) > 100
+check_bound_predicates(named_predicates)
+
+
+# Outcome # So does every kind of predicate, and compositions of them.
+check_bound_predicates([
+    inP('card_types', 'artifact'),
+    notinP('subtypes', 'myr'),
+    typeinP('abilities', StaticAbility),
+    typenotinP('abilities', StaticAbility),
+    identifyP(alpha_myr),
+    excludeP(alpha_myr),
+    differentP(alpha_myr),
+    anyP('enchanted_object', [alpha_myr, test_creature]),
+    notanyP('enchanted_object', [alpha_myr]),
+    eqP('power', 2),
+    notP('toughness', 1),
+    lteP('mana_value', 2),
+    gteP('power', 2),
+    isP('controller', p0),
+    isnotP('owner', p1),
+    typeP(Modifiable),
+    typenotP(ExpandedPlayerObject),
+    exactinstP('current_zone', Battlefield),
+    notexactinstP('current_zone', Battlefield),
+    anyinstP('current_zone', [Battlefield, Graveyard]),
+    notanyinstP('current_zone', [Stack]),
+    CONJ(FIND.game_object_identity, FIND.creature, DISJ(gteP('power', 3), FIND.controller_curr)),
+    DISJ(FIND.player_object_identity, CONJ(FIND.zone_battlefield, FIND.artifact), excludeP(test_creature)),
+])
@@ -0,0 +1,41 @@
+from object_config import *
+
+
+# Testing Slotted Layouts #
+
+def rejects_unknown_attributes(obj):
+    try:
+        obj.misspelled_attribute = 1
+    except AttributeError:
+        return True
+    return False
+
+
+# Outcome # Modifiable, effect components, deltas, reports and predicates have no __dict__, so
+# assigning an attribute they don't declare raises instead of silently adding it.
+alpha_myr = AlphaMyr(p0)
+slotted_objects = [
+    Piece(impl_name='Bare Piece', controller=p0),
+    FXC(layer="7c", external_deltas=[PowerDelta(amount=2, gain=True)]),
+    PowerDelta(amount=2, gain=True),
+    ToughnessDelta(amount=0, gain=True),
+    SAR(alpha_myr, 'power'),
+    inP('card_types', 'artifact'),
+    eqP('power', 2),
+    CONJ(FIND.creature, FIND.zone_battlefield),
+    Selection(FIND.creature),
+]
+for obj in slotted_objects:
+    assert not(hasattr(obj, '__dict__')), type(obj)
+    assert rejects_unknown_attributes(obj), type(obj)
+
+
+# Outcome # Declared attributes can still be assigned, e.g., the scratch attributes of Sublayer 7d.
+alpha_myr.switched_power = 1
+alpha_myr.switched_toughness = 2
+assert (alpha_myr.switched_power, alpha_myr.switched_toughness) == (1, 2)
+
+
+# Outcome # Card classes keep their __dict__, so ad-hoc attributes on cards still work.
+alpha_myr.note = 'ad hoc'
+assert alpha_myr.note == 'ad hoc'
@@ -0,0 +1,44 @@
+from object_config import *
+
+
+# Testing Characteristic Descriptors #
+
+alpha_myr = AlphaMyr(p0)
+mountain = Mountain(p1)
+for game_object in [alpha_myr, mountain]:
+    ZH.zone_battlefield.add_object(game_object)
+
+
+# Outcome # Without modifications, reads return the base values: those of the shared
+# BaseCharacteristics record, or of the backing field.
+assert not(alpha_myr.object_id in APPARENT_X.attr_val_dict)
+assert (alpha_myr.power, alpha_myr.toughness) == (alpha_myr._base.power, alpha_myr._base.toughness) == (2, 1)
+assert alpha_myr.card_types == set(['artifact', 'creature'])
+assert alpha_myr.controller is alpha_myr._controller is p0
+
+
+# Outcome # A write is recorded in the overlay of APPARENT_X, with the value it replaced on
+# record; reads return the overlaid value, while the base value is left as it was.
+alpha_myr.power = 5
+alpha_myr.controller = p1
+assert APPARENT_X.attr_val_dict[alpha_myr.object_id] == {'power': 5, 'controller': p1}
+assert APPARENT_X.ref_attr_val_dict[alpha_myr.object_id]['power'] == 2
+assert (alpha_myr.power, alpha_myr.controller) == (5, p1)
+assert (alpha_myr._base.power, alpha_myr._controller) == (2, p0)
+assert alpha_myr.toughness == 1
+
+
+# Outcome # Writes are coerced, so every stored value is immutable.
+mountain.card_types = ['land', 'artifact']
+assert isinstance(mountain.card_types, TypeSet)
+assert mountain.card_types == set(['land', 'artifact'])
+assert mountain._base.card_types == set(['land'])
+mountain.abilities = []
+assert isinstance(mountain.abilities, FrozenList)
+
+
+# Outcome # Other objects' reads are unaffected, and a snapshot returns to the base values.
+assert AlphaMyr(p1).power == 2
+snapshot()
+assert (alpha_myr.power, alpha_myr.controller) == (2, p0)
+assert mountain.card_types == set(['land'])
@@ -0,0 +1,66 @@
+from object_config import *
+
+
+# Testing TypeSet #
+
+artifact_creature = TypeSet(['artifact', 'creature'])
+creature = TypeSet(['creature'])
+
+
+# Outcome # TypeSets are hash-consed, decode to their words in vocabulary order, and compare
+# equal to sets and frozensets of the same words.
+assert TypeSet(['creature', 'artifact']) is artifact_creature
+assert TypeSet(artifact_creature) is artifact_creature
+assert TypeSet.from_bits(artifact_creature.bits) is artifact_creature
+assert list(artifact_creature) == ['artifact', 'creature']
+assert len(artifact_creature) == 2 and bool(artifact_creature) and not(EMPTY_TYPESET)
+assert ('creature' in artifact_creature) and not('land' in artifact_creature)
+assert not('no such word' in artifact_creature)
+assert artifact_creature == set(['creature', 'artifact']) == frozenset(['artifact', 'creature'])
+assert artifact_creature != set(['creature'])
+assert artifact_creature != set(['creature', 'artifact', 'no such word'])
+
+
+# Outcome # ...and hash like the equivalent frozenset, so either finds the other in a dict or set.
+assert hash(artifact_creature) == hash(frozenset(['artifact', 'creature']))
+assert hash(EMPTY_TYPESET) == hash(frozenset())
+assert artifact_creature in {frozenset(['artifact', 'creature']): 1}
+assert frozenset(['artifact', 'creature']) in {artifact_creature: 1}
+assert len(set([artifact_creature, frozenset(['creature', 'artifact'])])) == 1
+
+
+# Outcome # Set operations accept TypeSets, sets, frozensets, lists and tuples, and return
+# canonical TypeSets.
+assert (creature | ['artifact']) is artifact_creature
+assert (['artifact'] | creature) is artifact_creature
+assert (artifact_creature & set(['creature', 'land'])) is creature
+assert (artifact_creature - frozenset(['artifact'])) is creature
+assert (set(['artifact', 'creature', 'land']) - artifact_creature) == set(['land'])
+assert (artifact_creature ^ ('creature', 'land')) == set(['artifact', 'land'])
+assert artifact_creature.union(['land']) == set(['artifact', 'creature', 'land'])
+assert artifact_creature.intersection(creature) is creature
+assert artifact_creature.difference(creature) == set(['artifact'])
+assert artifact_creature.symmetric_difference(creature) == set(['artifact'])
+
+
+# Outcome # Subset and disjointness tests.
+assert creature <= artifact_creature and creature < artifact_creature
+assert not(artifact_creature < artifact_creature) and (artifact_creature <= artifact_creature)
+assert artifact_creature >= set(['creature']) and artifact_creature > set(['creature'])
+assert not(artifact_creature >= set(['creature', 'no such word']))
+assert creature.issubset(artifact_creature) and artifact_creature.issuperset(creature)
+assert creature.isdisjoint(['land', 'artifact'])
+assert not(creature.isdisjoint(artifact_creature))
+
+
+# Outcome # Words outside the predefined vocabularies are interned on first use.
+novel = TypeSet(['creature', 'test word'])
+assert list(novel) == ['creature', 'test word']
+assert novel == set(['test word', 'creature'])
+assert hash(novel) == hash(frozenset(['test word', 'creature']))
+
+
+# Outcome # Characteristics are coerced to TypeSets, which are shared rather than copied.
+alpha_myr = AlphaMyr(p0)
+assert alpha_myr.card_types is artifact_creature
+assert deepcopy(artifact_creature) is artifact_creature
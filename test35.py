@@ -0,0 +1,51 @@
+from object_config import *
+import top
+
+
+# Testing Hash-Consed Characteristic Values #
+
+# Outcome # Equal values are frozen to one shared instance.
+assert HASH_CONS.freeze(set(['myr', 'golem'])) is HASH_CONS.freeze(frozenset(['golem', 'myr']))
+assert HASH_CONS.freeze(''.join(['Alpha', ' Myr'])) is HASH_CONS.freeze('Alpha Myr')
+assert TypeSet(['creature', 'artifact']) is TypeSet(('artifact', 'creature'))
+assert HASH_CONS.freeze([]) is HASH_CONS.freeze(()) is EMPTY_ABILITIES
+first_myr, second_myr = AlphaMyr(p0), AlphaMyr(p1)
+assert first_myr.subtypes is second_myr.subtypes
+assert first_myr.impl_name is second_myr.impl_name
+
+
+# Outcome # Frozen values can't be changed in place, so sharing them is safe.
+def immutable(change):
+    try:
+        change()
+    except (AttributeError, TypeError):
+        return True
+    return False
+
+card_types = first_myr.card_types
+assert immutable(lambda: setattr(card_types, 'bits', 0))
+assert immutable(lambda: delattr(card_types, 'bits'))
+assert immutable(lambda: card_types.add('land'))
+assert immutable(lambda: HASH_CONS.freeze(set(['myr'])).add('golem'))
+assert immutable(lambda: first_myr.abilities.append(None))
+assert immutable(lambda: setattr(first_myr._base, 'power', 5))
+assert card_types == set(['artifact', 'creature'])
+assert second_myr.card_types == set(['artifact', 'creature'])
+
+
+# Outcome # The tables are shared by every Engine, so each is cleared when it outgrows
+# HASH_CONS_LIMIT; values frozen before are still equal to those frozen after.
+n_typesets = len(HASH_CONS.typesets)
+top.HASH_CONS_LIMIT = n_typesets + 1
+creature_land = TypeSet(['creature', 'land'])
+assert len(HASH_CONS.typesets) == n_typesets + 1
+assert TypeSet(['creature', 'land', 'artifact']) == set(['creature', 'land', 'artifact'])
+assert len(HASH_CONS.typesets) == 1
+assert TypeSet(['land', 'creature']) == creature_land
+assert hash(TypeSet(['land', 'creature'])) == hash(creature_land)
+top.HASH_CONS_LIMIT = 2
+for power in range(4):
+    Piece(impl_name='Token', power=power, controller=p0)
+    HASH_CONS.freeze(set(['token', str(power)]))
+assert len(HASH_CONS.records) <= 2
+assert len(HASH_CONS.frozensets) <= 2
@@ -0,0 +1,50 @@
+from object_config import *
+
+
+# Testing Shared Base Characteristics #
+
+alpha_myr = AlphaMyr(p0)
+first_clone, second_clone = Clone(p0), Clone(p1)
+first_lorian, second_lorian = BranchsnapLorian(p0), BranchsnapLorian(p0)
+for game_object in [alpha_myr, second_clone, first_lorian, second_lorian]:
+    ZH.zone_battlefield.add_object(game_object)
+snapshot()
+clone_values = [getattr(second_clone, attribute) for attribute in BASE_CHARX]
+lorian_values = [getattr(second_lorian, attribute) for attribute in BASE_CHARX]
+
+
+# Outcome # Identically defined objects share one BaseCharacteristics record, whoever controls
+# them; objects defined differently don't.
+assert first_clone._base is second_clone._base
+assert first_lorian._base is second_lorian._base
+assert AlphaMyr(p1)._base is alpha_myr._base
+assert not(first_clone._base is alpha_myr._base)
+assert (first_clone.controller, second_clone.controller) == (p0, p1)
+
+
+# Outcome # A copy effect changes the apparent values of the copy alone; the shared record
+# and the other object with the same definition are left as they were.
+shared_base = first_clone._base
+first_clone.copy_source_object = alpha_myr
+ZH.zone_battlefield.add_object(first_clone)
+snapshot()
+for attribute in COPIABLE_ATTRIBUTES:
+    assert getattr(first_clone, attribute) == getattr(alpha_myr, attribute)
+assert first_clone._base is second_clone._base is shared_base
+assert [getattr(second_clone, attribute) for attribute in BASE_CHARX] == clone_values
+assert second_clone.impl_name == 'Clone'
+
+
+# Outcome # So does turning an object face down.
+first_lorian.turn_facedown()
+snapshot()
+assert (first_lorian.power, first_lorian.toughness) == (2, 2)
+assert first_lorian.impl_name == ''
+assert first_lorian._base is second_lorian._base
+assert [getattr(second_lorian, attribute) for attribute in BASE_CHARX] == lorian_values
+
+
+# Outcome # ...and so does assigning an apparent value directly.
+second_clone.power = 7
+assert (second_clone.power, Clone(p0).power) == (7, shared_base.power)
+assert second_clone._base is shared_base
@@ -0,0 +1,66 @@
+from object_config import *
+
+
+# Testing Logical Clocks And Id Allocators #
+
+def play_out():
+    ''' Return the ids and timestamps handed out while playing out a small scenario. '''
+    p0, p1 = GAME.list_of_player_objects
+    board = [AlphaMyr(p0), TestCreature(p0), Mountain(p1), Humility(p1)]
+    timestamps = []
+    for game_object in board:
+        ZH.zone_battlefield.add_object(game_object)
+        timestamps.append(game_object.timestamp)
+    overcome = Overcome(p0)
+    ZH.zone_stack.add_object(overcome)
+    resolve_effects(overcome)
+    ZH.move_obj(ZH.zone_battlefield, ZH.p1_zone_graveyard, False, board[3])
+    timestamps.append(board[3].timestamp)
+    snapshot()
+    effects = [effect for effect in GAME.list_of_immaterial_objects if isinstance(effect, Effect)]
+    return {
+        'object_ids': [game_object.object_id for game_object in board + [overcome]],
+        'temp_ids': [game_object.temp_id for game_object in board + [overcome]],
+        'timestamps': timestamps,
+        'effects': [(effect.timestamp, [component.object_id for component in effect.components]) for effect in effects],
+        'now': CLOCK.now,
+        'power': [game_object.power for game_object in board],
+    }
+
+
+# Outcome # Each tick of the clock is greater than every earlier one.
+ticks = [CLOCK.tick() for _ in range(100)]
+assert all((earlier < later) for earlier, later in zip(ticks, ticks[1:]))
+assert TIMESTAMP() > ticks[-1]
+
+
+# Outcome # Ids are dense, consecutive integers handed out in allocation order.
+first_id = OBJECT_IDS.allocate()
+assert [OBJECT_IDS.allocate() for _ in range(3)] == [first_id + 1, first_id + 2, first_id + 3]
+assert len(OBJECT_IDS) == first_id + 4
+
+
+# Outcome # Objects entering zones one after another receive strictly increasing timestamps,
+# and every id and timestamp is the same each time the same game is played out.
+first_run = new_engine().run(play_out)
+second_run = new_engine().run(play_out)
+assert all((earlier < later) for earlier, later in zip(first_run['timestamps'], first_run['timestamps'][1:]))
+assert len(set(first_run['object_ids'])) == len(first_run['object_ids'])
+assert first_run['effects']
+assert first_run == second_run
+
+
+# Outcome # Zone changes retire temp_ids, keeping only the TEMP_ID_HISTORY_LENGTH most recent.
+alpha_myr = AlphaMyr(p0)
+assert alpha_myr.temp_id_history is None
+retired_temp_ids = []
+for move_idx in range(2 * TEMP_ID_HISTORY_LENGTH):
+    retired_temp_ids.append(alpha_myr.temp_id)
+    zone = ZH.zone_battlefield if (move_idx % 2) else ZH.zone_exile
+    if (alpha_myr.current_zone is None):
+        zone.add_object(alpha_myr)
+    else:
+        ZH.move_obj(alpha_myr.current_zone, zone, False, alpha_myr)
+    assert not(alpha_myr.temp_id in retired_temp_ids)
+assert list(alpha_myr.temp_id_history) == retired_temp_ids[-TEMP_ID_HISTORY_LENGTH:]
+assert alpha_myr.temp_id_history.maxlen == TEMP_ID_HISTORY_LENGTH
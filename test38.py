@@ -0,0 +1,60 @@
+from object_config import *
+
+
+# Testing Hash-Consed Predicates And Shared Selection Results #
+
+alpha_myr = AlphaMyr(p0)
+opposing_myr = AlphaMyr(p1)
+for game_object in [alpha_myr, opposing_myr, Mountain(p0)]:
+    ZH.zone_battlefield.add_object(game_object)
+snapshot()
+
+
+# Outcome # Structurally identical predicate trees are canonicalized to one instance.
+first = PREDICATES.canonical(CONJ(FIND.zone_battlefield, inP('card_types', 'artifact'), isP('controller', p0)))
+second = PREDICATES.canonical(CONJ(FIND.zone_battlefield, inP('card_types', 'artifact'), isP('controller', p0)))
+assert first is second
+assert PREDICATES.canonical(first) is first
+assert not(PREDICATES.canonical(CONJ(FIND.zone_battlefield, inP('card_types', 'artifact'), isP('controller', p1))) is first)
+
+
+# Outcome # Nested junctions of the same type are flattened, and repeated constituents dropped,
+# in declaration order; junctions of the other type aren't flattened into them.
+nested = PREDICATES.canonical(CONJ(FIND.zone_battlefield, CONJ(inP('card_types', 'artifact'), FIND.zone_battlefield),
+                                   isP('controller', p0)))
+assert nested is first
+assert len(nested.predicates) == 3
+mixed = PREDICATES.canonical(CONJ(FIND.zone_battlefield, DISJ(FIND.artifact, FIND.creature)))
+assert [type(predicate) for predicate in mixed.predicates] == [type(FIND.zone_battlefield), Disjunction]
+flat = PREDICATES.canonical(DISJ(FIND.artifact, DISJ(FIND.creature, FIND.artifact)))
+assert flat.predicates == [PREDICATES.canonical(FIND.artifact), PREDICATES.canonical(FIND.creature)]
+
+
+# Outcome # True and 1 (and False and 0) are equal, but they're kept apart as operands.
+assert not(PREDICATES.canonical(eqP('is_tapped', True)) is PREDICATES.canonical(eqP('is_tapped', 1)))
+assert not(PREDICATES.canonical(eqP('is_tapped', False)) is PREDICATES.canonical(eqP('is_tapped', 0)))
+assert PREDICATES.canonical(eqP('is_tapped', True)) is PREDICATES.canonical(eqP('is_tapped', True))
+
+
+# Outcome # Predicates which differ only in the identity of a dynamic operand, e.g., the controller
+# of a different object, have the same shape, so two selections with the same values of their
+# dynamic operands share one stored result.
+first_selection = Selection(CONJ(FIND.zone_battlefield, FIND.artifact, isP('controller', SAR(alpha_myr, 'controller'))))
+second_selection = Selection(CONJ(FIND.zone_battlefield, FIND.artifact, isP('controller', SAR(Mountain(p0), 'controller'))))
+assert not(first_selection.predicate is second_selection.predicate)
+shape = PREDICATES.shape(first_selection.predicate)
+assert shape is not None and (shape == PREDICATES.shape(second_selection.predicate))
+n_results = len(PREDICATES.results)
+assert first_selection.selectable_objects() == [alpha_myr]
+assert len(PREDICATES.results) == n_results + 1
+assert second_selection.selectable_objects() == [alpha_myr]
+assert len(PREDICATES.results) == n_results + 1
+assert PREDICATES.cached_result(shape, first_selection.cached_key) is PREDICATES.cached_result(shape, second_selection.cached_key)
+
+
+# Outcome # ...while different values of the dynamic operands don't collide.
+third_selection = Selection(CONJ(FIND.zone_battlefield, FIND.artifact, isP('controller', SAR(opposing_myr, 'controller'))))
+assert PREDICATES.shape(third_selection.predicate) == shape
+assert third_selection.selectable_objects() == [opposing_myr]
+assert len(PREDICATES.results) == n_results + 2
+assert first_selection.selectable_objects() == [alpha_myr]
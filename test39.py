@@ -0,0 +1,56 @@
+from object_config import *
+
+
+# Testing Lazily Built Named Predicates #
+
+library = PhiLibrary()
+recipes = dict(library.recipes)
+named_lists = (library.player_kontrol_predicate_attributes + library.player_zone_predicate_attributes
+               + library.object_zone_predicate_attributes + library.relevant_object_zone_by_kontrol_predicate_attributes)
+
+
+# Outcome # Every name in the lists of generated predicates has a recipe, and isn't built until
+# it's looked up.
+assert len(recipes) > 100
+assert set(named_lists) <= (set(recipes) | set(vars(library)))
+assert not(any((name in vars(library)) for name in recipes))
+assert set(recipes) <= set(dir(library))
+
+
+# Outcome # The predicate built on first lookup has the same structure as building it eagerly,
+# from the same recipe; it's stored as an ordinary attribute, and the recipe is dropped.
+for name, (recipe, args) in recipes.items():
+    lazy = getattr(library, name)
+    assert predicate_key(lazy, Identity) == predicate_key(recipe(*args), Identity), name
+    assert vars(library)[name] is lazy is getattr(library, name)
+    assert not(name in library.recipes)
+assert not(library.recipes)
+assert library.creature.value_test(AlphaMyr(p0)) and not(library.creature.value_test(Mountain(p0)))
+
+
+# Outcome # Unknown names raise AttributeError.
+try:
+    library.no_such_predicate
+    raise AssertionError("Unknown names aren't predicates.")
+except AttributeError:
+    pass
+
+
+# Outcome # A recipe which raises keeps its name, so that the lookup can be retried.
+attempts = []
+def flaky_recipe():
+    attempts.append(None)
+    if (len(attempts) == 1):
+        raise RuntimeError("Not yet.")
+    return eqP('power', 2)
+
+library.define('flaky', flaky_recipe)
+try:
+    library.flaky
+    raise AssertionError("The first attempt raises.")
+except RuntimeError:
+    pass
+assert 'flaky' in library.recipes
+assert library.flaky.value_test(AlphaMyr(p0))
+assert len(attempts) == 2
+assert not('flaky' in library.recipes)
@@ -1,20 +1,64 @@
-import uuid
 import re
-import networkx as nx
-import numpy as np
-np.random.seed(112358)
+import sys
+import importlib
 
-from copy import deepcopy
+from copy import copy, deepcopy
 from operator import add as ADD
 from operator import sub as SUB
-from operator import concat, eq, ne, iadd, isub, is_, contains, le, ge, itemgetter, xor
-from time import time as TIMESTAMP
-from itertools import chain, combinations, combinations_with_replacement, filterfalse
-from itertools import groupby, permutations, product, tee
+from operator import concat, eq, ne, iadd, isub, is_, contains, le, ge, lt, gt, attrgetter, itemgetter, xor
+from itertools import chain, combinations, combinations_with_replacement, count, filterfalse
+from itertools import groupby, islice, permutations, product, tee
 from collections import defaultdict
 from collections import deque
+from collections import namedtuple
 from collections.abc import Iterable
 from functools import partial, reduce
+from math import comb, factorial
+from random import Random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from time import perf_counter_ns
+
+
+#################
+# Heavy Imports #
+#################
+class LazyModule:
+    '''\
+        Stand-in for a module which is only imported the first time one of its attributes is
+        looked up, e.g., nx.DiGraph, so that importing this package doesn't pay for it up front.
+        on_import, if given, is called with the module once it has been imported.
+    '''
+    __slots__ = ('module_name', 'on_import', 'module')
+
+    def __init__(self, module_name, on_import=None):
+        self.module_name = module_name
+        self.on_import = on_import
+        self.module = None
+
+    def load(self):
+        if (self.module is None):
+            module = importlib.import_module(self.module_name)
+            if (self.on_import is not None):
+                self.on_import(module)
+            self.module = module
+        return self.module
+
+    def __getattr__(self, attribute):
+        return getattr(self.load(), attribute)
+
+    def __repr__(self):
+        return "<lazy module '{}'>".format(self.module_name)
+
+
+RANDOM_SEED = 112358
+
+def seed_random(numpy_module):
+    numpy_module.random.seed(RANDOM_SEED)
+
+nx = LazyModule('networkx')
+np = LazyModule('numpy', on_import=seed_random)
 
 
 #####################
@@ -25,7 +69,7 @@ class Computable:
         Subclasses are variations on getter methods for certain attributes using
         a compute() method. See also: class dynamic.
     '''
-    pass
+    __slots__ = ()
 
 
 class dynamic(property):
@@ -40,6 +84,345 @@ class dynamic(property):
         return result
 
 
+##################
+# Engine Context #
+##################
+# NOTE # Maps the name of each engine service to the function which creates an instance of it.
+ENGINE_SERVICES = {}
+
+
+class Engine:
+    '''\
+        Owns one instance of each of the services which hold the state of a game, e.g., GAME, ZH,
+        APPARENT_X and FX_HANDLER (see ENGINE_SERVICES), so that several games can be hosted in
+        one process. The module-level names of the services are EngineService instances which
+        forward every lookup to the instance owned by the current Engine, i.e., the one most
+        recently activated in the calling thread (or context), or DEFAULT_ENGINE otherwise.
+            Example:
+                engine = Engine()
+                with engine.activate():
+                    ... # GAME, ZH, etc. are those of engine
+        Each thread starts out with DEFAULT_ENGINE as its current Engine, so worker threads can
+        each activate an Engine of their own; objects must only be used while the Engine they
+        were created in is current. Tables of immutable values (HASH_CONS, TYPE_VOCABULARY) and
+        the INTERACTION_MATRIX, which is derived from the code, are shared by every Engine.
+
+            services        service name -> instance
+            overlay         the attr_val_dict of its APPARENT_X, which Characteristic descriptors read
+            traced_reads    the read set of its innermost active trace, or None; see ReadTracer
+            fields          the field overlay of a forked Engine, or None; see fork()
+        # NOTE #
+        Services are created in the order they're registered, with the Engine activated, so that
+        a service can refer to those registered before it. Given services, e.g., by fork(), the
+        Engine adopts them instead.
+    '''
+    __slots__ = ('services', 'overlay', 'traced_reads', 'fields', 'closed')
+
+    def __init__(self, services=None, fields=None):
+        self.services = {}
+        self.overlay = None
+        self.traced_reads = None
+        self.fields = fields
+        self.closed = False
+        if (services is None):
+            for service_name in list(ENGINE_SERVICES):
+                self.service(service_name)
+        else:
+            for service_name, instance in services.items():
+                self.adopt(service_name, instance)
+
+    def service(self, service_name):
+        instance = self.services.get(service_name)
+        if (instance is None):
+            if self.closed:
+                raise RuntimeError("{} has been closed.".format(self))
+            with self.activate():
+                instance = ENGINE_SERVICES[service_name]()
+            self.adopt(service_name, instance)
+        return instance
+
+    def adopt(self, service_name, instance):
+        self.services[service_name] = instance
+        bind_engine = getattr(instance, 'bind_engine', None)
+        if (bind_engine is not None):
+            bind_engine(self)
+
+    def fork(self):
+        '''\
+            Return a new Engine layered over this one, which shares its objects, and those of its
+            services which don't define fork(), e.g., ZH and LINKS; each of the others is given
+            the instance returned by its fork(), e.g., the forked APPARENT_X starts out with the
+            solution of this Engine.
+            Within the forked Engine, assignments to the EngineFields and IndexedAttributes of the
+            objects it shares (e.g., current_zone, temp_id and timestamp) and changes to the contents
+            of Zones are recorded in its field overlay, which maps the id of each object it changed
+            to that object and a dictionary of its changed values, rather than made to the objects;
+            so only the objects which are changed are copied, one field at a time, and nothing done
+            within the forked Engine changes the state of this one.
+            # NOTE #
+            A service which keeps a reference to its Engine (see bind_engine) has to define fork().
+        '''
+        fields = {}
+        if (self.fields is not None):
+            fields = {key: (obj, dict(values)) for key, (obj, values) in self.fields.items()}
+        services = {}
+        for service_name, instance in self.services.items():
+            fork = getattr(instance, 'fork', None)
+            services[service_name] = instance if (fork is None) else fork()
+        return Engine(services, fields)
+
+    @contextmanager
+    def activate(self):
+        token = CURRENT_ENGINE.set(self)
+        try:
+            yield self
+        finally:
+            CURRENT_ENGINE.reset(token)
+
+    def run(self, function, *args, **kwargs):
+        ''' Call function with this Engine activated, e.g., as the target of a worker thread. '''
+        with self.activate():
+            return function(*args, **kwargs)
+
+    def close(self):
+        ''' Release every service, and with them, the state of the game. '''
+        if (self is DEFAULT_ENGINE):
+            raise ValueError("The default Engine can't be closed.")
+        self.closed = True
+        self.services.clear()
+        self.overlay = None
+        self.traced_reads = None
+        self.fields = None
+        for service in STAND_INS:
+            type(service).forget(self)
+
+    def __repr__(self):
+        return "<Engine {}>".format(hex(id(self)))
+
+
+class EngineService:
+    '''\
+        Stand-in for the instance of a service owned by the current Engine; see Engine.
+        Attribute lookups, assignments, and the operators used on services, are forwarded to it.
+        # NOTE #
+        Each stand-in is the only instance of a subclass of its own (see stand_in_type), which
+        keeps the (Engine, instance) pair it last resolved to, so that while the current Engine
+        doesn't change, a lookup costs an identity check. Hot paths should still bind
+        current_service(SERVICE) to a local once, rather than look up attributes of the stand-in
+        over and over.
+    '''
+    __slots__ = ('service_name',)
+
+    def __init__(self, service_name):
+        object.__setattr__(self, 'service_name', service_name)
+
+    def __setattr__(self, attribute, value):
+        setattr(current_service(self), attribute, value)
+
+    def __delattr__(self, attribute):
+        delattr(current_service(self), attribute)
+
+    def __bool__(self):
+        return bool(current_service(self))
+
+    def __len__(self):
+        return len(current_service(self))
+
+    def __iter__(self):
+        return iter(current_service(self))
+
+    def __contains__(self, item):
+        return (item in current_service(self))
+
+    def __matmul__(self, other):
+        return current_service(self) @ other
+
+    def __repr__(self):
+        return repr(current_service(self))
+
+SERVICE_NAME = EngineService.service_name.__get__
+UNRESOLVED = (None, None)
+# NOTE # Every EngineService, so that closing an Engine can drop the pairs which refer to it.
+STAND_INS = []
+
+
+def stand_in_type(service_name):
+    '''\
+        Return a subclass of EngineService for the service called service_name. The pair it
+        last resolved to is the only element of resolved, which __getattribute__ reads from its
+        closure, since reading a slot of the stand-in from within its own __getattribute__ would
+        cost more than the lookup it saves. The pair is replaced by a single assignment, so that
+        other threads never see a mismatched pair.
+    '''
+    resolved = [UNRESOLVED]
+
+    def resolve():
+        engine = CURRENT_ENGINE.get()
+        engine_and_instance = resolved[0]
+        if (engine_and_instance[0] is engine):
+            return engine_and_instance[1]
+        instance = engine.service(service_name)
+        resolved[0] = (engine, instance)
+        return instance
+
+    def forget(engine):
+        if (resolved[0][0] is engine):
+            resolved[0] = UNRESOLVED
+
+    def __getattribute__(self, attribute):
+        engine, instance = resolved[0]
+        if (engine is CURRENT_ENGINE.get()):
+            return getattr(instance, attribute)
+        return getattr(resolve(), attribute)
+
+    return type(service_name, (EngineService,), {
+        '__slots__': (),
+        '__getattribute__': __getattribute__,
+        'resolved': resolved,
+        'resolve': staticmethod(resolve),
+        'forget': staticmethod(forget),
+    })
+
+
+def current_service(service):
+    ''' Return the instance of the EngineService service owned by the current Engine. '''
+    service_type = type(service)
+    engine, instance = service_type.resolved[0]
+    if (engine is CURRENT_ENGINE.get()):
+        return instance
+    return service_type.resolve()
+
+
+def engine_service(service_name, factory):
+    '''\
+        Register factory as the function which creates the service called service_name, create
+        the instance owned by DEFAULT_ENGINE, and return the EngineService standing in for it.
+    '''
+    ENGINE_SERVICES[service_name] = factory
+    DEFAULT_ENGINE.service(service_name)
+    service = stand_in_type(service_name)(service_name)
+    STAND_INS.append(service)
+    return service
+
+
+DEFAULT_ENGINE = Engine()
+CURRENT_ENGINE = ContextVar('CURRENT_ENGINE', default=DEFAULT_ENGINE)
+
+
+def changed_fields(fields, obj):
+    '''\
+        Return the dictionary of the values of obj changed within the forked Engine whose field
+        overlay is fields (see Engine.fork), adding an empty one if there's none yet. The entry
+        keeps obj alive, so that its id can't be reused while the forked Engine exists.
+    '''
+    entry = fields.get(id(obj))
+    if (entry is None):
+        entry = fields[id(obj)] = (obj, {})
+    return entry[1]
+
+
+class EngineField:
+    '''\
+        Data descriptor for an attribute of the state of an object which is changed as the game
+        goes on (e.g., the temp_id of a game object, or the cached selection of an effect), so that
+        it can be changed within a forked Engine without being changed for the others; see
+        Engine.fork. The value is kept in the field named storage (a slot, or an entry of the
+        instance __dict__), except for the values assigned within a forked Engine, which are
+        recorded in its field overlay, and read from there.
+        # NOTE #
+        The first assignment, made by __init__, always sets the field, since an object created
+        within a forked Engine is known only to it. Values are replaced rather than changed in
+        place, e.g., the temp_id_history of a game object is replaced by update_temp_id.
+    '''
+    __slots__ = ('storage', 'name')
+
+    def __init__(self, storage):
+        self.storage = storage
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if (obj is None):
+            return self
+        fields = CURRENT_ENGINE.get().fields
+        if (fields is not None):
+            entry = fields.get(id(obj))
+            if (entry is not None) and (self.name in entry[1]):
+                return entry[1][self.name]
+        return getattr(obj, self.storage)
+
+    def __set__(self, obj, value):
+        fields = CURRENT_ENGINE.get().fields
+        if (fields is None) or not(hasattr(obj, self.storage)):
+            setattr(obj, self.storage, value)
+        else:
+            changed_fields(fields, obj)[self.name] = value
+
+
+######################################
+# Logical Clock and Identity Service #
+######################################
+class LogicalClock:
+    '''\
+        Engine-wide monotonic logical clock. Each tick returns a distinct integer which is
+        greater than every value previously returned, so timestamps never tie and the order
+        of events is reproducible from run to run.
+    '''
+    __slots__ = ('now',)
+
+    def __init__(self, start=0):
+        self.now = start
+
+    def tick(self):
+        self.now += 1
+        return self.now
+
+    def fork(self):
+        return LogicalClock(self.now)
+
+
+class IdAllocator:
+    '''\
+        Hand out dense, consecutive integer ids in allocation order, so that they can
+        double as array indices.
+    '''
+    __slots__ = ('next_id',)
+
+    def __init__(self, start=0):
+        self.next_id = start
+
+    def allocate(self):
+        allocated_id = self.next_id
+        self.next_id += 1
+        return allocated_id
+
+    def __len__(self):
+        return self.next_id
+
+    def fork(self):
+        return IdAllocator(self.next_id)
+
+
+CLOCK = engine_service('CLOCK', LogicalClock)
+
+def TIMESTAMP():
+    return CLOCK.tick()
+
+# NOTE #
+# OBJECT_IDS numbers game objects and players; EFFECT_IDS numbers effect generators,
+# effects and their components; TEMP_IDS numbers the temporary ids objects receive
+# whenever they change zones. Each Engine numbers its own.
+OBJECT_IDS = engine_service('OBJECT_IDS', IdAllocator)
+EFFECT_IDS = engine_service('EFFECT_IDS', IdAllocator)
+TEMP_IDS = engine_service('TEMP_IDS', IdAllocator)
+
+# NOTE #
+# Number of previous temp_ids retained in temp_id_history.
+TEMP_ID_HISTORY_LENGTH = 8
+
+
 #############
 # Constants #
 #############
@@ -70,6 +453,12 @@ COPIABLE_ATTRIBUTES = [
 CHARX = COPIABLE_ATTRIBUTES + ['controller']
 
 
+# NOTE #
+# The characteristics whose base values are shared between objects with identical
+# definitions, via a BaseCharacteristics record (see HashConsTable.base_characteristics).
+BASE_CHARX = [attribute for attribute in COPIABLE_ATTRIBUTES if (attribute != 'abilities')]
+
+
 CARD_TYPES = [
     "artifact",
     "creature",
@@ -190,3 +579,464 @@ PLANESWALKER_TYPES = set([
     "Teyo", "Tezzeret", "Tibalt", "Tyvar", "Ugin", "Venser", "Vivien", "Vraska", "Will",
     "Windgrace", "Wrenn", "Xenagos", "Yanggu", "Yanling", "Zariel"
 ])
+
+
+SUPERTYPES = [
+    "basic",
+    "legendary",
+    "ongoing",
+    "snow",
+    "world"
+]
+
+
+COLORS = [
+    "white",
+    "blue",
+    "black",
+    "red",
+    "green",
+    "colorless"
+]
+
+
+# NOTE #
+# Characteristics whose values are sets of words drawn from the vocabularies above.
+TYPESET_CHARX = set(['color', 'card_types', 'subtypes', 'supertypes'])
+
+
+class TypeVocabulary:
+    '''\
+        Intern the words which can appear in the color, card_types, subtypes and supertypes
+        characteristics, assigning each word its own bit so that sets of those words can be
+        represented by integer bitmasks. See also: class TypeSet.
+        Words which aren't part of the predefined vocabularies are interned the first time
+        they are encountered; the vocabulary is shared by every Engine, so this is serialized.
+        # NOTE #
+        Unlike HASH_CONS, the vocabulary is never cleared: the bit of each word is part of
+        every TypeSet containing it, and TypeSets outlive the table entries they came from.
+        It holds one entry per distinct word, which grows with the card definitions loaded
+        rather than with the number of games or objects.
+    '''
+    def __init__(self):
+        self.words = []
+        self.bits = {}
+        self.lock = Lock()
+
+    def intern(self, word):
+        bit = self.bits.get(word)
+        if (bit is None):
+            with self.lock:
+                bit = self.bits.get(word)
+                if (bit is None):
+                    bit = 1 << len(self.words)
+                    self.words.append(word)
+                    self.bits[word] = bit
+        return bit
+
+    def mask(self, words):
+        result = 0
+        for word in words:
+            result |= self.intern(word)
+        return result
+
+    def known_mask(self, words):
+        '''\
+            Return a 2-tuple (mask, complete) where mask encodes the words which have already
+            been interned, and complete is False if at least one of the words hasn't been.
+            Used for comparisons, which shouldn't grow the vocabulary.
+        '''
+        result = 0
+        complete = True
+        for word in words:
+            bit = self.bits.get(word)
+            if (bit is None):
+                complete = False
+            else:
+                result |= bit
+        return result, complete
+
+    def decode(self, mask):
+        words = self.words
+        while mask:
+            lowest_bit = mask & -mask
+            yield words[lowest_bit.bit_length() - 1]
+            mask ^= lowest_bit
+
+
+TYPE_VOCABULARY = TypeVocabulary()
+TYPE_VOCABULARY.mask(chain(CARD_TYPES,
+                           SUPERTYPES,
+                           COLORS,
+                           sorted(CREATURE_TYPES),
+                           sorted(ARTIFACT_TYPES),
+                           sorted(ENCHANTMENT_TYPES),
+                           sorted(BASIC_LAND_TYPES),
+                           sorted(OTHER_LAND_TYPES),
+                           sorted(SPELL_TYPES),
+                           sorted(PLANESWALKER_TYPES)))
+
+
+# NOTE # The number of entries each table of HASH_CONS may hold before it's cleared.
+HASH_CONS_LIMIT = 65536
+
+
+class HashConsTable:
+    '''\
+        Global table of the canonical instances of immutable characteristic values.
+        Equal values are stored once, so that copying a value is sharing a reference to it,
+        and comparing two values is, in the common case, an identity check.
+
+        freeze() returns the canonical immutable equivalent of a value:
+            TypeSet               -> the canonical TypeSet with the same bits
+            str                   -> sys.intern(value)
+            set, frozenset        -> the canonical frozenset with the same elements
+            list, tuple           -> a FrozenList with the same elements
+            anything else         -> value
+        # NOTE #
+        Ability instances carry identity (host_object, timestamp, etc.) and are unhashable,
+        so FrozenLists of them are shared by reference but not interned; only the empty
+        one, EMPTY_ABILITIES, is canonical.
+
+        The table is shared by every Engine, so each of its tables is cleared when it outgrows
+        HASH_CONS_LIMIT, rather than keeping every value ever frozen in a long-lived process.
+        Values handed out before are still valid, and equal to those frozen afterwards, just
+        not identical to them.
+    '''
+    def __init__(self):
+        self.typesets = {}
+        self.frozensets = {}
+        self.records = {}
+
+    def typeset(self, bits):
+        result = self.typesets.get(bits)
+        if (result is None):
+            if (len(self.typesets) >= HASH_CONS_LIMIT):
+                self.typesets.clear()
+            result = object.__new__(TypeSet)
+            object.__setattr__(result, 'bits', bits)
+            object.__setattr__(result, 'hash_value', hash(frozenset(TYPE_VOCABULARY.decode(bits))))
+            result = self.typesets.setdefault(bits, result)
+        return result
+
+    def frozenset(self, elements):
+        key = frozenset(elements)
+        if (len(self.frozensets) >= HASH_CONS_LIMIT):
+            self.frozensets.clear()
+        return self.frozensets.setdefault(key, key)
+
+    def base_characteristics(self, *values):
+        '''\
+            Return the canonical BaseCharacteristics record with the given field values,
+            so that objects with identical definitions, e.g., many copies of the same token,
+            share one record.
+        '''
+        record = BaseCharacteristics._make(self.freeze(TypeSet.for_attribute(attribute, value))
+                                           for attribute, value in zip(BASE_CHARX, values))
+        if (len(self.records) >= HASH_CONS_LIMIT):
+            self.records.clear()
+        try:
+            return self.records.setdefault(record, record)
+        except TypeError:
+            # NOTE # Unhashable field values can't be interned; use a private record.
+            return record
+
+    def freeze(self, value):
+        value_type = type(value)
+        if (value_type is TypeSet) or (value_type is FrozenList):
+            return value
+        if (value_type is str):
+            return sys.intern(value)
+        if (value_type is set) or (value_type is frozenset):
+            return self.frozenset(value)
+        if (value_type is list) or (value_type is tuple):
+            return FrozenList.coerce(value)
+        return value
+
+
+class BaseCharacteristics(namedtuple('BaseCharacteristics', BASE_CHARX)):
+    '''\
+        Immutable record of the base values of the characteristics in BASE_CHARX.
+        Obtain instances via HASH_CONS.base_characteristics() rather than directly.
+        Abilities are not part of the record since ability instances are bound to their
+        host object.
+    '''
+    __slots__ = ()
+
+
+HASH_CONS = HashConsTable()
+
+
+class TypeSet:
+    '''\
+        Immutable set of words from TYPE_VOCABULARY, stored as an integer bitmask.
+        Used as the value of the characteristics in TYPESET_CHARX, so that unions,
+        differences and membership tests are bitwise operations, and copying a value
+        is sharing a reference to it.
+        Instances are hash-consed by HASH_CONS: there is one TypeSet per bitmask.
+
+        Supports the subset of the set API used by the layer system, and compares
+        equal to any set or frozenset containing the same words; e.g.,
+            TypeSet(['artifact', 'creature']) == set(['creature', 'artifact'])
+        so it hashes like the frozenset of its words, which is computed once per bitmask, when
+        the canonical instance is created.
+    '''
+    __slots__ = ('bits', 'hash_value')
+
+    def __new__(cls, words=()):
+        if isinstance(words, TypeSet):
+            return words
+        return HASH_CONS.typeset(TYPE_VOCABULARY.mask(words))
+
+    @classmethod
+    def from_bits(cls, bits):
+        return HASH_CONS.typeset(bits)
+
+    @classmethod
+    def coerce(cls, value):
+        if isinstance(value, cls):
+            return value
+        return cls(value)
+
+    @classmethod
+    def for_attribute(cls, attribute, value):
+        '''\
+            Coerce value to a TypeSet if attribute is one of the characteristics in
+            TYPESET_CHARX, and return it unchanged otherwise.
+        '''
+        if (attribute in TYPESET_CHARX):
+            return cls.coerce(value)
+        return value
+
+    def __contains__(self, word):
+        bit = TYPE_VOCABULARY.bits.get(word)
+        return (bit is not None) and bool(self.bits & bit)
+
+    def __iter__(self):
+        return TYPE_VOCABULARY.decode(self.bits)
+
+    def __len__(self):
+        return self.bits.bit_count()
+
+    def __bool__(self):
+        return bool(self.bits)
+
+    def __hash__(self):
+        return self.hash_value
+
+    def __setattr__(self, name, value):
+        raise AttributeError("TypeSets are immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError("TypeSets are immutable.")
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (TypeSet, (tuple(self),))
+
+    def __repr__(self):
+        return "TypeSet({})".format(list(self))
+
+    ###############
+    # Comparisons #
+    ###############
+    def __eq__(self, other):
+        if (self is other):
+            return True
+        if isinstance(other, TypeSet):
+            return self.bits == other.bits
+        if isinstance(other, (set, frozenset)):
+            mask, complete = TYPE_VOCABULARY.known_mask(other)
+            return complete and (mask == self.bits)
+        return NotImplemented
+
+    def __le__(self, other):
+        if isinstance(other, TypeSet):
+            return not(self.bits & ~other.bits)
+        if isinstance(other, (set, frozenset)):
+            mask, complete = TYPE_VOCABULARY.known_mask(other)
+            return not(self.bits & ~mask)
+        return NotImplemented
+
+    def __lt__(self, other):
+        result = self.__le__(other)
+        if (result is NotImplemented):
+            return result
+        return result and (self != other)
+
+    def __ge__(self, other):
+        if isinstance(other, TypeSet):
+            return not(other.bits & ~self.bits)
+        if isinstance(other, (set, frozenset)):
+            mask, complete = TYPE_VOCABULARY.known_mask(other)
+            return complete and not(mask & ~self.bits)
+        return NotImplemented
+
+    def __gt__(self, other):
+        result = self.__ge__(other)
+        if (result is NotImplemented):
+            return result
+        return result and (self != other)
+
+    ##############
+    # Operations #
+    ##############
+    def _other_bits(self, other):
+        if isinstance(other, TypeSet):
+            return other.bits
+        if isinstance(other, (set, frozenset, list, tuple)):
+            return TYPE_VOCABULARY.mask(other)
+        return None
+
+    def __or__(self, other):
+        other_bits = self._other_bits(other)
+        if (other_bits is None):
+            return NotImplemented
+        return TypeSet.from_bits(self.bits | other_bits)
+
+    def __and__(self, other):
+        other_bits = self._other_bits(other)
+        if (other_bits is None):
+            return NotImplemented
+        return TypeSet.from_bits(self.bits & other_bits)
+
+    def __sub__(self, other):
+        other_bits = self._other_bits(other)
+        if (other_bits is None):
+            return NotImplemented
+        return TypeSet.from_bits(self.bits & ~other_bits)
+
+    def __rsub__(self, other):
+        other_bits = self._other_bits(other)
+        if (other_bits is None):
+            return NotImplemented
+        return TypeSet.from_bits(other_bits & ~self.bits)
+
+    def __xor__(self, other):
+        other_bits = self._other_bits(other)
+        if (other_bits is None):
+            return NotImplemented
+        return TypeSet.from_bits(self.bits ^ other_bits)
+
+    __ror__ = __or__
+    __rand__ = __and__
+    __rxor__ = __xor__
+
+    union = __or__
+    intersection = __and__
+    difference = __sub__
+    symmetric_difference = __xor__
+    issubset = __le__
+    issuperset = __ge__
+
+    def isdisjoint(self, other):
+        return not(self.bits & self._other_bits(other))
+
+
+EMPTY_TYPESET = TypeSet()
+ALL_CREATURE_TYPES = TypeSet(CREATURE_TYPES)
+ALL_LAND_TYPES = TypeSet(LAND_TYPES)
+
+
+class FrozenList(tuple):
+    '''\
+        Immutable sequence used as the value of list-valued characteristics, i.e., abilities.
+        Compares equal to a list containing the same elements, so that it can stand in for
+        the lists it replaces; e.g.,
+            FrozenList([]) == []
+        Modifications build a new list from it and assign the result, e.g.,
+            list(obj.abilities) + [new_ability]
+    '''
+    __slots__ = ()
+
+    @classmethod
+    def coerce(cls, value):
+        if isinstance(value, cls):
+            return value
+        if (value is None) or (len(value) == 0):
+            return EMPTY_ABILITIES
+        return tuple.__new__(cls, value)
+
+    def __eq__(self, other):
+        if (self is other):
+            return True
+        if isinstance(other, list):
+            other = tuple(other)
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if (result is NotImplemented):
+            return result
+        return not(result)
+
+    __hash__ = tuple.__hash__
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+EMPTY_ABILITIES = tuple.__new__(FrozenList, ())
+
+
+# NOTE # Versions are drawn from one counter shared by every VersionedList, so that no two states
+# of any two lists have the same version.
+LIST_VERSIONS = count()
+
+
+class VersionedList(list):
+    '''\
+        List which draws a new version from LIST_VERSIONS whenever it's changed in place, so that
+        whether its contents have changed since they were last seen is told in O(1), by comparing
+        versions, rather than by comparing its contents. Used for GAME's lists of objects, which
+        are the sources of selections; see VersionedListAttribute.
+    '''
+    __slots__ = ('version',)
+
+    def __init__(self, iterable=()):
+        super().__init__(iterable)
+        self.version = next(LIST_VERSIONS)
+
+
+def versioned(method):
+    def mutator(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self.version = next(LIST_VERSIONS)
+        return result
+    mutator.__name__ = method.__name__
+    return mutator
+
+
+for method_name in ('append', 'extend', 'insert', 'remove', 'pop', 'clear', 'sort', 'reverse',
+                    '__setitem__', '__delitem__', '__iadd__', '__imul__'):
+    setattr(VersionedList, method_name, versioned(getattr(list, method_name)))
+
+
+class VersionedListAttribute:
+    '''\
+        Data descriptor for an attribute holding a VersionedList; lists assigned to it are
+        copied into a VersionedList.
+        # NOTE #
+        It has no __get__, so reads find the value in the instance __dict__ directly, at the
+        cost of an ordinary attribute lookup.
+    '''
+    __slots__ = ('name',)
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __set__(self, obj, value):
+        if not(isinstance(value, VersionedList)):
+            value = VersionedList(value)
+        obj.__dict__[self.name] = value
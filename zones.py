@@ -1,6 +1,10 @@
 from modifiables import *
 
 
+# NOTE # Stands in for the entry of a Zone which hasn't been changed within a forked Engine.
+NOT_CHANGED = (None, None)
+
+
 class Zone(list):
     '''\
         Attributes to consider:
@@ -11,6 +15,10 @@ class Zone(list):
 
         A Zone is a subclass of list with additional properties supporting characterization,
         and additional methods for altering the data of elements added / removed.
+
+        Within a forked Engine (see Engine.fork), the methods below change a copy of the contents
+        of the Zone, recorded in the field overlay of the Engine, which contents returns; the
+        Zone itself, which is shared with the Engine it was forked from, is left as it was.
     '''
     def __init__(self, **kwargs):
         self._player = None
@@ -30,12 +38,39 @@ class Zone(list):
     def player(self, value):
         self._player = value
 
+    @property
+    def contents(self):
+        ''' The objects in this Zone, as seen from the current Engine. '''
+        fields = CURRENT_ENGINE.get().fields
+        if (fields is not None):
+            entry = fields.get(id(self))
+            if (entry is not None) and ('contents' in entry[1]):
+                return entry[1]['contents'][1]
+        return self
+
+    def changed_contents(self):
+        '''\
+            Return the contents to change: this Zone, or, within a forked Engine, the copy of
+            its contents recorded in the field overlay, which is made the first time it's changed
+            within that Engine. The copy is recorded with the Engine it was made in, since the
+            field overlay of an Engine forked from a forked Engine starts out as a copy of its own.
+        '''
+        engine = CURRENT_ENGINE.get()
+        if (engine.fields is None):
+            return self
+        contents = self.contents
+        changed_values = changed_fields(engine.fields, self)
+        if not(changed_values.get('contents', NOT_CHANGED)[0] is engine):
+            contents = list(contents)
+            changed_values['contents'] = (engine, contents)
+        return contents
+
     @property
     def is_empty(self):
-        return not(bool(self.__len__()))
+        return not(bool(len(self.contents)))
 
     def imprint_all(self):
-        for object in self:
+        for object in self.contents:
             self.imprint_object(object)
 
     def imprint_object(self, object_to_imprint):
@@ -66,35 +101,38 @@ class Zone(list):
         pass
 
     def shuffle(self):
-        np.random.shuffle(self)
+        np.random.shuffle(self.changed_contents())
 
     def add_object(self, object, top=False):
-        if not(object in self):
+        contents = self.changed_contents()
+        if not(object in contents):
             if not(top):
-                self.append(object)
+                contents.append(object)
             else:
-                self.reverse()
-                self.append(object)
-                self.reverse()
+                contents.reverse()
+                contents.append(object)
+                contents.reverse()
             self.imprint_object(object)
         else:
             raise ValueError("{} tried to add an object it already contained: {}".format(self.nickname, object))
 
 
     def remove_object(self, top=False):
+        contents = self.changed_contents()
         if not(top):
-            removed_object = self.pop()
+            removed_object = contents.pop()
         else:
-            self.reverse()
-            removed_object = self.pop()
-            self.reverse()
+            contents.reverse()
+            removed_object = contents.pop()
+            contents.reverse()
         self.remove_imprint(removed_object)
         return removed_object
 
 
     def remove_specific_object_(self, object):
-        if (object in self):
-            removed_object = self.pop(self.index(object))
+        contents = self.changed_contents()
+        if (object in contents):
+            removed_object = contents.pop(contents.index(object))
             self.remove_imprint(removed_object)
             return removed_object
         raise ValueError("{} tried to remove an object it didn't contain: {}".format(self.nickname, object))
@@ -111,7 +149,7 @@ class Zone(list):
 
     def remove_n_objects(self, n_objects, top=False):
         removed_objects = []
-        n_objects = min(n_objects, self.__len__())
+        n_objects = min(n_objects, len(self.contents))
 
         if not(top):
             for i in range(n_objects):
@@ -133,13 +171,14 @@ class Zone(list):
 
     def list_n_ids(self, n_ids, top=False):
         ''' Return a list of the first n objects in the top or bottom of this Zone. '''
-        n_ids = min(n_ids, self.__len__())
+        contents = self.contents
+        n_ids = min(n_ids, len(contents))
         result = []
         if n_ids:
             if not(top):
-                result = [id(object) for object in self[n_ids:]]
+                result = [id(object) for object in contents[n_ids:]]
             else:
-                result = [id(object) for object in self[:n_ids]]
+                result = [id(object) for object in contents[:n_ids]]
 
         return list(result)
 
@@ -257,7 +296,7 @@ class ZoneHandler:
 
     def sync_zones_to_objects(self):
         for zone in self.zones:
-            for object in zone:
+            for object in zone.contents:
                 setattr(object, 'current_zone', zone)
 
 
@@ -370,7 +409,7 @@ class ZoneHandler:
         ''' For shuffling >=1 Zone into a single Zone. '''
         source_objects = []
         for zone in src_zones:
-            zone_size = zone.__len__()
+            zone_size = len(zone.contents)
             if zone_size:
                 removed_objects = zone.remove_n_objects(zone_size)
                 source_objects.extend(removed_objects)
@@ -387,7 +426,7 @@ class ZoneHandler:
     def select_by_zone_name_and_subset_size(self, zone_name, size, top=True):
         result = []
         ref_zone = self.filter_by_zone_names([zone_name])[0]
-        ref_zone_size = len(ref_zone)
+        ref_zone_size = len(ref_zone.contents)
         subset_size = min(ref_zone_size, size)
 
         if subset_size:
@@ -397,4 +436,4 @@ class ZoneHandler:
         return result
 
 
-ZH = ZoneHandler()
+ZH = engine_service('ZH', ZoneHandler)